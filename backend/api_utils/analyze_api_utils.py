@@ -3,23 +3,12 @@ Module to specify backend logic for the services for analyze API.
 """
 
 import requests
-from core_langchain.base_chains.company_parser_chains import (
-    CompanyInfoParserChain,
-)
-from core_langchain.base_chains.jd_chains import JobDescriptionParserChain
-from core_langchain.factory.chains_factory import ChainsFactory
-from db_connectors.postgres.postgres_client import (
-    PGVectorClient,
-    PostgresClient,
-)
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import WebBaseLoader
-from langchain_openai import OpenAIEmbeddings
-
-EMBEDDING_FUNCTION = OpenAIEmbeddings()
-POSTGRES_CLIENT = PostgresClient()
-PGVECTOR_JD = PGVectorClient(EMBEDDING_FUNCTION, "job_descriptions")
-PGVECTOR_COMPANY_INFO = PGVectorClient(EMBEDDING_FUNCTION, "company_info")
+from config import ANALYSIS_DEADLINE_SECONDS
+from core_langchain.factory.chains_registry import CHAINS_REGISTRY
+from fastapi.concurrency import run_in_threadpool
+from general_utils.checkpoint_utils import checkpoint_run
+from general_utils.deadline_utils import deadline_budget
+from general_utils.usage_accounting_utils import usage_context
 
 
 def filter_accessible_urls(urls):
@@ -34,7 +23,7 @@ def filter_accessible_urls(urls):
     return accessible_urls, non_accessible_urls
 
 
-def get_existing_urls_data(urls: list | set | tuple | str):
+def get_existing_urls_data(clients, urls: list | set | tuple | str):
     query = """
         SELECT
             DISTINCT jsonb_array_elements_text(lpe.cmetadata->'urls') AS url,
@@ -55,7 +44,7 @@ def get_existing_urls_data(urls: list | set | tuple | str):
     ):
         urls = tuple(urls)
 
-    result = POSTGRES_CLIENT.query_db(query, {"urls": urls})
+    result = clients.postgres_client.query_db(query, {"urls": urls})
 
     existing_urls_data = (
         {
@@ -70,6 +59,9 @@ def get_existing_urls_data(urls: list | set | tuple | str):
 
 
 def split_text_into_chunks(text):
+    # Imported on first use, so starting a worker does not load it
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
     splitter = RecursiveCharacterTextSplitter(
         chunk_size=500, chunk_overlap=100
     )
@@ -80,10 +72,10 @@ def split_text_into_chunks(text):
 
 
 def save_embeddings_to_database(
-    result: dict, urls: list, text_chunks: list, url_type
+    clients, result: dict, urls: list, text_chunks: list, url_type
 ):
     if url_type == "jd":
-        PGVECTOR_JD.add_texts(
+        clients.pgvector_jd.add_texts(
             text_chunks,
             metadatas=[
                 {
@@ -96,7 +88,7 @@ def save_embeddings_to_database(
             * len(text_chunks),
         )
     elif url_type == "company":
-        PGVECTOR_COMPANY_INFO.add_texts(
+        clients.pgvector_company_info.add_texts(
             text_chunks,
             metadatas=[
                 {
@@ -111,33 +103,41 @@ def save_embeddings_to_database(
 class AnalyzeApiUtils:
 
     @staticmethod
-    def extract_urls(jd_urls, url_type):
+    async def extract_urls(clients, jd_urls, url_type):
         unique_urls = set(jd_urls)
 
         # Existing URLs data
-        existing_urls_data = get_existing_urls_data(unique_urls)
+        existing_urls_data = await run_in_threadpool(
+            get_existing_urls_data, clients, unique_urls
+        )
 
         # New URLs
         new_urls = unique_urls - existing_urls_data.keys()
 
         if new_urls:
-            accessible_urls, non_accessible_urls = filter_accessible_urls(
-                new_urls
+            accessible_urls, non_accessible_urls = await run_in_threadpool(
+                filter_accessible_urls, new_urls
             )
 
+            # Imported on first use, so starting a worker does not load it
+            from langchain_community.document_loaders import WebBaseLoader
+
             loader = WebBaseLoader(web_paths=accessible_urls)
 
             combined_text_from_urls = "".join(
-                [doc.page_content for doc in loader.load()]
+                [
+                    doc.page_content
+                    for doc in await run_in_threadpool(loader.load)
+                ]
             )
 
             # Run chains and save embeddings to database
             if url_type == "jd":
-                jd_chain = JobDescriptionParserChain(
-                    model_name="gpt-3.5-turbo", temperature=0.3
+                jd_chain = CHAINS_REGISTRY.get_base_chain(
+                    "job_description_parser"
                 )
 
-                chain_result = jd_chain.run_chain(
+                chain_result = await jd_chain.arun_chain(
                     {
                         "job_description": combined_text_from_urls,
                     }
@@ -147,16 +147,21 @@ class AnalyzeApiUtils:
                     chain_result["job_description"]
                 )
 
-                save_embeddings_to_database(
-                    chain_result, accessible_urls, jd_chunks, "jd"
+                await run_in_threadpool(
+                    save_embeddings_to_database,
+                    clients,
+                    chain_result,
+                    accessible_urls,
+                    jd_chunks,
+                    "jd",
                 )
 
             elif url_type == "company":
-                company_info_chain = CompanyInfoParserChain(
-                    model_name="gpt-3.5-turbo", temperature=0.3
+                company_info_chain = CHAINS_REGISTRY.get_base_chain(
+                    "company_info_parser"
                 )
 
-                chain_result = company_info_chain.run_chain(
+                chain_result = await company_info_chain.arun_chain(
                     {
                         "raw_company_website_text": combined_text_from_urls,
                     }
@@ -166,7 +171,9 @@ class AnalyzeApiUtils:
                     chain_result["summarized_company_values"]
                 )
 
-                save_embeddings_to_database(
+                await run_in_threadpool(
+                    save_embeddings_to_database,
+                    clients,
                     chain_result,
                     accessible_urls,
                     company_info_chunks,
@@ -193,15 +200,18 @@ class AnalyzeApiUtils:
             }
 
     @staticmethod
-    def analyze(username, cv_object_key, company_name, job_title):
+    async def analyze(
+        clients,
+        user,
+        cv_object_key,
+        company_name,
+        job_title,
+        force_refresh=False,
+    ):
         cv_file_hash = cv_object_key.split("/")[0]
 
-        chains_factory = ChainsFactory(
-            model_name="gpt-3.5-turbo", temperature=0.3
-        )
-
-        complete_cv_recommendations_chain = (
-            chains_factory.create_complete_cv_recommendations_chain()
+        complete_cv_recommendations_chain = CHAINS_REGISTRY.get_complete_chain(
+            "complete_cv_recommendations"
         )
 
         input_data = {
@@ -211,19 +221,26 @@ class AnalyzeApiUtils:
         }
 
         # try:
-        complete_cv_recommendations_result = (
-            complete_cv_recommendations_chain.invoke(input_data)
-        )
+        # Completed steps are checkpointed, so a retry of a failed or
+        # cancelled analysis resumes from the last completed step
+        with deadline_budget(ANALYSIS_DEADLINE_SECONDS), checkpoint_run(
+            force_refresh
+        ), usage_context(username=user["username"]):
+            complete_cv_recommendations_result = (
+                await complete_cv_recommendations_chain.ainvoke(input_data)
+            )
         # except Exception as e:
         #     return None
 
-        job_id = POSTGRES_CLIENT.create_cv_analysis_job(
+        created_job = await run_in_threadpool(
+            clients.postgres_client.create_cv_analysis_job,
             complete_cv_recommendations_result,
-            username,
+            user["id"],
             cv_file_hash,
             company_name,
             job_title,
-        ).get("job_id", None)
+        )
+        job_id = created_job.get("job_id", None)
 
         return {
             "message": "CV recommendations generated successfully!",
@@ -231,9 +248,15 @@ class AnalyzeApiUtils:
         }
 
     @staticmethod
-    def get_cv_analysis_jobs(username):
-        return POSTGRES_CLIENT.get_cv_analysis_jobs(username)
+    def get_cv_analysis_jobs(clients, user):
+        return clients.postgres_client.get_cv_analysis_jobs(user["id"])
+
+    @staticmethod
+    def get_cv_analysis_job_summaries(clients, user, limit, before_id, fields):
+        return clients.postgres_client.get_cv_analysis_job_summaries(
+            user["id"], limit, before_id, fields
+        )
 
     @staticmethod
-    def get_cv_analysis_job_by_id(job_id):
-        return POSTGRES_CLIENT.get_cv_analysis_job_by_id(job_id)
+    def get_cv_analysis_job_by_id(clients, job_id):
+        return clients.postgres_client.get_cv_analysis_job_by_id(job_id)
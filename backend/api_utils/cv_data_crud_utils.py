@@ -4,11 +4,31 @@ Module to specify backend logic for the services for CV data CRUD endpoints for
 
 from pathlib import Path
 
-from db_connectors.postgres.postgres_client import PostgresClient
+from general_utils.json_utils import rows_to_dicts
 from general_utils.logging import get_logger
-from general_utils.utils import serialize_for_json
-
-POSTGRES_CLIENT = PostgresClient()
+from general_utils.utils import build_select_list
+
+# Fields selectable on the CV list endpoint, raw_text and extracted_text are
+# only returned by the detail endpoint
+CV_DATA_SUMMARY_COLUMNS = {
+    "id": "cd.id",
+    "file_name": "cd.file_name",
+    "file_hash": "cd.file_hash",
+    "contact": "cd.contact",
+    "certifications": "cd.certifications",
+    "skills": "cd.skills",
+    "summary": "cd.summary",
+    "languages": "cd.languages",
+    "inserted_at": "cd.inserted_at",
+    "updated_at": "cd.updated_at",
+}
+CV_DATA_SUMMARY_DEFAULT_FIELDS = [
+    "id",
+    "file_name",
+    "file_hash",
+    "inserted_at",
+    "updated_at",
+]
 
 file_logger = get_logger(
     "file_" + __name__,
@@ -24,7 +44,7 @@ stream_logger = get_logger(
 
 class CVDataCrudApiUtils:
     @staticmethod
-    def get_cv_data_by_username(username: str) -> list[dict] | None:
+    def get_cv_data_by_username(clients, username: str) -> list[dict] | None:
         try:
             query = """
                 SELECT cd.*, u.username, u.email
@@ -32,12 +52,14 @@ class CVDataCrudApiUtils:
                 WHERE u.username = :username;
             """
 
-            result = POSTGRES_CLIENT.query_db(query, {"username": username})
+            result = clients.postgres_client.query_db(
+                query, {"username": username}
+            )
 
             if result:
                 rows = result.fetchall()
                 if rows:
-                    return [serialize_for_json(row._asdict()) for row in rows]
+                    return rows_to_dicts(rows)
             return None
 
         except Exception as e:
@@ -50,18 +72,74 @@ class CVDataCrudApiUtils:
             return None
 
     @staticmethod
-    def get_cv_data_by_file_hash(file_hash: str) -> dict | None:
+    def get_cv_data_summaries(
+        clients,
+        user_id: int,
+        limit: int = 20,
+        before_id: int | None = None,
+        fields: list[str] | None = None,
+    ) -> dict | None:
+        select_list = build_select_list(
+            fields, CV_DATA_SUMMARY_COLUMNS, CV_DATA_SUMMARY_DEFAULT_FIELDS
+        )
+
         try:
+            # cd.id is always selected to build the next page cursor
+            query = f"""
+                SELECT cd.id AS _cursor_id, {select_list}
+                FROM cv_data cd
+                WHERE
+                    cd.user_id = :user_id
+                    AND (
+                        CAST(:before_id AS INTEGER) IS NULL
+                        OR cd.id < :before_id
+                    )
+                ORDER BY cd.id DESC
+                LIMIT :limit
+            """
+
+            result = clients.postgres_client.query_db(
+                query,
+                {"user_id": user_id, "before_id": before_id, "limit": limit},
+            )
+
+            rows = rows_to_dicts(result.fetchall()) if result else []
+            cursor_ids = [row.pop("_cursor_id") for row in rows]
+
+            return {
+                "items": rows,
+                "next_before_id": (
+                    cursor_ids[-1] if len(cursor_ids) == limit else None
+                ),
+            }
+
+        except Exception as e:
+            file_logger.error(f"Database error getting CV data summaries: {e}")
+            stream_logger.error(
+                f"Database error getting CV data summaries: {e}"
+            )
+            return None
+
+    @staticmethod
+    def get_cv_data_by_file_hash(
+        clients, file_hash: str, user_id: int
+    ) -> dict | None:
+        try:
+            # Every user who uploaded the same file has their own row
             query = """
-                    SELECT * FROM cv_data WHERE file_hash = :file_hash
+                    SELECT *
+                    FROM cv_data
+                    WHERE file_hash = :file_hash AND user_id = :user_id
                 """
 
-            result = POSTGRES_CLIENT.query_db(query, {"file_hash": file_hash})
+            result = clients.postgres_client.query_db(
+                query, {"file_hash": file_hash, "user_id": user_id}
+            )
 
             if result:
                 row = result.fetchone()
                 if row:
-                    return serialize_for_json(row._asdict())
+                    return row._asdict()
 
             return None
 
@@ -0,0 +1,12 @@
+"""
+Module to specify backend logic for the services for dashboard API.
+"""
+
+
+class DashboardApiUtils:
+
+    @staticmethod
+    def get_dashboard_summary(clients, user):
+        # Not cached here, the frontend caches summaries in a store shared
+        # by its workers and drops them when a user's data changes
+        return clients.postgres_client.get_dashboard_summary(user["id"])
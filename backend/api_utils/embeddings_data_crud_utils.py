@@ -4,12 +4,9 @@ Embeddings data CRUD endpoints for the Job Research Assistant backend.
 
 from pathlib import Path
 
-from db_connectors.postgres.postgres_client import PostgresClient
 from general_utils.logging import get_logger
 from general_utils.utils import get_matching_strings
 
-POSTGRES_CLIENT = PostgresClient()
-
 file_logger = get_logger(
     "file_" + __name__,
     write_to_file=True,
@@ -24,7 +21,7 @@ stream_logger = get_logger(
 class EmbeddingsDataCrudApiUtils:
 
     @staticmethod
-    def get_company_names(company_name: str | None) -> dict | None:
+    def get_company_names(clients, company_name: str | None) -> dict | None:
         # Query to get all relevant company names from the database
         query = f"""
             SELECT DISTINCT lpe.cmetadata->>'company_name' AS company_name
@@ -33,7 +30,7 @@ class EmbeddingsDataCrudApiUtils:
         """
 
         try:
-            result = POSTGRES_CLIENT.query_db(query)
+            result = clients.postgres_client.query_db(query)
 
         except Exception as e:
             file_logger.error(f"Database error getting company names: {e}")
@@ -69,6 +66,7 @@ class EmbeddingsDataCrudApiUtils:
 
     @staticmethod
     def get_job_titles(
+        clients,
         company_name: str | None,
     ) -> dict | None:
         # Query to get all relevant job titles from the database
@@ -86,11 +84,11 @@ class EmbeddingsDataCrudApiUtils:
                     + f" AND lpe.cmetadata->>'company_name' = :company_name"
                 )
 
-                result = POSTGRES_CLIENT.query_db(
+                result = clients.postgres_client.query_db(
                     query, {"company_name": company_name}
                 )
             else:
-                result = POSTGRES_CLIENT.query_db(query)
+                result = clients.postgres_client.query_db(query)
 
         except Exception as e:
             file_logger.error(f"Database error getting job titles: {e}")
@@ -4,9 +4,15 @@ Module to specify backend logic for the services for interviews preparation for
 
 from pathlib import Path
 
-from core_langchain.factory.chains_factory import ChainsFactory
-from db_connectors.postgres.postgres_client import PostgresClient
+from config import INTERVIEW_PREP_DEADLINE_SECONDS
+from core_langchain.factory.chains_registry import CHAINS_REGISTRY
+from general_utils.deadline_utils import (
+    DeadlineExceededError,
+    deadline_budget,
+)
 from general_utils.logging import get_logger
+from general_utils.rate_limit_utils import ModelRateLimitError
+from general_utils.usage_accounting_utils import usage_context
 
 file_logger = get_logger(
     "file_" + __name__,
@@ -18,16 +24,18 @@ stream_logger = get_logger(
     "stream_" + __name__,
 )
 
-POSTGRES_CLIENT = PostgresClient()
-
 
 class InterviewsPrepApiUtils:
     @staticmethod
-    def generate_interview_preparation_materials(company_name, job_title):
+    async def generate_interview_preparation_materials(
+        user, company_name, job_title
+    ):
 
-        complete_interview_preparation_chain = ChainsFactory(
-            model_name="gpt-3.5-turbo", temperature=0.3
-        ).create_complete_interview_preparation_chain()
+        complete_interview_preparation_chain = (
+            CHAINS_REGISTRY.get_complete_chain(
+                "complete_interview_preparation"
+            )
+        )
 
         input_data = {
             "company_name": company_name,
@@ -35,9 +43,17 @@ class InterviewsPrepApiUtils:
         }
 
         try:
-            complete_interview_preparation_result = (
-                complete_interview_preparation_chain.invoke(input_data)
-            )
+            with deadline_budget(
+                INTERVIEW_PREP_DEADLINE_SECONDS
+            ), usage_context(username=user["username"]):
+                complete_interview_preparation_result = (
+                    await complete_interview_preparation_chain.ainvoke(
+                        input_data
+                    )
+                )
+        except (DeadlineExceededError, ModelRateLimitError):
+            # Mapped to 504 and 503 responses by the app
+            raise
         except Exception as e:
             message = f"Error generating interview preparation materials: {e}"
             file_logger.error(message)
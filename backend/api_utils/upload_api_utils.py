@@ -6,10 +6,10 @@ import hashlib
 import io
 from pathlib import Path
 
-from core_langchain.base_chains.cv_chains import CVParserChain
-from db_connectors.minio.minio_client import MinioClient
-from db_connectors.postgres.postgres_client import PostgresClient
+from core_langchain.factory.chains_registry import CHAINS_REGISTRY
+from fastapi.concurrency import run_in_threadpool
 from general_utils.logging import get_logger
+from general_utils.usage_accounting_utils import usage_context
 from minio.error import S3Error
 from pydantic_models.postgres_be_models import CVData, User
 
@@ -24,76 +24,162 @@ stream_logger = get_logger(
     "stream_" + __name__,
 )
 
-MINIO_CLIENT = MinioClient()
-POSTGRES_CLIENT = PostgresClient()
 BUCKET_NAME = "jobsearch-original-files"
 
 
 class UploadApiUtils:
 
     @staticmethod
-    def upload_file(file, file_content, username):
-        # Check if file already exists in MinIO and upload if not
-        file_bytes = io.BytesIO(file_content)
-        file_hash = hashlib.sha256(file_content).hexdigest()
-        object_key = f"{file_hash}/{file.filename}"
+    def check_file_hash(clients, file_hash, username):
+        # Only the user's own CVs are reported, so a hash never reveals
+        # whether another user holds the same document
+        existing_cv = clients.postgres_client.get_cv_by_file_hash(
+            file_hash, username
+        )
 
-        try:
-            MINIO_CLIENT.minio_client.stat_object(BUCKET_NAME, object_key)
+        if not existing_cv["exists_for_user"]:
+            return {
+                "exists": False,
+                "object_key": None,
+                "message": "File not found!",
+            }
+
+        return {
+            "exists": True,
+            "object_key": existing_cv["object_key"],
+            "message": "File already exists!",
+        }
+
+    @staticmethod
+    def upload_file_by_hash(clients, file_hash, username):
+        # Without the file bytes, only content the user already uploaded
+        # is registered again, other users' CVs need the bytes
+        existing_cv = clients.postgres_client.get_cv_by_file_hash(
+            file_hash, username
+        )
+
+        if not existing_cv["exists_for_user"]:
+            return None
+
+        return {
+            "object_key": existing_cv["object_key"],
+            "message": "File already exists!",
+        }
 
+    @staticmethod
+    def _register_existing_upload(clients, file_hash, filename, username):
+        # Called with a hash computed from the uploaded bytes, so parsed
+        # CV data is only shared with users holding the same document
+        existing_cv = clients.postgres_client.get_cv_by_file_hash(
+            file_hash, username
+        )
+
+        if not existing_cv["exists"]:
+            return None
+
+        if existing_cv["exists_for_user"]:
             return {
-                "object_key": object_key,
+                "object_key": existing_cv["object_key"],
                 "message": "File already exists!",
             }
 
-        except S3Error as e:
-            if e.code == "NoSuchKey":
-                pass
-            else:
-                error_message = f"Error uploading file to MinIO: {str(e)}"
+        copied_cv = clients.postgres_client.copy_cv_data_to_user(
+            file_hash, username, filename
+        )
 
-                file_logger.error(error_message)
-                stream_logger.error(error_message)
+        if not copied_cv.get("object_key"):
+            return None
 
-        if not MINIO_CLIENT.minio_client.bucket_exists(BUCKET_NAME):
-            MINIO_CLIENT.minio_client.make_bucket(BUCKET_NAME)
-            stream_logger.info(f"Bucket '{BUCKET_NAME}' created.")
+        return copied_cv
 
-        try:
-            MINIO_CLIENT.minio_client.put_object(
-                bucket_name=BUCKET_NAME,
-                object_name=object_key,
-                data=file_bytes,
-                length=len(file_content),
-                content_type=file.content_type,
+    @staticmethod
+    async def upload_file(clients, file, file_content, username):
+        file_hash = hashlib.sha256(file_content).hexdigest()
+        object_key = f"{file_hash}/{file.filename}"
+
+        # Identical content is deduplicated on the hash regardless of the
+        # filename, and parsed CV data is reused across users
+        existing_upload = await run_in_threadpool(
+            UploadApiUtils._register_existing_upload,
+            clients,
+            file_hash,
+            file.filename,
+            username,
+        )
+
+        if existing_upload:
+            return existing_upload
+
+        raw_text, cv_file_path = await run_in_threadpool(
+            UploadApiUtils._store_and_load_file_object,
+            clients,
+            file,
+            file_content,
+            object_key,
+        )
+
+        # Run CV extraction chain and ingest into database
+        cv_parser_chain = CHAINS_REGISTRY.get_base_chain("cv_parser")
+
+        with usage_context(username=username):
+            cv_parser_result = await cv_parser_chain.arun_chain(
+                {"raw_cv_text": raw_text}
             )
 
-            stream_logger.info(f"File '{file.filename}' uploaded to MinIO.")
+        await run_in_threadpool(
+            UploadApiUtils._save_cv_data,
+            clients,
+            username,
+            raw_text,
+            cv_file_path,
+            cv_parser_result,
+        )
+
+        return {
+            "object_key": object_key,
+            "message": "Upload CV to MinIO and ingest metadata to database successfully!",
+        }
+
+    @staticmethod
+    def _store_and_load_file_object(clients, file, file_content, object_key):
+        file_bytes = io.BytesIO(file_content)
+
+        # Check if file already exists in MinIO and upload if not
+        try:
+            clients.minio_client.minio_client.stat_object(
+                BUCKET_NAME, object_key
+            )
+            object_exists = True
 
         except S3Error as e:
-            error_message = f"Error uploading file to MinIO: {str(e)}"
+            object_exists = False
 
-            file_logger.error(error_message)
-            stream_logger.error(error_message)
+            if e.code != "NoSuchKey":
+                error_message = f"Error uploading file to MinIO: {str(e)}"
 
-        # Run CV extraction chain and ingest into database
-        raw_object = MINIO_CLIENT.get_object_using_langchain_s3_loader(
+                file_logger.error(error_message)
+                stream_logger.error(error_message)
+
+        if not object_exists:
+            UploadApiUtils._put_file_object(
+                clients, file, file_bytes, len(file_content), object_key
+            )
+
+        raw_object = clients.minio_client.get_object_using_langchain_s3_loader(
             BUCKET_NAME, object_key
         )
 
-        raw_text = raw_object[0].page_content
-        cv_file_path = raw_object[0].metadata["source"]
+        return raw_object[0].page_content, raw_object[0].metadata["source"]
+
+    @staticmethod
+    def _save_cv_data(
+        clients, username, raw_text, cv_file_path, cv_parser_result
+    ):
         cv_file_name = cv_file_path.split("/")[-1]
         cv_file_hash = cv_file_path.split("/")[-2]
 
-        cv_parser_chain = CVParserChain(
-            model_name="gpt-3.5-turbo", temperature=0.3
-        )
-
-        cv_parser_result = cv_parser_chain.run_chain({"raw_cv_text": raw_text})
-
         # Create a new session using context management
-        with PostgresClient()._get_connection_context() as session:
+        with clients.postgres_client._get_connection_context() as session:
             # Assuming you have already created a user
             user = session.query(User).filter_by(username=username).first()
 
@@ -121,7 +207,25 @@ class UploadApiUtils:
             # Commit the session
             session.commit()
 
-        return {
-            "object_key": object_key,
-            "message": "Upload CV to MinIO and ingest metadata to database successfully!",
-        }
+    @staticmethod
+    def _put_file_object(clients, file, file_bytes, length, object_key):
+        if not clients.minio_client.minio_client.bucket_exists(BUCKET_NAME):
+            clients.minio_client.minio_client.make_bucket(BUCKET_NAME)
+            stream_logger.info(f"Bucket '{BUCKET_NAME}' created.")
+
+        try:
+            clients.minio_client.minio_client.put_object(
+                bucket_name=BUCKET_NAME,
+                object_name=object_key,
+                data=file_bytes,
+                length=length,
+                content_type=file.content_type,
+            )
+
+            stream_logger.info(f"File '{file.filename}' uploaded to MinIO.")
+
+        except S3Error as e:
+            error_message = f"Error uploading file to MinIO: {str(e)}"
+
+            file_logger.error(error_message)
+            stream_logger.error(error_message)
@@ -0,0 +1,24 @@
+"""
+Module to specify backend logic for the services for LLM usage API.
+"""
+
+from fastapi.concurrency import run_in_threadpool
+from general_utils.usage_accounting_utils import LLM_USAGE_RECORDER
+
+
+class UsageApiUtils:
+
+    @staticmethod
+    async def get_llm_usage_summary(
+        clients, user, start_date, end_date, group_by
+    ):
+        # Buffered records are written first, so the summary is up to date
+        await run_in_threadpool(LLM_USAGE_RECORDER.flush)
+
+        return await run_in_threadpool(
+            clients.postgres_client.get_llm_usage_summary,
+            user["username"],
+            start_date,
+            end_date,
+            group_by,
+        )
@@ -4,10 +4,13 @@ Module to specify backend logic for the services for users CRUD endpoints for jo
 
 from pathlib import Path
 
-from db_connectors.postgres.postgres_client import PostgresClient
+from fastapi.concurrency import run_in_threadpool
+from general_utils.auth_utils import invalidate_cached_user
 from general_utils.logging import get_logger
-
-POSTGRES_CLIENT = PostgresClient()
+from general_utils.password_utils import (
+    hash_password_async,
+    verify_password_async,
+)
 
 file_logger = get_logger(
     "file_" + __name__,
@@ -22,13 +25,13 @@ stream_logger = get_logger(
 
 class UsersCrudApiUtils:
     @staticmethod
-    def get_users() -> list[dict] | None:
+    def get_users(clients) -> list[dict] | None:
         try:
             query = """
                 SELECT id, username, email
                 FROM users
             """
-            result = POSTGRES_CLIENT.query_db(query)
+            result = clients.postgres_client.query_db(query)
 
             if result:
                 rows = result.fetchall()
@@ -42,17 +45,26 @@ class UsersCrudApiUtils:
             return None
 
     @staticmethod
-    def create_user(user: dict) -> dict | None:
+    async def create_user(clients, user: dict) -> dict | None:
         try:
             reg_username_input = user["username"]
             reg_email_input = user["email"]
             reg_password_input = user["password"].get_secret_value()
 
-            user_data = POSTGRES_CLIENT.create_user(
-                reg_username_input, reg_email_input, reg_password_input
+            hashed_password = await hash_password_async(reg_password_input)
+
+            user_data = await run_in_threadpool(
+                clients.postgres_client.create_user,
+                reg_username_input,
+                reg_email_input,
+                hashed_password,
             )
 
             if user_data.get("message") == "User created successfully!":
+                # A username reused after its row was removed must not
+                # resolve to the old row still cached by another request
+                invalidate_cached_user(user_data["username"])
+
                 return {
                     "id": user_data["id"],
                     "username": user_data["username"],
@@ -68,9 +80,38 @@ class UsersCrudApiUtils:
             return None
 
     @staticmethod
-    def get_user_by_username(username: str) -> dict | None:
-        return POSTGRES_CLIENT.get_user_by_username(username)
+    async def authenticate_user(
+        clients, login: str, password: str
+    ) -> dict | None:
+        try:
+            user_data = await run_in_threadpool(
+                clients.postgres_client.get_user_by_login, login
+            )
+
+            if user_data.get("message") != "User found!":
+                return None
+
+            if not await verify_password_async(
+                password, user_data["hashed_password"]
+            ):
+                return None
+
+            return {
+                "id": user_data["id"],
+                "username": user_data["username"],
+                "email": user_data["email"],
+                "message": "User authenticated successfully!",
+            }
+
+        except Exception as e:
+            file_logger.error(f"Database error authenticating user: {e}")
+            stream_logger.error(f"Database error authenticating user: {e}")
+            return None
+
+    @staticmethod
+    def get_user_by_username(clients, username: str) -> dict | None:
+        return clients.postgres_client.get_user_by_username(username)
 
     @staticmethod
-    def get_user_by_email(email: str) -> dict | None:
-        return POSTGRES_CLIENT.get_user_by_email(email)
+    def get_user_by_email(clients, email: str) -> dict | None:
+        return clients.postgres_client.get_user_by_email(email)
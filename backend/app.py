@@ -2,24 +2,131 @@
 Main app backend module for FastAPI app.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import uvicorn
+from anyio import to_thread
+from config import THREADPOOL_SIZE
+from core_langchain.factory.chains_registry import CHAINS_REGISTRY
+from core_langchain.factory.model_router import get_route_metrics
+from core_langchain.output_parsers.repairing_output_parsers import (
+    get_output_repair_metrics,
+)
 from endpoints.analyze_endpoints import router as analyze_router
 from endpoints.cv_data_crud_endpoints import router as cv_data_crud_router
+from endpoints.dashboard_endpoints import router as dashboard_router
 from endpoints.embeddings_data_crud_endpoints import (
     router as embeddings_data_crud_router,
 )
 from endpoints.interview_prep_endpoints import router as interview_prep_router
 from endpoints.upload_endpoints import router as upload_router
+from endpoints.usage_endpoints import router as usage_router
 from endpoints.users_crud_endpoints import router as users_crud_router
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, status
+from general_utils.checkpoint_utils import delete_expired_checkpoints
+from general_utils.clients import CLIENTS, get_postgres_client
+from general_utils.deadline_utils import (
+    DeadlineExceededError,
+    get_step_latency_metrics,
+)
+from general_utils.json_utils import FastJSONResponse
+from general_utils.rate_limit_utils import (
+    ModelRateLimitError,
+    get_rate_limit_metrics,
+)
+from general_utils.tracing_utils import (
+    SPAN_EXPORTER,
+    close_span_exporter,
+    trace_http_request,
+)
+from general_utils.usage_accounting_utils import (
+    LLM_USAGE_RECORDER,
+    get_llm_usage_metrics,
+    set_usage_endpoint,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints and run_in_threadpool share this per-worker limiter
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = THREADPOOL_SIZE
+
+    # Clients are created on first use, and released on shutdown
+    app.state.clients = CLIENTS
 
-app = FastAPI()
+    # Chains, on their model routes, are built once per worker
+    CHAINS_REGISTRY.warm_up()
+
+    # Workers are recycled after max_requests, which keeps expired
+    # checkpoints cleaned up. Start-up does not wait on the database.
+    checkpoint_cleanup = asyncio.create_task(
+        to_thread.run_sync(delete_expired_checkpoints)
+    )
+
+    # Buffered usage records and spans are written on their interval even
+    # when no new one arrives to trigger a flush
+    periodic_flushes = [
+        asyncio.create_task(LLM_USAGE_RECORDER.flush_periodically())
+    ]
+    if SPAN_EXPORTER is not None:
+        periodic_flushes.append(
+            asyncio.create_task(SPAN_EXPORTER.flush_periodically())
+        )
+
+    yield
+
+    for periodic_flush in periodic_flushes:
+        periodic_flush.cancel()
+    await checkpoint_cleanup
+
+    # Buffered usage records are written before the database pool closes
+    await to_thread.run_sync(LLM_USAGE_RECORDER.close)
+    await to_thread.run_sync(close_span_exporter)
+    await CLIENTS.aclose()
+
+
+app = FastAPI(
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+    # LLM calls of every request are accounted to its endpoint
+    dependencies=[Depends(set_usage_endpoint)],
+)
+# With tracing enabled, every request runs in a span continuing the
+# caller's trace. Untraced apps skip the middleware and its overhead.
+if SPAN_EXPORTER is not None:
+    app.middleware("http")(trace_http_request)
 app.include_router(upload_router)
 app.include_router(analyze_router)
 app.include_router(interview_prep_router)
 app.include_router(users_crud_router)
 app.include_router(cv_data_crud_router)
 app.include_router(embeddings_data_crud_router)
+app.include_router(dashboard_router)
+app.include_router(usage_router)
+
+
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exceeded_error_handler(
+    request: Request, error: DeadlineExceededError
+) -> FastJSONResponse:
+    # The request ran out of its time budget before the model answered
+    return FastJSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT, content=str(error)
+    )
+
+
+@app.exception_handler(ModelRateLimitError)
+async def model_rate_limit_error_handler(
+    request: Request, error: ModelRateLimitError
+) -> FastJSONResponse:
+    # The provider is overloaded, clients retry after the advised delay
+    return FastJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=str(error),
+        headers={"Retry-After": str(error.retry_after_seconds)},
+    )
 
 
 @app.get("/")
@@ -32,5 +139,43 @@ async def health_check():
     return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
 
 
+@app.get("/health/ready")
+def readiness_check(postgres_client=Depends(get_postgres_client)):
+    try:
+        postgres_client.query_db("SELECT 1")
+        return {"status": "ready"}
+
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable", "error": str(e)},
+        )
+
+
+@app.get("/health/rate_limits")
+async def rate_limits():
+    return get_rate_limit_metrics()
+
+
+@app.get("/health/llm_latency")
+async def llm_latency():
+    return get_step_latency_metrics()
+
+
+@app.get("/health/llm_routes")
+async def llm_routes():
+    return get_route_metrics()
+
+
+@app.get("/health/llm_usage")
+async def llm_usage():
+    return get_llm_usage_metrics()
+
+
+@app.get("/health/output_repairs")
+async def output_repairs():
+    return get_output_repair_metrics()
+
+
 if __name__ == "__main__":
     uvicorn.run("app:app", host="0.0.0.0", port=18080, reload=True)
@@ -0,0 +1,69 @@
+"""
+Import-time profile of the backend app.
+
+Runs `python -X importtime -c "import app"` in a fresh interpreter and
+reports the total import time and the slowest top-level packages, so
+start-up regressions (eager clients, heavy loaders) are easy to spot.
+
+Run from the backend directory:
+    python -m benchmarks.import_time_profile --top 15
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+
+def profile_imports(module: str) -> tuple[float, list[tuple[str, int]]]:
+    start_time = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    wall_seconds = time.perf_counter() - start_time
+
+    if completed.returncode != 0:
+        # stderr interleaves the import times with the traceback
+        error_lines = [
+            line
+            for line in completed.stderr.strip().splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise RuntimeError(error_lines[-1])
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    # Every module nests under the profiled one, so self times are summed
+    # by root package to show which dependencies the start-up pays for
+    self_time_by_package = defaultdict(int)
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_time, _, name = line.split("|")
+        self_time_by_package[name.strip().split(".")[0]] += int(
+            self_time.split(":")[1]
+        )
+
+    return wall_seconds, sorted(
+        self_time_by_package.items(), key=lambda item: item[1], reverse=True
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    wall_seconds, packages = profile_imports(args.module)
+
+    print(f"import {args.module}: {wall_seconds:.2f}s wall time")
+    for package, self_time_us in packages[: args.top]:
+        print(f"{package:>40}: {self_time_us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
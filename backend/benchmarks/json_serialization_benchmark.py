@@ -0,0 +1,108 @@
+"""
+Micro-benchmark for get_cv_analysis_jobs response serialization.
+
+Compares the previous path (serialize_for_json + stdlib JSONResponse)
+with rows_to_dicts + FastJSONResponse on synthetic rows shaped like
+`SELECT caj.*, u.username, cd.file_name`.
+
+Run from the backend directory:
+    python -m benchmarks.json_serialization_benchmark --rows 5000
+"""
+
+import argparse
+import timeit
+from collections import namedtuple
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from general_utils.json_utils import FastJSONResponse, rows_to_dicts
+from general_utils.utils import serialize_for_json
+
+CVAnalysisJobRow = namedtuple(
+    "CVAnalysisJobRow",
+    [
+        "id",
+        "user_id",
+        "cv_id",
+        "company_name",
+        "job_title",
+        "status",
+        "match_score",
+        "raw_analysis_result",
+        "inserted_at",
+        "inserted_by",
+        "updated_at",
+        "updated_by",
+        "username",
+        "file_name",
+    ],
+)
+
+
+def build_rows(n_rows: int) -> list[CVAnalysisJobRow]:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    raw_analysis_result = {
+        "match_score": 0.82,
+        "matched_skills": [f"skill_{i}" for i in range(30)],
+        "missing_skills": [f"gap_{i}" for i in range(15)],
+        "recommendations": [
+            {"title": f"Recommendation {i}", "detail": "x" * 200}
+            for i in range(10)
+        ],
+        "summary": "y" * 1500,
+    }
+
+    return [
+        CVAnalysisJobRow(
+            id=i,
+            user_id=1,
+            cv_id=i % 20,
+            company_name=f"Company {i % 50}",
+            job_title="Data Engineer",
+            status="completed",
+            match_score=Decimal("0.82"),
+            raw_analysis_result=raw_analysis_result,
+            inserted_at=now - timedelta(minutes=i),
+            inserted_by="postgres",
+            updated_at=now - timedelta(minutes=i),
+            updated_by="postgres",
+            username="benchmark_user",
+            file_name=f"cv_{i % 20}.pdf",
+        )
+        for i in range(n_rows)
+    ]
+
+
+def previous_path(rows: list[CVAnalysisJobRow]) -> bytes:
+    content = [serialize_for_json(row._asdict()) for row in rows]
+    return JSONResponse(content={"data": content}).body
+
+
+def fast_path(rows: list[CVAnalysisJobRow]) -> bytes:
+    return FastJSONResponse(content={"data": rows_to_dicts(rows)}).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    payload_mb = len(fast_path(rows)) / 1024 / 1024
+
+    print(f"{args.rows} rows, {payload_mb:.1f} MB payload")
+
+    for name, func in (("previous", previous_path), ("orjson", fast_path)):
+        best = min(
+            timeit.repeat(
+                lambda: func(rows), repeat=args.repeat, number=args.number
+            )
+        )
+        print(f"{name:>10}: {best / args.number * 1000:.1f} ms per response")
+
+
+if __name__ == "__main__":
+    main()
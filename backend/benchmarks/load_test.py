@@ -0,0 +1,81 @@
+"""
+Closed-loop HTTP load test for the backend.
+
+Keeps --concurrency requests in flight against one endpoint for
+--duration seconds and reports throughput and latency percentiles.
+
+Run from the backend directory against a running server:
+    python -m benchmarks.load_test --url http://localhost:80/health \
+        --concurrency 32 --duration 30
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def run_worker(url: str, deadline: float, headers: dict) -> tuple[list, int]:
+    latencies, errors = [], 0
+
+    with requests.Session() as session:
+        while time.perf_counter() < deadline:
+            start_time = time.perf_counter()
+
+            try:
+                response = session.get(url, headers=headers, timeout=600)
+                if response.status_code != 200:
+                    errors += 1
+
+            except requests.RequestException:
+                errors += 1
+
+            latencies.append(time.perf_counter() - start_time)
+
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:80/health")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--token", default=None, help="JWT bearer token")
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    deadline = time.perf_counter() + args.duration
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [
+            executor.submit(run_worker, args.url, deadline, headers)
+            for _ in range(args.concurrency)
+        ]
+        results = [future.result() for future in futures]
+
+    latencies = sorted(
+        latency
+        for worker_latencies, _ in results
+        for latency in worker_latencies
+    )
+    errors = sum(worker_errors for _, worker_errors in results)
+
+    if not latencies:
+        print("No requests completed")
+        return
+
+    percentiles = statistics.quantiles(latencies, n=100)
+
+    print(f"{args.url} with {args.concurrency} concurrent clients")
+    print(f"requests: {len(latencies)}, errors: {errors}")
+    print(f"throughput: {len(latencies) / args.duration:.1f} req/s")
+    print(
+        f"latency ms: p50 {percentiles[49] * 1000:.0f}, "
+        f"p95 {percentiles[94] * 1000:.0f}, max {latencies[-1] * 1000:.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Prompt token comparison of output parser and structured output modes.
+
+For every schema in core_langchain/response_schemas, compares the tokens
+of PydanticOutputParser format instructions (added to the prompt in parser
+mode) with the tokens of the tool definition sent in structured output
+mode. Latency per mode is reported live by GET /health/llm_routes, with
+routes that differ only in structured_output_method.
+
+Run from the backend directory:
+    python -m benchmarks.structured_output_benchmark
+"""
+
+import argparse
+import inspect
+import json
+
+import tiktoken
+from core_langchain.response_schemas import (
+    company_parser_response_schemas,
+    cv_response_schemas,
+    interview_response_schemas,
+    jd_response_schemas,
+)
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel
+
+SCHEMA_MODULES = [
+    company_parser_response_schemas,
+    cv_response_schemas,
+    interview_response_schemas,
+    jd_response_schemas,
+]
+
+
+def iter_response_schemas():
+    for module in SCHEMA_MODULES:
+        for name, schema in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(schema, BaseModel)
+                and schema is not BaseModel
+                and schema.__module__ == module.__name__
+            ):
+                yield name, schema
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--encoding", default="cl100k_base")
+    args = parser.parse_args()
+
+    encoding = tiktoken.get_encoding(args.encoding)
+
+    print(f"{'schema':>44} {'format instr.':>14} {'tool def.':>10}")
+
+    total_parser_tokens = total_structured_tokens = 0
+    for name, schema in iter_response_schemas():
+        format_instructions = PydanticOutputParser(
+            pydantic_object=schema
+        ).get_format_instructions()
+        tool_definition = json.dumps(convert_to_openai_tool(schema))
+
+        parser_tokens = len(encoding.encode(format_instructions))
+        structured_tokens = len(encoding.encode(tool_definition))
+        total_parser_tokens += parser_tokens
+        total_structured_tokens += structured_tokens
+
+        print(f"{name:>44} {parser_tokens:>14} {structured_tokens:>10}")
+
+    print(
+        f"{'total':>44} {total_parser_tokens:>14} "
+        f"{total_structured_tokens:>10}"
+    )
+
+
+if __name__ == "__main__":
+    main()
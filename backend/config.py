@@ -9,6 +9,89 @@ load_dotenv(env_path, override=True)
 # OpenAI
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Default chat model, and the pooled HTTP client shared by every chain
+LLM_ROUTES_PATH = os.getenv(
+    "LLM_ROUTES_PATH", str(Path(__file__).parent / "llm_routes.json")
+)
+LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "gpt-3.5-turbo")
+LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.3"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "64"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "32")
+)
+LLM_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.getenv("LLM_KEEPALIVE_EXPIRY_SECONDS", "60")
+)
+
+# Provider rate limits for the whole account, shared by all workers
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "3500"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+EMBEDDINGS_REQUESTS_PER_MINUTE = float(
+    os.getenv("EMBEDDINGS_REQUESTS_PER_MINUTE", "3000")
+)
+EMBEDDINGS_TOKENS_PER_MINUTE = float(
+    os.getenv("EMBEDDINGS_TOKENS_PER_MINUTE", "1000000")
+)
+RATE_LIMIT_WORKERS = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Adaptive concurrency and retries of model calls, per worker
+LLM_INITIAL_CONCURRENCY = int(os.getenv("LLM_INITIAL_CONCURRENCY", "16"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_MAX_BACKOFF_SECONDS = float(os.getenv("LLM_MAX_BACKOFF_SECONDS", "60"))
+LLM_ESTIMATED_COMPLETION_TOKENS = int(
+    os.getenv("LLM_ESTIMATED_COMPLETION_TOKENS", "1000")
+)
+
+# Deadlines of LLM pipelines and their steps, and hedging of slow steps
+LLM_STEP_TIMEOUT_SECONDS = float(os.getenv("LLM_STEP_TIMEOUT_SECONDS", "90"))
+ANALYSIS_DEADLINE_SECONDS = float(
+    os.getenv("ANALYSIS_DEADLINE_SECONDS", "240")
+)
+INTERVIEW_PREP_DEADLINE_SECONDS = float(
+    os.getenv("INTERVIEW_PREP_DEADLINE_SECONDS", "180")
+)
+LLM_HEDGING_ENABLED = (
+    os.getenv("LLM_HEDGING_ENABLED", "false").lower() == "true"
+)
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_MIN_DELAY_SECONDS = float(
+    os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "2")
+)
+
+# Batched writes of per-call LLM usage records
+LLM_USAGE_FLUSH_BATCH_SIZE = int(
+    os.getenv("LLM_USAGE_FLUSH_BATCH_SIZE", "100")
+)
+LLM_USAGE_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("LLM_USAGE_FLUSH_INTERVAL_SECONDS", "10")
+)
+
+# Persisted outputs of completed LLM steps, reused by resumed runs
+LLM_STEP_CHECKPOINTS_ENABLED = (
+    os.getenv("LLM_STEP_CHECKPOINTS_ENABLED", "true").lower() == "true"
+)
+# Older checkpoints are not reused, and are deleted when a worker starts
+LLM_STEP_CHECKPOINT_TTL_SECONDS = int(
+    os.getenv("LLM_STEP_CHECKPOINT_TTL_SECONDS", "86400")
+)
+
+# Tracing of requests, chain steps, database and storage calls; exporter
+# is none, file (JSON lines) or otlp (OTLP/HTTP collector)
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", "logs/traces/traces.jsonl")
+TRACING_OTLP_ENDPOINT = os.getenv(
+    "TRACING_OTLP_ENDPOINT", "http://localhost:4318"
+)
+TRACING_SERVICE_NAME = os.getenv(
+    "TRACING_SERVICE_NAME", "job-research-assistant-backend"
+)
+TRACING_FLUSH_BATCH_SIZE = int(os.getenv("TRACING_FLUSH_BATCH_SIZE", "200"))
+TRACING_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("TRACING_FLUSH_INTERVAL_SECONDS", "5")
+)
+
 # HunggingFace
 HF_ACCESS_TOKEN = os.getenv("HF_ACCESS_TOKEN")
 
@@ -24,6 +107,27 @@ POSTGRES_DB = os.getenv("POSTGRES_DB")
 POSTGRES_PORT = os.getenv("POSTGRES_PORT")
 POSTGRES_HOST = os.getenv("POSTGRES_HOST")
 
+# JWT authentication, shared with the frontend
+SECRET_KEY = os.getenv("SECRET_KEY")
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
+
+# Cache of decoded JWT claims and user rows
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAXSIZE = int(os.getenv("AUTH_CACHE_MAXSIZE", "4096"))
+
+# Deprecated: resolve users from a username query parameter when a request
+# has no bearer token, for clients that do not send tokens yet
+AUTH_USERNAME_FALLBACK_ENABLED = (
+    os.getenv("AUTH_USERNAME_FALLBACK_ENABLED", "false").lower() == "true"
+)
+
+# Threads per worker for sync endpoints and run_in_threadpool calls
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "64"))
+
+# Password hashing
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASHING_WORKERS = int(os.getenv("PASSWORD_HASHING_WORKERS", "4"))
+
 if not OPENAI_API_KEY:
     raise ValueError(
         "OPENAI_API_KEY is not set. Please add it to your .env file."
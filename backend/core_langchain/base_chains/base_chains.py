@@ -2,27 +2,62 @@
 Module to specify base abstract langchain chain for job research assistant app.
 """
 
+import json
 from abc import ABC, abstractmethod
 from typing import Any
 
-from config import OPENAI_API_KEY
+from core_langchain.factory.model_router import (
+    MODEL_ROUTING_CONFIG,
+    ROUTE_METRICS,
+    RouteMetricsCallbackHandler,
+)
+from core_langchain.output_parsers.repairing_output_parsers import (
+    RepairingPydanticOutputParser,
+)
+from general_utils.clients import CLIENTS
+from general_utils.rate_limit_utils import (
+    get_chat_model_limiter,
+    with_rate_limit,
+)
 from langchain.prompts import PromptTemplate
-from langchain.schema.runnable import RunnableSerializable
-from langchain_openai import ChatOpenAI
-from pydantic import SecretStr
+from langchain.schema.runnable import RunnableLambda, RunnableSerializable
+from pydantic_models.llm_routing_models import ModelRoute
+
+# Replaces the JSON schema format instructions when the schema is sent to
+# the provider as a tool or response format instead
+STRUCTURED_OUTPUT_INSTRUCTIONS = "Respond using the provided output schema."
 
 
 class BaseChain(ABC):
     @abstractmethod
-    def __init__(self, model_name: str, temperature: float):
-        self.chat_model = ChatOpenAI(
-            model=model_name,
-            api_key=SecretStr(OPENAI_API_KEY or ""),
-            temperature=temperature,
+    def __init__(self, route: ModelRoute):
+        self.route = route
+        self.llm = CLIENTS.get_chat_model(route)
+        self.llm_callbacks = [
+            RouteMetricsCallbackHandler(
+                route, ROUTE_METRICS, type(self).__name__
+            )
+        ]
+        self.chat_model = self.llm.with_config(callbacks=self.llm_callbacks)
+        # Malformed output is repaired before it fails the pipeline
+        self.response_schema = RepairingPydanticOutputParser.from_parser(
+            self._construct_response_schema(),
+            MODEL_ROUTING_CONFIG.route_for("output_repair"),
         )
-        self.response_schema = self._construct_response_schema()
         self.prompt = self._construct_prompt()
-        self.chain = self._construct_chain()
+
+        if route.structured_output_method:
+            self.prompt = self.prompt.partial(
+                format_instructions=STRUCTURED_OUTPUT_INSTRUCTIONS
+            )
+            chain = self._construct_structured_output_chain()
+        else:
+            chain = self._construct_chain()
+
+        # Every call of the chain goes through the shared model limiter
+        self.chain = with_rate_limit(
+            chain, get_chat_model_limiter(route.base_url)
+        )
 
     @abstractmethod
     def _construct_response_schema(self) -> Any:
@@ -36,10 +71,64 @@ class BaseChain(ABC):
     def _construct_chain(self) -> RunnableSerializable:
         pass
 
+    def _construct_structured_output_chain(self) -> RunnableSerializable:
+        """
+        Chain using the provider's structured output for the response schema.
+
+        The raw completion is kept, so the response schema's parser can
+        still read it when the structured result fails validation.
+        """
+        structured_chat_model = self.llm.with_structured_output(
+            self.response_schema.pydantic_object,
+            method=self.route.structured_output_method,
+            include_raw=True,
+        ).with_config(callbacks=self.llm_callbacks)
+
+        return (
+            self.prompt
+            | structured_chat_model
+            | RunnableLambda(
+                self._parse_structured_output,
+                afunc=self._aparse_structured_output,
+            )
+        )
+
+    def _get_structured_output_fallback_text(self, output: dict) -> str:
+        ROUTE_METRICS.increment(self.route, "structured_output_fallbacks")
+
+        raw_message = output["raw"]
+        if raw_message.tool_calls:
+            return json.dumps(raw_message.tool_calls[0]["args"])
+        if raw_message.invalid_tool_calls:
+            return raw_message.invalid_tool_calls[0]["args"] or ""
+
+        return raw_message.content
+
+    def _parse_structured_output(self, output: dict) -> Any:
+        if output["parsing_error"] is None and output["parsed"] is not None:
+            return output["parsed"]
+
+        return self.response_schema.parse(
+            self._get_structured_output_fallback_text(output)
+        )
+
+    async def _aparse_structured_output(self, output: dict) -> Any:
+        if output["parsing_error"] is None and output["parsed"] is not None:
+            return output["parsed"]
+
+        return await self.response_schema.aparse(
+            self._get_structured_output_fallback_text(output)
+        )
+
     def run_chain(self, input_data: dict) -> Any:
         filtered_input_data = self._filter_input_data(input_data)
         return self.chain.invoke(filtered_input_data).model_dump()
 
+    async def arun_chain(self, input_data: dict) -> Any:
+        filtered_input_data = self._filter_input_data(input_data)
+        result = await self.chain.ainvoke(filtered_input_data)
+        return result.model_dump()
+
     def _filter_input_data(self, input_data: dict) -> dict:
         """Filter input_data to only include variables expected by the prompt"""
         expected_variables = set(self.prompt.input_variables)
@@ -12,11 +12,12 @@ from core_langchain.response_schemas.company_parser_response_schemas import (
 from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
 from langchain.schema.runnable import RunnableSerializable
+from pydantic_models.llm_routing_models import ModelRoute
 
 
 class CompanyInfoParserChain(BaseChain):
-    def __init__(self, model_name: str, temperature: float):
-        super().__init__(model_name, temperature)
+    def __init__(self, route: ModelRoute):
+        super().__init__(route)
 
     def _construct_response_schema(self) -> PydanticOutputParser:
         return PydanticOutputParser(pydantic_object=CompanyInfoSchema)
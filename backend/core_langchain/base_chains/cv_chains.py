@@ -20,11 +20,12 @@ from core_langchain.response_schemas.cv_response_schemas import (
 from langchain.prompts import PromptTemplate
 from langchain.schema.runnable import RunnableSerializable
 from langchain_core.output_parsers import PydanticOutputParser
+from pydantic_models.llm_routing_models import ModelRoute
 
 
 class CVParserChain(BaseChain):
-    def __init__(self, model_name: str, temperature: float):
-        super().__init__(model_name, temperature)
+    def __init__(self, route: ModelRoute):
+        super().__init__(route)
 
     def _construct_response_schema(self) -> PydanticOutputParser:
         return PydanticOutputParser(pydantic_object=CVResponseSchema)
@@ -37,8 +38,8 @@ class CVParserChain(BaseChain):
 
 
 class SkillsGapAnalysisChain(BaseChain):
-    def __init__(self, model_name: str, temperature: float):
-        super().__init__(model_name, temperature)
+    def __init__(self, route: ModelRoute):
+        super().__init__(route)
 
     def _construct_response_schema(self) -> PydanticOutputParser:
         return PydanticOutputParser(pydantic_object=SkillsGapSchema)
@@ -51,8 +52,8 @@ class SkillsGapAnalysisChain(BaseChain):
 
 
 class CVMainBulletPointsExtractionChain(BaseChain):
-    def __init__(self, model_name: str, temperature: float):
-        super().__init__(model_name, temperature)
+    def __init__(self, route: ModelRoute):
+        super().__init__(route)
 
     def _construct_response_schema(self) -> PydanticOutputParser:
         return PydanticOutputParser(pydantic_object=CVMainBulletPointsSchema)
@@ -67,8 +68,8 @@ class CVMainBulletPointsExtractionChain(BaseChain):
 
 
 class CVImprovedBulletPointsChain(BaseChain):
-    def __init__(self, model_name: str, temperature: float):
-        super().__init__(model_name, temperature)
+    def __init__(self, route: ModelRoute):
+        super().__init__(route)
 
     def _construct_response_schema(self) -> PydanticOutputParser:
         return PydanticOutputParser(
@@ -83,8 +84,8 @@ class CVImprovedBulletPointsChain(BaseChain):
 
 
 class ATSKeywordsChain(BaseChain):
-    def __init__(self, model_name: str, temperature: float):
-        super().__init__(model_name, temperature)
+    def __init__(self, route: ModelRoute):
+        super().__init__(route)
 
     def _construct_response_schema(self) -> PydanticOutputParser:
         return PydanticOutputParser(pydantic_object=ATSKeywordsSchema)
@@ -116,7 +117,7 @@ if __name__ == "__main__":
 
     docx_object_key = "32c8982bff784c4b959c3231918240b2ab756ea032a5174742672bea7d82b918/MinhLai_CV_BuroHappold.docx"
 
-    cv_chain = CVParserChain(model_name="gpt-3.5-turbo", temperature=0.3)
+    cv_chain = CVParserChain(ModelRoute())
 
     input_data = {
         "raw_cv_text": retrieve_raw_cv_object(docx_object_key)[0].page_content
@@ -10,11 +10,12 @@ from core_langchain.response_schemas.jd_response_schemas import (
 from langchain.prompts import PromptTemplate
 from langchain.schema.runnable import RunnableSerializable
 from langchain_core.output_parsers import PydanticOutputParser
+from pydantic_models.llm_routing_models import ModelRoute
 
 
 class JobDescriptionParserChain(BaseChain):
-    def __init__(self, model_name: str, temperature: float):
-        super().__init__(model_name, temperature)
+    def __init__(self, route: ModelRoute):
+        super().__init__(route)
 
     def _construct_response_schema(self) -> PydanticOutputParser:
         return PydanticOutputParser(pydantic_object=JobDescriptionSchema)
@@ -1,6 +1,7 @@
 """Module to create langchain chains factory for job research assistant app."""
 
 from pathlib import Path
+from typing import Callable
 
 from core_langchain.base_chains.company_parser_chains import (
     CompanyInfoParserChain,
@@ -18,18 +19,23 @@ from core_langchain.base_chains.interview_chains import (
     InterviewQuestionsGeneratorChain,
 )
 from core_langchain.base_chains.jd_chains import JobDescriptionParserChain
-from db_connectors.postgres.postgres_client import (
-    PGVectorClient,
-    PostgresClient,
+from core_langchain.factory.model_router import MODEL_ROUTING_CONFIG
+from fastapi.concurrency import run_in_threadpool
+from general_utils.checkpoint_utils import (
+    arun_checkpointed_step,
+    run_checkpointed_step,
 )
+from general_utils.clients import CLIENTS
+from general_utils.deadline_utils import arun_step, run_step
 from general_utils.logging import get_logger
+from general_utils.tracing_utils import trace_span
 from general_utils.utils import get_matching_strings
 from langchain.schema.runnable import (
     RunnableLambda,
     RunnablePassthrough,
     RunnableSerializable,
 )
-from langchain_openai import OpenAIEmbeddings
+from pydantic_models.llm_routing_models import ModelRoutingConfig
 
 file_logger = get_logger(
     "file_" + __name__,
@@ -41,12 +47,6 @@ stream_logger = get_logger(
     "stream_" + __name__,
 )
 
-# Initialize Postgres and PGVector clients
-POSTGRES_CLIENT = PostgresClient()
-EMBEDDING_FUNCTION = OpenAIEmbeddings()
-PGVECTOR_JD = PGVectorClient(EMBEDDING_FUNCTION, "job_descriptions")
-PGVECTOR_COMPANY_INFO = PGVectorClient(EMBEDDING_FUNCTION, "company_info")
-
 
 class ChainsFactory:
     """Factory class to create langchain chains for job research assistant app."""
@@ -64,22 +64,29 @@ class ChainsFactory:
         "interview_additional_resources_generator": InterviewAdditionalResourcesGeneratorChain,
     }
 
-    def __init__(self, model_name: str, temperature: float):
-        self.model_name = model_name
-        self.temperature = temperature
+    def __init__(
+        self, routing_config: ModelRoutingConfig = MODEL_ROUTING_CONFIG
+    ):
+        self.routing_config = routing_config
         self._chain_cache = {}
 
-    def _get_base_chain(self, chain_type: str):
-        """Lazy loading of chains with caching"""
+    def get_base_chain_object(self, chain_type: str):
+        """Lazy loading of base chain objects with caching, per model route"""
+        route = self.routing_config.route_for(chain_type)
+        cache_key = (chain_type, route.name)
+
         if (
-            chain_type not in self._chain_cache
+            cache_key not in self._chain_cache
             and chain_type in self._base_chain_classes
         ):
-            self._chain_cache[chain_type] = self._base_chain_classes[
+            self._chain_cache[cache_key] = self._base_chain_classes[
                 chain_type
-            ](self.model_name, self.temperature)
+            ](route)
 
-        return self._chain_cache[chain_type].chain
+        return self._chain_cache[cache_key]
+
+    def _get_base_chain(self, chain_type: str):
+        return self.get_base_chain_object(chain_type).chain
 
     ### HELPER FUNCTIONS ###
     def _retrieve_cv_text(self, data, text_type="extracted_text"):
@@ -91,7 +98,7 @@ class ChainsFactory:
                     from public.cv_data cd where cd.file_hash = :cv_file_hash
                 """
 
-            result = POSTGRES_CLIENT.query_db(
+            result = CLIENTS.postgres_client.query_db(
                 query, params={"cv_file_hash": cv_file_hash}
             )
 
@@ -119,7 +126,7 @@ class ChainsFactory:
             FROM langchain_pg_embedding lpe
             WHERE lpe.cmetadata->>'company_name' IS NOT NULL;
         """
-        result = POSTGRES_CLIENT.query_db(query)
+        result = CLIENTS.postgres_client.query_db(query)
         known_company_names = (
             list({row[0] for row in result.fetchall()}) if result else list()
         )
@@ -127,7 +134,7 @@ class ChainsFactory:
         company_names = get_matching_strings(company_name, known_company_names)
 
         if rag_collection == "job_description":
-            relevant_context = PGVECTOR_JD.similarity_search(
+            relevant_context = CLIENTS.pgvector_jd.similarity_search(
                 query=job_title,
                 metadata_filter={
                     "company_name": company_names,
@@ -137,7 +144,7 @@ class ChainsFactory:
             )
 
         elif rag_collection == "company_values":
-            relevant_context = PGVECTOR_COMPANY_INFO.similarity_search(
+            relevant_context = CLIENTS.pgvector_company_info.similarity_search(
                 query=company_name,
                 metadata_filter={"company_name": company_names},
                 k=k,
@@ -155,12 +162,121 @@ class ChainsFactory:
 
     ### END HELPER FUNCTIONS ###
 
+    ### STEP BUILDERS ###
+
+    def _retrieval_step(self, retrieve, *args) -> RunnableLambda:
+        """
+        Wrap a blocking retrieval helper as a pipeline step.
+
+        Under ainvoke the helper runs in the threadpool, so database and
+        vector store calls do not block the event loop.
+        """
+
+        span_name = f"retrieval_step.{retrieve.__name__.lstrip('_')}"
+        span_attributes = {"step.args": ", ".join(map(str, args))}
+
+        def run(data):
+            with trace_span(span_name, attributes=span_attributes):
+                return retrieve(data, *args)
+
+        async def aretrieve(data):
+            with trace_span(span_name, attributes=span_attributes):
+                return await run_in_threadpool(retrieve, data, *args)
+
+        return RunnableLambda(run, afunc=aretrieve)
+
+    def _llm_step(
+        self,
+        chain_type: str,
+        build_input: Callable[[dict], dict],
+        output_key: str | None = None,
+    ) -> RunnableLambda:
+        """
+        Wrap a base chain as a pipeline step.
+
+        Under ainvoke the base chain is awaited, so an in-flight LLM call
+        holds no thread. Each step runs within its step timeout and the
+        caller's deadline budget, and may be hedged. Inside a checkpointed
+        run, a step whose output was already stored is not run again.
+        """
+        base_chain = self.get_base_chain_object(chain_type)
+        chain = base_chain.chain
+        chain_name = type(base_chain).__name__
+        # Everything that shapes the step's output is part of its
+        # checkpoint key, a change to any of it runs the model again
+        output_schema = base_chain.response_schema.pydantic_object
+        checkpoint_key = (
+            chain_type,
+            base_chain.route.model,
+            {
+                "prompt_template": base_chain.prompt.template,
+                "response_schema": output_schema.model_json_schema(),
+                "route": base_chain.route.model_dump(
+                    include={
+                        "model",
+                        "temperature",
+                        "max_tokens",
+                        "base_url",
+                        "structured_output_method",
+                    }
+                ),
+            },
+            output_schema,
+        )
+        span_name = f"llm_step.{chain_type}"
+        span_attributes = {
+            "llm.chain": chain_name,
+            "llm.route": base_chain.route.name,
+            "llm.model": base_chain.route.model,
+        }
+
+        def select_output(result):
+            return result[output_key] if output_key else result
+
+        def run(data):
+            input_data = build_input(data)
+
+            with trace_span(span_name, attributes=span_attributes):
+                return select_output(
+                    run_checkpointed_step(
+                        *checkpoint_key,
+                        input_data,
+                        lambda: run_step(
+                            chain_type, lambda: chain.invoke(input_data)
+                        ).model_dump(),
+                        chain_name,
+                    )
+                )
+
+        async def arun(data):
+            input_data = build_input(data)
+
+            async def ainvoke_step():
+                result = await arun_step(
+                    chain_type, lambda: chain.ainvoke(input_data)
+                )
+                return result.model_dump()
+
+            with trace_span(span_name, attributes=span_attributes):
+                return select_output(
+                    await arun_checkpointed_step(
+                        *checkpoint_key, input_data, ainvoke_step, chain_name
+                    )
+                )
+
+        return RunnableLambda(run, afunc=arun)
+
+    ### END STEP BUILDERS ###
+
     ### FACTORY FUNCTIONS ###
 
     def create_complete_cv_recommendations_chain(self) -> RunnableSerializable:
         """
         Create a complete CV recommendations chain.
 
+        Supports both invoke and ainvoke, steps in the same assign run
+        concurrently.
+
         Input data:
         - cv_file_hash: str
         - company_name: str
@@ -175,73 +291,60 @@ class ChainsFactory:
         - new_cv_bullet_points: list[str]
         - ats_keywords_included: list[str]
         """
-        skills_gap_analizer = self._get_base_chain("skills_gap_analizer")
-        cv_main_bullet_points_extractor = self._get_base_chain(
-            "cv_main_bullet_points_extractor"
-        )
-        cv_improved_bullet_points_generator = self._get_base_chain(
-            "cv_improved_bullet_points_generator"
-        )
-        ats_keywords_generator = self._get_base_chain("ats_keywords_generator")
-
         complete_cv_recommendations_chain = (
-            # Step 1: Retrieve extracted CV text and job description context
+            # Step 1: Retrieve extracted and raw CV text, and job description context
             RunnablePassthrough.assign(
-                extracted_cv_text=lambda data: self._retrieve_cv_text(data),
-                job_description=lambda data: self._retrieve_relevant_contexts(
-                    data, "job_description"
+                extracted_cv_text=self._retrieval_step(self._retrieve_cv_text),
+                raw_cv_text=self._retrieval_step(
+                    self._retrieve_cv_text, "raw_text"
+                ),
+                job_description=self._retrieval_step(
+                    self._retrieve_relevant_contexts, "job_description"
                 ),
             )
-            # Step 2: Generate skills gap from CV and job description
+            # Step 2: Generate skills gap from CV and job description, and
+            # extract main bullet points from CV
             | RunnablePassthrough.assign(
-                skills_gap_result=lambda data: skills_gap_analizer.invoke(
-                    {
+                skills_gap_result=self._llm_step(
+                    "skills_gap_analizer",
+                    lambda data: {
                         "extracted_cv_text": data["extracted_cv_text"],
                         "job_description": data["job_description"],
-                    }
-                ).model_dump()
-            )
-            # Step 3: Retrieve extracted CV text
-            | RunnablePassthrough.assign(
-                raw_cv_text=lambda data: self._retrieve_cv_text(
-                    data, "raw_text"
+                    },
+                ),
+                main_bullet_points=self._llm_step(
+                    "cv_main_bullet_points_extractor",
+                    lambda data: {"raw_cv_text": data["raw_cv_text"]},
+                    "main_bullet_points",
                 ),
             )
-            # Step 4: Extract main bullet points from CV
-            | RunnablePassthrough.assign(
-                main_bullet_points=lambda data: cv_main_bullet_points_extractor.invoke(
-                    {"raw_cv_text": data["raw_cv_text"]}
-                ).model_dump()[
-                    "main_bullet_points"
-                ]
-            )
-            # Step 5: Generate new CV bullet points for CV
+            # Step 3: Generate new CV bullet points for CV
             | RunnablePassthrough.assign(
-                new_cv_bullet_points=lambda data: cv_improved_bullet_points_generator.invoke(
-                    {
+                new_cv_bullet_points=self._llm_step(
+                    "cv_improved_bullet_points_generator",
+                    lambda data: {
                         "job_description_ats_skills_extracted": data[
                             "skills_gap_result"
                         ]["job_description_ats_skills_extracted"],
                         "main_bullet_points": data["main_bullet_points"],
-                    }
-                ).model_dump()[
-                    "new_cv_bullet_points"
-                ]
+                    },
+                    "new_cv_bullet_points",
+                )
             )
-            # Step 6: Generate ATS keywords included in the new CV bullet points
+            # Step 4: Generate ATS keywords included in the new CV bullet points
             | RunnablePassthrough.assign(
-                ats_keywords_included=lambda data: ats_keywords_generator.invoke(
-                    {
+                ats_keywords_included=self._llm_step(
+                    "ats_keywords_generator",
+                    lambda data: {
                         "job_description_ats_skills_extracted": data[
                             "skills_gap_result"
                         ]["job_description_ats_skills_extracted"],
                         "new_cv_bullet_points": data["new_cv_bullet_points"],
-                    }
-                ).model_dump()[
-                    "ats_keywords_included"
-                ]
+                    },
+                    "ats_keywords_included",
+                )
             )
-            # Step 7: Return only the desired output
+            # Step 5: Return only the desired output
             | RunnableLambda(
                 lambda data: {
                     "general_recommendations": data["skills_gap_result"][
@@ -271,6 +374,9 @@ class ChainsFactory:
         """
         Create a complete interview preparation chain.
 
+        Supports both invoke and ainvoke, steps in the same assign run
+        concurrently.
+
         Input data:
         - company_name: str
         - job_title: str
@@ -280,56 +386,46 @@ class ChainsFactory:
         - generated_interview_answers: list[str]
         - generated_additional_resources: list[str]
         """
-        interview_questions_generator = self._get_base_chain(
-            "interview_questions_generator"
-        )
-        interview_answers_generator = self._get_base_chain(
-            "interview_answers_generator"
-        )
-        interview_additional_resources_generator = self._get_base_chain(
-            "interview_additional_resources_generator"
-        )
-
         complete_interview_preparation_chain = (
             # Step 1: Retrieve relevant job description context and company values context
             RunnablePassthrough.assign(
-                job_description=lambda data: self._retrieve_relevant_contexts(
-                    data, "job_description"
+                job_description=self._retrieval_step(
+                    self._retrieve_relevant_contexts, "job_description"
                 ),
-                company_values=lambda data: self._retrieve_relevant_contexts(
-                    data, "company_values"
+                company_values=self._retrieval_step(
+                    self._retrieve_relevant_contexts, "company_values"
                 ),
             )
             # Step 2: Generate interview questions
             | RunnablePassthrough.assign(
-                generated_interview_questions=lambda data: interview_questions_generator.invoke(
-                    {
+                generated_interview_questions=self._llm_step(
+                    "interview_questions_generator",
+                    lambda data: {
                         "job_description": data["job_description"],
                         "company_values": data["company_values"],
-                    }
-                ).model_dump()
+                    },
+                )
             )
-            # Step 3: Generate interview answers
+            # Step 3: Generate interview answers and additional resources
             | RunnablePassthrough.assign(
-                generated_interview_answers=lambda data: interview_answers_generator.invoke(
-                    {
+                generated_interview_answers=self._llm_step(
+                    "interview_answers_generator",
+                    lambda data: {
                         "generated_interview_questions": data[
                             "generated_interview_questions"
                         ]
-                    }
-                ).model_dump()
-            )
-            # Step 4: Generate additional resources
-            | RunnablePassthrough.assign(
-                generated_additional_resources=lambda data: interview_additional_resources_generator.invoke(
-                    {
+                    },
+                ),
+                generated_additional_resources=self._llm_step(
+                    "interview_additional_resources_generator",
+                    lambda data: {
                         "generated_interview_questions": data[
                             "generated_interview_questions"
                         ]
-                    }
-                ).model_dump()
+                    },
+                ),
             )
-            # Step 5: Return only the desired output
+            # Step 4: Return only the desired output
             | RunnableLambda(
                 lambda data: {
                     "generated_interview_questions": data[
@@ -349,7 +445,7 @@ class ChainsFactory:
 
 
 if __name__ == "__main__":
-    chains_factory = ChainsFactory(model_name="gpt-3.5-turbo", temperature=0.3)
+    chains_factory = ChainsFactory()
     # complete_cv_recommendations_chain = (
     #     chains_factory.create_complete_cv_recommendations_chain()
     # )
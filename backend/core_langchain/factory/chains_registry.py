@@ -0,0 +1,81 @@
+"""Module to specify the process-wide registry of prebuilt langchain chains for job research assistant app."""
+
+import threading
+from pathlib import Path
+
+from core_langchain.base_chains.base_chains import BaseChain
+from core_langchain.factory.chains_factory import ChainsFactory
+from general_utils.logging import get_logger
+from langchain.schema.runnable import RunnableSerializable
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/chains_factory/chains_registry.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+
+class ChainsRegistry:
+    """
+    Registry of chains keyed by (chain type, model route).
+
+    Each chain type uses the model route given by the model routing
+    config. Chains are stateless runnables, so one instance of each is
+    built per process and shared by every request. Their chat models share
+    the pooled LLM HTTP client of the client container.
+    """
+
+    _complete_chain_builders = {
+        "complete_cv_recommendations": ChainsFactory.create_complete_cv_recommendations_chain,
+        "complete_interview_preparation": ChainsFactory.create_complete_interview_preparation_chain,
+    }
+
+    def __init__(self, chains_factory: ChainsFactory | None = None):
+        self.chains_factory = chains_factory or ChainsFactory()
+        self._complete_chains: dict[str, RunnableSerializable] = {}
+        self._lock = threading.RLock()
+
+    def get_base_chain(self, chain_type: str) -> BaseChain:
+        with self._lock:
+            return self.chains_factory.get_base_chain_object(chain_type)
+
+    def get_complete_chain(self, chain_name: str) -> RunnableSerializable:
+        chain = self._complete_chains.get(chain_name)
+        if chain is not None:
+            return chain
+
+        with self._lock:
+            if chain_name not in self._complete_chains:
+                self._complete_chains[chain_name] = (
+                    self._complete_chain_builders[chain_name](
+                        self.chains_factory
+                    )
+                )
+
+            return self._complete_chains[chain_name]
+
+    def warm_up(self) -> None:
+        """Build every base and complete chain on its configured route."""
+        try:
+            for chain_type in ChainsFactory._base_chain_classes:
+                self.get_base_chain(chain_type)
+
+            for chain_name in self._complete_chain_builders:
+                self.get_complete_chain(chain_name)
+
+            stream_logger.info(
+                f"Chains built for model routes: "
+                f"{sorted(self.chains_factory.routing_config.routes)}!"
+            )
+
+        except Exception as e:
+            # Chains are still built on first use if warm up fails
+            file_logger.error(f"Failed to warm up chains: {e}")
+            stream_logger.error(f"Failed to warm up chains: {e}")
+
+
+CHAINS_REGISTRY = ChainsRegistry()
@@ -0,0 +1,168 @@
+"""Module to route langchain chains to chat models for job research assistant app."""
+
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from config import LLM_ROUTES_PATH
+from general_utils.logging import get_logger
+from general_utils.usage_accounting_utils import LLM_USAGE_RECORDER
+from langchain_core.callbacks import BaseCallbackHandler
+from pydantic_models.llm_routing_models import ModelRoute, ModelRoutingConfig
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/chains_factory/model_router.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+
+def load_model_routing_config(path: str | Path) -> ModelRoutingConfig:
+    """Load the routing config, or route every chain to the default model."""
+    path = Path(path)
+
+    if not path.exists():
+        stream_logger.warning(
+            f"No model routing config at {path}, using the default model!"
+        )
+        return ModelRoutingConfig()
+
+    return ModelRoutingConfig.model_validate_json(path.read_text())
+
+
+MODEL_ROUTING_CONFIG = load_model_routing_config(LLM_ROUTES_PATH)
+
+
+class RouteMetrics:
+    """Calls, latency, tokens and estimated cost per model route."""
+
+    def __init__(self):
+        self._metrics = defaultdict(
+            lambda: {
+                "calls": 0,
+                "errors": 0,
+                "latency_seconds_total": 0.0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cost_usd": 0.0,
+            }
+        )
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        route: ModelRoute,
+        latency_seconds: float,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> None:
+        with self._lock:
+            metrics = self._metrics[route.name]
+            metrics["calls"] += 1
+            metrics["latency_seconds_total"] += latency_seconds
+            metrics["input_tokens"] += input_tokens
+            metrics["output_tokens"] += output_tokens
+            metrics["cost_usd"] += route.get_cost_usd(
+                input_tokens, output_tokens
+            )
+
+    def record_error(self, route: ModelRoute) -> None:
+        self.increment(route, "errors")
+
+    def increment(self, route: ModelRoute, counter: str) -> None:
+        with self._lock:
+            metrics = self._metrics[route.name]
+            metrics[counter] = metrics.get(counter, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            snapshot = {
+                name: dict(metrics) for name, metrics in self._metrics.items()
+            }
+
+        for metrics in snapshot.values():
+            metrics["latency_seconds_avg"] = (
+                metrics["latency_seconds_total"] / metrics["calls"]
+                if metrics["calls"]
+                else 0.0
+            )
+
+        return snapshot
+
+
+ROUTE_METRICS = RouteMetrics()
+
+
+class RouteMetricsCallbackHandler(BaseCallbackHandler):
+    """
+    Record latency and token usage of every call to a route's model.
+
+    Calls are aggregated per route, and also accounted per chain, user and
+    endpoint by the usage recorder.
+    """
+
+    # Bookkeeping only, so no need to hop to a thread under ainvoke
+    run_inline = True
+
+    def __init__(
+        self, route: ModelRoute, metrics: RouteMetrics, chain_name: str
+    ):
+        self.route = route
+        self.metrics = metrics
+        self.chain_name = chain_name
+        self._start_times = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start_times[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        start_time = self._start_times.pop(run_id, None)
+        if start_time is None:
+            return
+
+        latency_seconds = time.perf_counter() - start_time
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        input_tokens = token_usage.get("prompt_tokens", 0)
+        output_tokens = token_usage.get("completion_tokens", 0)
+
+        self.metrics.record(
+            self.route, latency_seconds, input_tokens, output_tokens
+        )
+        LLM_USAGE_RECORDER.record(
+            self.chain_name,
+            self.route.model,
+            route_name=self.route.name,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency_seconds=latency_seconds,
+            cost_usd=self.route.get_cost_usd(input_tokens, output_tokens),
+        )
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._start_times.pop(run_id, None)
+        self.metrics.record_error(self.route)
+
+
+def get_route_metrics() -> dict:
+    """Routes of every chain type and the metrics of each route."""
+    return {
+        "routes": {
+            name: route.model_dump(
+                include={
+                    "model",
+                    "temperature",
+                    "max_tokens",
+                    "base_url",
+                    "structured_output_method",
+                }
+            )
+            for name, route in MODEL_ROUTING_CONFIG.routes.items()
+        },
+        "chains": MODEL_ROUTING_CONFIG.chains,
+        "metrics": ROUTE_METRICS.snapshot(),
+    }
@@ -0,0 +1,277 @@
+"""
+Module to specify output parsers that repair malformed LLM JSON for job research assistant app.
+"""
+
+import json
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Optional
+
+from core_langchain.factory.model_router import (
+    ROUTE_METRICS,
+    RouteMetricsCallbackHandler,
+)
+from general_utils.clients import CLIENTS
+from general_utils.logging import get_logger
+from langchain.prompts import PromptTemplate
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import ValidationError
+from pydantic_models.llm_routing_models import ModelRoute
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/chains_factory/repairing_output_parsers.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+# Fences open at the start of a line, so backticks inside a JSON string
+# are not mistaken for one
+CODE_FENCE_PATTERN = re.compile(
+    r"^[ \t]*```(?:json)?\s*(.*?)(?:```[ \t]*$|\Z)", re.DOTALL | re.MULTILINE
+)
+DANGLING_KEY_PATTERN = re.compile(r'[,{]\s*"(?:[^"\\]|\\.)*"\s*:?\s*$')
+
+REPAIR_PROMPT = PromptTemplate(
+    template=(
+        "The text below should be JSON matching the schema, but parsing it "
+        "failed with this error:\n{error}\n\n"
+        "{format_instructions}\n\n"
+        "TEXT:\n{text}\n\n"
+        "Return only the corrected JSON, keeping all of its content."
+    ),
+    input_variables=["error", "format_instructions", "text"],
+)
+
+
+def repair_json_text(text: str) -> str:
+    """
+    Fix the common ways LLM JSON output is malformed.
+
+    Strips code fences and text around the first JSON value, drops
+    trailing commas, and closes strings, arrays and objects left open by a
+    truncated completion.
+    """
+    fence = CODE_FENCE_PATTERN.search(text)
+    if fence:
+        text = fence.group(1)
+
+    starts = [
+        index for index in (text.find("{"), text.find("[")) if index >= 0
+    ]
+    if not starts:
+        return text.strip()
+    text = text[min(starts) :]
+
+    repaired = []
+    open_brackets = []
+    in_string = escaped = False
+
+    for char in text:
+        if in_string:
+            repaired.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            open_brackets.append("}" if char == "{" else "]")
+        elif char in "}]":
+            # Trailing commas before a closing bracket
+            while repaired and repaired[-1] in ", \n\r\t":
+                repaired.pop()
+            if open_brackets:
+                open_brackets.pop()
+
+        repaired.append(char)
+
+        # Anything after the first complete value is trailing text
+        if not open_brackets:
+            break
+
+    if in_string:
+        repaired.append('"')
+
+    repaired_text = "".join(repaired).rstrip(", \n\r\t")
+
+    if open_brackets:
+        # Truncated output, drop a key left without a value. Strings in an
+        # array are values, so only an object's trailing key is dropped.
+        dangling_key = DANGLING_KEY_PATTERN.search(repaired_text)
+        if dangling_key and open_brackets[-1] == "}":
+            repaired_text = repaired_text[: dangling_key.start() + 1]
+            repaired_text = repaired_text.rstrip(", \n\r\t")
+
+        repaired_text += "".join(reversed(open_brackets))
+
+    return repaired_text
+
+
+class OutputRepairStats:
+    """Outcomes of parsing each response schema."""
+
+    OUTCOMES = ("parsed", "repaired_locally", "repaired_by_model", "failed")
+
+    def __init__(self):
+        self._counters = defaultdict(
+            lambda: {outcome: 0 for outcome in self.OUTCOMES}
+        )
+        self._lock = threading.Lock()
+
+    def record(self, schema_name: str, outcome: str) -> None:
+        with self._lock:
+            self._counters[schema_name][outcome] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                name: dict(counters)
+                for name, counters in self._counters.items()
+            }
+
+
+OUTPUT_REPAIR_STATS = OutputRepairStats()
+
+
+def get_output_repair_metrics() -> dict:
+    return OUTPUT_REPAIR_STATS.snapshot()
+
+
+class RepairingPydanticOutputParser(PydanticOutputParser):
+    """
+    PydanticOutputParser that repairs malformed output instead of failing.
+
+    Output that does not parse is first fixed locally, then, only if that
+    fails, sent with the parsing error to the repair model route, so one
+    bad completion does not fail the whole pipeline.
+    """
+
+    repair_route: Optional[ModelRoute] = None
+
+    @classmethod
+    def from_parser(
+        cls, parser: PydanticOutputParser, repair_route: ModelRoute | None
+    ) -> "RepairingPydanticOutputParser":
+        return cls(
+            pydantic_object=parser.pydantic_object, repair_route=repair_route
+        )
+
+    @property
+    def schema_name(self) -> str:
+        return self.pydantic_object.__name__
+
+    def _validate_text(self, text: str) -> Any:
+        return self.pydantic_object.model_validate(
+            json.loads(repair_json_text(text))
+        )
+
+    def _repair_locally(self, text: str) -> Any | None:
+        try:
+            parsed = self._validate_text(text)
+        except (ValueError, ValidationError):
+            return None
+
+        OUTPUT_REPAIR_STATS.record(self.schema_name, "repaired_locally")
+        return parsed
+
+    def _build_repair_request(self, text: str, error: Exception):
+        # The repair runs inside the chain's rate limited call, so it is not
+        # limited again, which could deadlock when every slot is repairing
+        chat_model = CLIENTS.get_chat_model(self.repair_route).with_config(
+            callbacks=[
+                RouteMetricsCallbackHandler(
+                    self.repair_route,
+                    ROUTE_METRICS,
+                    f"{self.schema_name}Repair",
+                )
+            ]
+        )
+        repair_prompt = REPAIR_PROMPT.format(
+            error=str(error),
+            format_instructions=self.get_format_instructions(),
+            text=text,
+        )
+
+        return chat_model, repair_prompt
+
+    def _finish_model_repair(
+        self, repaired_text: str, error: OutputParserException
+    ) -> Any:
+        try:
+            parsed = self._validate_text(repaired_text)
+        except (ValueError, ValidationError):
+            return self._fail(error)
+
+        OUTPUT_REPAIR_STATS.record(self.schema_name, "repaired_by_model")
+        return parsed
+
+    def _fail(self, error: OutputParserException):
+        OUTPUT_REPAIR_STATS.record(self.schema_name, "failed")
+
+        message = f"Could not repair {self.schema_name} output: {error}"
+        file_logger.error(message)
+        stream_logger.error(message)
+
+        raise error
+
+    def parse_result(self, result, *, partial: bool = False) -> Any:
+        try:
+            parsed = super().parse_result(result, partial=partial)
+        except OutputParserException as e:
+            text = result[0].text
+
+            parsed = self._repair_locally(text)
+            if parsed is not None:
+                return parsed
+
+            if self.repair_route is None:
+                return self._fail(e)
+
+            chat_model, repair_prompt = self._build_repair_request(text, e)
+            try:
+                repaired_message = chat_model.invoke(repair_prompt)
+            except Exception as repair_error:
+                file_logger.error(f"Repair request failed: {repair_error}")
+                return self._fail(e)
+
+            return self._finish_model_repair(repaired_message.content, e)
+
+        OUTPUT_REPAIR_STATS.record(self.schema_name, "parsed")
+        return parsed
+
+    async def aparse_result(self, result, *, partial: bool = False) -> Any:
+        try:
+            parsed = super().parse_result(result, partial=partial)
+        except OutputParserException as e:
+            text = result[0].text
+
+            parsed = self._repair_locally(text)
+            if parsed is not None:
+                return parsed
+
+            if self.repair_route is None:
+                return self._fail(e)
+
+            chat_model, repair_prompt = self._build_repair_request(text, e)
+            try:
+                repaired_message = await chat_model.ainvoke(repair_prompt)
+            except Exception as repair_error:
+                file_logger.error(f"Repair request failed: {repair_error}")
+                return self._fail(e)
+
+            return self._finish_model_repair(repaired_message.content, e)
+
+        OUTPUT_REPAIR_STATS.record(self.schema_name, "parsed")
+        return parsed
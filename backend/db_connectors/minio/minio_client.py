@@ -2,15 +2,22 @@
 Helper module to connect to MinIO and perform operations like uploading files.
 """
 
+import contextvars
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
+from itertools import islice
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 import pandas as pd
 from config import MINIO_ACCESS_KEY, MINIO_ENDPOINT, MINIO_SECRET_KEY
 from general_utils.logging import get_logger
+from general_utils.tracing_utils import TracedClient, traced
 from langchain_community.document_loaders.s3_file import S3FileLoader
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 
 file_logger = get_logger(
     "file_" + __name__,
@@ -23,6 +30,40 @@ stream_logger = get_logger(
 )
 
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Kept below the default urllib3 pool size of the MinIO client (10) so
+# parallel transfers reuse pooled connections instead of opening new ones
+DEFAULT_MAX_WORKERS = 8
+
+
+class MinioResponseStream(io.RawIOBase):
+    """
+    Read-only file-like adapter over a MinIO HTTP response.
+
+    Bytes are pulled from the socket on demand, so consumers such as
+    pd.read_csv only ever hold one buffer in memory. Closing the stream
+    closes the response and releases the connection back to the pool.
+    """
+
+    def __init__(self, response):
+        self._response = response
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._response.readinto(buffer)
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._response.close()
+                self._response.release_conn()
+            finally:
+                super().close()
+
+
 class MinioClient:
     def __init__(self):
         """
@@ -33,12 +74,18 @@ class MinioClient:
     def _init_client(self):
         """
         Initialize the MinIO client with the necessary configuration.
+
+        Every MinIO API call, including calls made through minio_client
+        by other modules, runs in a tracing span.
         """
-        return Minio(
-            endpoint=MINIO_ENDPOINT,
-            access_key=MINIO_ACCESS_KEY,
-            secret_key=MINIO_SECRET_KEY,
-            secure=False,  # Set to True if using HTTPS
+        return TracedClient(
+            Minio(
+                endpoint=MINIO_ENDPOINT,
+                access_key=MINIO_ACCESS_KEY,
+                secret_key=MINIO_SECRET_KEY,
+                secure=False,  # Set to True if using HTTPS
+            ),
+            "minio",
         )
 
     def upload_file(self, bucket_name, destination_file_name, file_path):
@@ -75,16 +122,72 @@ class MinioClient:
             file_logger.error(f"Failed to download file: {e}")
             stream_logger.error(f"Failed to download file: {e}")
 
-    def list_files(self, bucket_name) -> list:
+    def iter_files(
+        self,
+        bucket_name,
+        prefix: str | None = None,
+        recursive: bool = True,
+        start_after: str | None = None,
+    ) -> Iterator[str]:
+        """
+        Lazily yield file names in the specified MinIO bucket.
+
+        Objects are fetched page by page from MinIO as the iterator is
+        consumed, so memory does not grow with the size of the bucket.
+        """
+        objects = self.minio_client.list_objects(
+            bucket_name,
+            prefix=prefix,
+            recursive=recursive,
+            start_after=start_after,
+        )
+
+        for obj in objects:
+            if not obj.is_dir:
+                yield obj.object_name
+
+    def list_files_page(
+        self,
+        bucket_name,
+        prefix: str | None = None,
+        start_after: str | None = None,
+        page_size: int = 1000,
+    ) -> dict:
+        """
+        List one page of files in the specified MinIO bucket.
+
+        Pass the returned next_start_after back in to fetch the next page;
+        it is None once the listing is exhausted.
+        """
+        try:
+            file_list = list(
+                islice(
+                    self.iter_files(
+                        bucket_name, prefix=prefix, start_after=start_after
+                    ),
+                    page_size,
+                )
+            )
+            return {
+                "files": file_list,
+                "next_start_after": (
+                    file_list[-1] if len(file_list) == page_size else None
+                ),
+            }
+        except Exception as e:
+            file_logger.error(f"Failed to list files: {e}")
+            stream_logger.error(f"Failed to list files: {e}")
+            return {"files": [], "next_start_after": None}
+
+    def list_files(self, bucket_name, prefix: str | None = None) -> list:
         """
         List all files in the specified MinIO bucket.
         """
         try:
-            objects = self.minio_client.list_objects(
-                bucket_name, recursive=True
+            file_list = list(self.iter_files(bucket_name, prefix=prefix))
+            stream_logger.info(
+                f"Listed {len(file_list)} files in bucket '{bucket_name}'."
             )
-            file_list = [obj.object_name for obj in objects]
-            stream_logger.info(f"Files in bucket '{bucket_name}': {file_list}")
             return file_list
         except Exception as e:
             file_logger.error(f"Failed to list files: {e}")
@@ -104,6 +207,226 @@ class MinioClient:
             file_logger.error(f"Failed to delete file: {e}")
             stream_logger.error(f"Failed to delete file: {e}")
 
+    def delete_files(self, bucket_name, file_names: Iterable[str]) -> list:
+        """
+        Delete many files from the specified MinIO bucket.
+
+        Uses the S3 multi-object delete API, which removes up to 1000
+        objects per request. Returns the names of files that failed.
+        """
+        delete_objects = (DeleteObject(file_name) for file_name in file_names)
+
+        failed_files = []
+        try:
+            # remove_objects is lazy, errors are only sent once iterated
+            for error in self.minio_client.remove_objects(
+                bucket_name, delete_objects
+            ):
+                failed_files.append(error.name)
+                file_logger.error(
+                    f"Failed to delete file '{error.name}': {error.message}"
+                )
+        except Exception as e:
+            file_logger.error(f"Failed to delete files: {e}")
+            stream_logger.error(f"Failed to delete files: {e}")
+            raise e
+
+        stream_logger.info(
+            f"Bulk delete in bucket '{bucket_name}' finished with {len(failed_files)} failures."
+        )
+        return failed_files
+
+    def delete_prefix(self, bucket_name, prefix: str) -> list:
+        """
+        Delete every file under a prefix in the specified MinIO bucket.
+        """
+        return self.delete_files(
+            bucket_name, self.iter_files(bucket_name, prefix=prefix)
+        )
+
+    def _run_parallel(
+        self,
+        operation: Callable,
+        tasks: list[tuple],
+        description: str,
+        max_workers: int,
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> list:
+        """
+        Run operation(*task) for each task on a thread pool.
+
+        Returns the tasks that failed. progress_callback, if given, is
+        called with (completed, total) after each task finishes.
+        """
+        total = len(tasks)
+        failed_tasks = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each transfer runs in a copy of the caller's context, so its
+            # span belongs to the caller's trace
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run, operation, *task
+                ): task
+                for task in tasks
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed_tasks.append(futures[future])
+                    file_logger.error(f"Failed to {description}: {e}")
+
+                if progress_callback:
+                    progress_callback(completed, total)
+
+        stream_logger.info(
+            f"Finished {description} for {total} files with {len(failed_tasks)} failures."
+        )
+        return failed_tasks
+
+    def upload_files(
+        self,
+        bucket_name,
+        files: dict[str, str | Path],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list:
+        """
+        Upload many files to the specified MinIO bucket in parallel.
+
+        files maps destination object names to local file paths. Returns
+        the object names that failed to upload.
+        """
+        if not self.minio_client.bucket_exists(bucket_name):
+            self.minio_client.make_bucket(bucket_name)
+            stream_logger.info(f"Bucket '{bucket_name}' created.")
+
+        failed_tasks = self._run_parallel(
+            self.minio_client.fput_object,
+            [
+                (bucket_name, object_name, str(file_path))
+                for object_name, file_path in files.items()
+            ],
+            "upload file",
+            max_workers,
+            progress_callback,
+        )
+        return [object_name for _, object_name, _ in failed_tasks]
+
+    def download_files(
+        self,
+        bucket_name,
+        file_names: Iterable[str],
+        destination_dir: str | Path,
+        prefix: str = "",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list:
+        """
+        Download many files from the specified MinIO bucket in parallel.
+
+        Files are written under destination_dir using their object name
+        with prefix stripped. Returns the names that failed to download.
+        """
+        destination_dir = Path(destination_dir)
+
+        failed_tasks = self._run_parallel(
+            self.minio_client.fget_object,
+            [
+                (
+                    bucket_name,
+                    file_name,
+                    str(destination_dir / file_name.removeprefix(prefix)),
+                )
+                for file_name in file_names
+            ],
+            "download file",
+            max_workers,
+            progress_callback,
+        )
+        return [file_name for _, file_name, _ in failed_tasks]
+
+    def sync_prefix_to_directory(
+        self,
+        bucket_name,
+        prefix: str,
+        destination_dir: str | Path,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> dict:
+        """
+        Download files under a prefix that are missing locally or whose
+        size differs from the local copy.
+        """
+        destination_dir = Path(destination_dir)
+
+        to_download = []
+        for obj in self.minio_client.list_objects(
+            bucket_name, prefix=prefix, recursive=True
+        ):
+            if obj.is_dir:
+                continue
+
+            local_path = destination_dir / obj.object_name.removeprefix(prefix)
+            if (
+                not local_path.exists()
+                or local_path.stat().st_size != obj.size
+            ):
+                to_download.append(obj.object_name)
+
+        failed_files = self.download_files(
+            bucket_name,
+            to_download,
+            destination_dir,
+            prefix=prefix,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
+
+        return {"synced_files": len(to_download), "failed_files": failed_files}
+
+    def sync_directory_to_prefix(
+        self,
+        bucket_name,
+        source_dir: str | Path,
+        prefix: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> dict:
+        """
+        Upload local files that are missing under a prefix or whose size
+        differs from the stored object.
+        """
+        source_dir = Path(source_dir)
+
+        remote_sizes = {
+            obj.object_name: obj.size
+            for obj in self.minio_client.list_objects(
+                bucket_name, prefix=prefix, recursive=True
+            )
+            if not obj.is_dir
+        }
+
+        to_upload = {}
+        for file_path in source_dir.rglob("*"):
+            if not file_path.is_file():
+                continue
+
+            object_name = prefix + file_path.relative_to(source_dir).as_posix()
+            if remote_sizes.get(object_name) != file_path.stat().st_size:
+                to_upload[object_name] = file_path
+
+        failed_files = self.upload_files(
+            bucket_name,
+            to_upload,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
+
+        return {"synced_files": len(to_upload), "failed_files": failed_files}
+
     def delete_bucket(self, bucket_name):
         """
         Delete the specified MinIO bucket.
@@ -115,6 +438,66 @@ class MinioClient:
             file_logger.error(f"Failed to delete bucket: {e}")
             stream_logger.error(f"Failed to delete bucket: {e}")
 
+    def get_file_stream(
+        self,
+        bucket_name,
+        file_name,
+        offset: int = 0,
+        length: int = 0,
+        buffer_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> io.BufferedReader:
+        """
+        Open a file from the specified MinIO bucket as a buffered stream.
+
+        offset and length are sent as an HTTP range request, so only the
+        requested byte range is transferred (length=0 reads to the end).
+        The caller is responsible for closing the returned stream.
+        """
+        response = self.minio_client.get_object(
+            bucket_name, file_name, offset=offset, length=length
+        )
+
+        return io.BufferedReader(
+            MinioResponseStream(response), buffer_size=buffer_size
+        )
+
+    def iter_file_chunks(
+        self,
+        bucket_name,
+        file_name,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+        length: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Yield a file from the specified MinIO bucket chunk by chunk.
+        """
+        response = self.minio_client.get_object(
+            bucket_name, file_name, offset=offset, length=length
+        )
+
+        try:
+            yield from response.stream(chunk_size)
+        finally:
+            response.close()
+            response.release_conn()
+
+    def get_file_range_as_bytes(
+        self, bucket_name, file_name, offset: int, length: int
+    ) -> bytes | None:
+        """
+        Get a byte range of a file from the specified MinIO bucket.
+        """
+        try:
+            with self.get_file_stream(
+                bucket_name, file_name, offset=offset, length=length
+            ) as stream:
+                return stream.read()
+        except Exception as e:
+            file_logger.error(f"Failed to get file range: {e}")
+            stream_logger.error(f"Failed to get file range: {e}")
+            return None
+
     def get_csv_data(self, bucket_name, file_name) -> pd.DataFrame | None:
         """
         Get CSV data from the specified MinIO bucket.
@@ -125,26 +508,47 @@ class MinioClient:
             )
 
         try:
-            response = self.minio_client.get_object(bucket_name, file_name)
-
-            # For large files
-            chunk_size = 40960
-            csv_bytes = b"".join(response.stream(chunk_size))
-            csv_buffer = BytesIO(csv_bytes)
+            # Parse straight from the response instead of buffering the raw
+            # bytes first
+            with self.get_file_stream(bucket_name, file_name) as stream:
+                csv_data = pd.read_csv(stream)
 
             stream_logger.info(
                 f"CSV data retrieved from '{file_name}' in bucket '{bucket_name}'."
             )
 
-            response.close()
-            response.release_conn()
-
-            return pd.read_csv(csv_buffer)
+            return csv_data
         except Exception as e:
             file_logger.error(f"Failed to get CSV data: {e}")
             stream_logger.error(f"Failed to get CSV data: {e}")
             return None
 
+    def iter_csv_chunks(
+        self,
+        bucket_name,
+        file_name,
+        chunksize: int = 100_000,
+        **read_csv_kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield CSV data from the specified MinIO bucket as DataFrames of at
+        most chunksize rows, keeping memory bounded for large exports.
+        """
+        if ".csv" not in file_name:
+            raise Exception(
+                f"File '{file_name}' is not a CSV file. Please provide a valid CSV file."
+            )
+
+        with self.get_file_stream(bucket_name, file_name) as stream:
+            with pd.read_csv(
+                stream, chunksize=chunksize, **read_csv_kwargs
+            ) as reader:
+                yield from reader
+
+        stream_logger.info(
+            f"CSV data streamed from '{file_name}' in bucket '{bucket_name}'."
+        )
+
     def get_file_buffer_as_bytes(
         self, bucket_name, file_name
     ) -> BytesIO | None:
@@ -152,20 +556,17 @@ class MinioClient:
         Get a file from the specified MinIO bucket as a BytesIO object.
         """
         try:
-            response = self.minio_client.get_object(bucket_name, file_name)
-
-            # For large files
-            chunk_size = 8192
-            file_bytes = b"".join(response.stream(chunk_size))
-            file_buffer = BytesIO(file_bytes)
+            # Write chunks straight into the buffer so the file is only held
+            # in memory once
+            file_buffer = BytesIO()
+            for chunk in self.iter_file_chunks(bucket_name, file_name):
+                file_buffer.write(chunk)
+            file_buffer.seek(0)
 
             stream_logger.info(
                 f"File '{file_name}' retrieved from bucket '{bucket_name}'."
             )
 
-            response.close()
-            response.release_conn()
-
             return file_buffer
         except Exception as e:
             file_logger.error(f"Failed to get file buffer: {e}")
@@ -173,6 +574,7 @@ class MinioClient:
 
             return None
 
+    @traced("minio.s3_file_loader", kind="CLIENT")
     def get_object_using_langchain_s3_loader(self, bucket_name, object_key):
         """
         Get an object from the specified MinIO bucket using the Langchain S3 loader.
@@ -6,7 +6,6 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
-import bcrypt
 from config import (
     POSTGRES_DB,
     POSTGRES_HOST,
@@ -14,9 +13,10 @@ from config import (
     POSTGRES_PORT,
     POSTGRES_USER,
 )
+from general_utils.json_utils import rows_to_dicts
 from general_utils.logging import get_logger
-from general_utils.utils import serialize_for_json
-from langchain_community.vectorstores import PGVector
+from general_utils.tracing_utils import trace_span
+from general_utils.utils import build_select_list
 from sqlalchemy import Result, create_engine, text
 from sqlalchemy.orm import sessionmaker
 
@@ -32,6 +32,30 @@ stream_logger = get_logger(
 
 DATABASE_URL = f"postgresql+psycopg2://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
+# Fields selectable on the CV analysis jobs list endpoint
+CV_ANALYSIS_JOB_SUMMARY_COLUMNS = {
+    "id": "caj.id",
+    "cv_id": "caj.cv_id",
+    "company_name": "caj.company_name",
+    "job_title": "caj.job_title",
+    "status": "caj.status",
+    "match_score": "caj.match_score",
+    "file_name": "cd.file_name",
+    "inserted_at": "caj.inserted_at",
+    "updated_at": "caj.updated_at",
+}
+CV_ANALYSIS_JOB_SUMMARY_DEFAULT_FIELDS = list(CV_ANALYSIS_JOB_SUMMARY_COLUMNS)
+
+# Dimensions LLM usage can be grouped by on the usage summary endpoint
+LLM_USAGE_GROUP_BY_COLUMNS = {
+    "day": "CAST(lu.inserted_at AS DATE)",
+    "endpoint": "lu.endpoint",
+    "chain_name": "lu.chain_name",
+    "route_name": "lu.route_name",
+    "model": "lu.model",
+}
+LLM_USAGE_DEFAULT_GROUP_BY = ["day", "endpoint", "chain_name"]
+
 
 class PostgresClient:
     def __init__(self):
@@ -49,7 +73,14 @@ class PostgresClient:
 
     def query_db(self, query, params=None) -> Result[Any] | None:
         try:
-            with self._get_connection_context() as session:
+            with trace_span(
+                "postgres.query_db",
+                kind="CLIENT",
+                attributes={
+                    "db.system": "postgresql",
+                    "db.statement": " ".join(query.split()),
+                },
+            ), self._get_connection_context() as session:
                 result = session.execute(text(query), params=params)
 
                 session.commit()
@@ -118,21 +149,49 @@ class PostgresClient:
             stream_logger.error(f"Database error getting user by email: {e}")
             raise e
 
-    def create_user(self, username: str, email: str, password: str) -> Dict:
-        """Create a new user in the database."""
-        # Check if user already exists
-        if self.get_user_by_username(username).get("message") == "User found!":
-            return {"message": "User already exists!"}
-
+    def get_user_by_login(self, login: str) -> Dict:
+        """Get user data by username or email from database."""
         try:
-            # Hash the password
-            hashed_password = bcrypt.hashpw(
-                password.encode("utf-8"), bcrypt.gensalt()
-            ).decode("utf-8")
+            query = """
+                SELECT id, username, email, hashed_password
+                FROM users
+                WHERE username = :login OR email = :login
+                ORDER BY username = :login DESC
+                LIMIT 1
+            """
+            result = self.query_db(query, {"login": login})
+
+            if result:
+                row = result.fetchone()
+                if row:
+                    return {
+                        "id": row[0],
+                        "username": row[1],
+                        "email": row[2],
+                        "hashed_password": row[3],
+                        "message": "User found!",
+                    }
+            return {"message": "User not found!"}
+
+        except Exception as e:
+            file_logger.error(f"Database error getting user by login: {e}")
+            stream_logger.error(f"Database error getting user by login: {e}")
+            raise e
+
+    def create_user(
+        self, username: str, email: str, hashed_password: str
+    ) -> Dict:
+        """
+        Create a new user in the database.
 
+        Existing usernames or emails are detected by the unique constraints
+        in the same statement, instead of a separate lookup beforehand.
+        """
+        try:
             query = """
                 INSERT INTO users (username, email, hashed_password)
                 VALUES (:username, :email, :hashed_password)
+                ON CONFLICT DO NOTHING
                 RETURNING id, username, email
             """
 
@@ -163,10 +222,127 @@ class PostgresClient:
             stream_logger.error(f"Database error creating user: {e}")
             raise e
 
+    def get_cv_by_file_hash(self, file_hash: str, username: str) -> Dict:
+        """Check whether a CV with this content hash is already stored."""
+        try:
+            query = """
+                SELECT
+                    cd.file_path,
+                    u.username = :username AS owned_by_user
+                FROM
+                    cv_data cd
+                    JOIN users u
+                        ON cd.user_id = u.id
+                WHERE
+                    cd.file_hash = :file_hash
+                ORDER BY
+                    owned_by_user DESC
+                LIMIT 1
+            """
+
+            result = self.query_db(
+                query, {"file_hash": file_hash, "username": username}
+            )
+
+            row = result.fetchone() if result else None
+            if row:
+                return {
+                    "exists": True,
+                    "exists_for_user": row[1],
+                    "object_key": "/".join(row[0].split("/")[-2:]),
+                    "message": "File already exists!",
+                }
+            return {
+                "exists": False,
+                "exists_for_user": False,
+                "object_key": None,
+                "message": "File not found!",
+            }
+
+        except Exception as e:
+            file_logger.error(f"Database error getting CV by file hash: {e}")
+            stream_logger.error(f"Database error getting CV by file hash: {e}")
+            raise e
+
+    def copy_cv_data_to_user(
+        self, file_hash: str, username: str, file_name: str
+    ) -> Dict:
+        """
+        Create a CV row for a user from an existing row with the same
+        content, reusing its stored object and extracted text.
+        """
+        try:
+            query = """
+                INSERT INTO cv_data(
+                    user_id,
+                    file_path,
+                    file_name,
+                    file_hash,
+                    raw_text,
+                    extracted_text,
+                    contact,
+                    certifications,
+                    skills,
+                    summary,
+                    languages,
+                    education,
+                    experience,
+                    projects
+                )
+                SELECT
+                    u.id,
+                    cd.file_path,
+                    :file_name,
+                    cd.file_hash,
+                    cd.raw_text,
+                    cd.extracted_text,
+                    cd.contact,
+                    cd.certifications,
+                    cd.skills,
+                    cd.summary,
+                    cd.languages,
+                    cd.education,
+                    cd.experience,
+                    cd.projects
+                FROM
+                    cv_data cd,
+                    users u
+                WHERE
+                    cd.file_hash = :file_hash
+                    AND u.username = :username
+                ORDER BY cd.id
+                LIMIT 1
+                ON CONFLICT (file_hash, user_id) DO NOTHING
+                RETURNING id, file_path;
+            """
+
+            result = self.query_db(
+                query,
+                {
+                    "file_hash": file_hash,
+                    "username": username,
+                    "file_name": file_name,
+                },
+            )
+
+            row = result.fetchone() if result else None
+            if row:
+                return {
+                    "cv_id": row[0],
+                    "object_key": "/".join(row[1].split("/")[-2:]),
+                    "message": "CV data reused from existing file!",
+                }
+            return {"message": "CV data not copied!"}
+
+        except Exception as e:
+            file_logger.error(f"Database error copying CV data: {e}")
+            stream_logger.error(f"Database error copying CV data: {e}")
+            raise e
+
     def create_cv_analysis_job(
         self,
         result: dict,
-        username: str,
+        user_id: int,
         cv_file_hash: str,
         company_name: str,
         job_title: str,
@@ -174,46 +350,45 @@ class PostgresClient:
         """Create a new CV analysis job in the database."""
         try:
             query = """
-                WITH user_id AS (
-                SELECT
-                    u.id
-                FROM
-                    users u
-                WHERE
-                    u.username = :username
-                ),
-                cv_id as (
+                WITH cv_id as (
                 SELECT
                     cd.id
                 FROM
                     cv_data cd
                 WHERE
                     cd.file_hash = :cv_file_hash
+                    AND cd.user_id = :user_id
                 )
                 INSERT INTO cv_analysis_jobs(
                     user_id,
                     cv_id,
                     company_name,
                     job_title,
+                    status,
+                    match_score,
                     raw_analysis_result
                 )
                 SELECT
-                    user_id.id,
+                    :user_id,
                     cv_id.id,
                     :company_name,
                     :job_title,
+                    :status,
+                    :match_score,
                     :result
-                FROM user_id, cv_id
+                FROM cv_id
                 RETURNING id;
             """
 
             job_result = self.query_db(
                 query,
                 {
-                    "username": username,
+                    "user_id": user_id,
                     "cv_file_hash": cv_file_hash,
                     "company_name": company_name,
                     "job_title": job_title,
+                    "status": "completed",
+                    "match_score": result.get("match_score"),
                     "result": json.dumps(result),
                 },
             )
@@ -232,7 +407,7 @@ class PostgresClient:
             )
             raise e
 
-    def get_cv_analysis_jobs(self, username):
+    def get_cv_analysis_jobs(self, user_id):
         """Get all CV analysis jobs for a user from the database."""
         try:
             query = """
@@ -244,19 +419,12 @@ class PostgresClient:
                         ON caj.user_id = u.id
                     LEFT JOIN cv_data cd
                         ON caj.cv_id = cd.id
-                WHERE u.username = :username
+                WHERE caj.user_id = :user_id
             """
 
-            result = self.query_db(query, {"username": username})
+            result = self.query_db(query, {"user_id": user_id})
 
-            return (
-                [
-                    serialize_for_json(row._asdict())
-                    for row in result.fetchall()
-                ]
-                if result
-                else None
-            )
+            return rows_to_dicts(result.fetchall()) if result else None
 
         except Exception as e:
 
@@ -267,6 +435,78 @@ class PostgresClient:
 
             raise e
 
+    def get_cv_analysis_job_summaries(
+        self,
+        user_id: int,
+        limit: int = 20,
+        before_id: int | None = None,
+        fields: list[str] | None = None,
+    ) -> Dict:
+        """
+        Get one page of lightweight CV analysis job summaries for a user,
+        newest first.
+
+        Uses keyset pagination on (inserted_at, id), served by the
+        (user_id, inserted_at DESC, id DESC) index: pass the returned
+        next_before_id to fetch the next page.
+        """
+        select_list = build_select_list(
+            fields,
+            CV_ANALYSIS_JOB_SUMMARY_COLUMNS,
+            CV_ANALYSIS_JOB_SUMMARY_DEFAULT_FIELDS,
+        )
+
+        try:
+            # caj.id is always selected to build the next page cursor
+            query = f"""
+                SELECT
+                    caj.id AS _cursor_id, {select_list}
+                FROM
+                    cv_analysis_jobs caj
+                    LEFT JOIN cv_data cd
+                        ON caj.cv_id = cd.id
+                WHERE
+                    caj.user_id = :user_id
+                    AND (
+                        CAST(:before_id AS INTEGER) IS NULL
+                        OR (caj.inserted_at, caj.id) < (
+                            SELECT
+                                cursor_caj.inserted_at, cursor_caj.id
+                            FROM
+                                cv_analysis_jobs cursor_caj
+                            WHERE
+                                cursor_caj.id = :before_id
+                                AND cursor_caj.user_id = :user_id
+                        )
+                    )
+                ORDER BY caj.inserted_at DESC, caj.id DESC
+                LIMIT :limit
+            """
+
+            result = self.query_db(
+                query,
+                {"user_id": user_id, "before_id": before_id, "limit": limit},
+            )
+
+            rows = rows_to_dicts(result.fetchall()) if result else []
+            cursor_ids = [row.pop("_cursor_id") for row in rows]
+
+            return {
+                "items": rows,
+                "next_before_id": (
+                    cursor_ids[-1] if len(cursor_ids) == limit else None
+                ),
+            }
+
+        except Exception as e:
+            file_logger.error(
+                f"Database error getting CV analysis job summaries: {e}"
+            )
+            stream_logger.error(
+                f"Database error getting CV analysis job summaries: {e}"
+            )
+            raise e
+
     def get_cv_analysis_job_by_id(self, job_id):
         """Get a CV analysis job by id from the database."""
         try:
@@ -282,7 +522,9 @@ class PostgresClient:
 
             result = self.query_db(query, {"job_id": job_id})
 
-            return serialize_for_json(result.fetchone()) if result else None
+            row = result.fetchone() if result else None
+
+            return row._asdict() if row else None
 
         except Exception as e:
             file_logger.error(
@@ -293,6 +535,292 @@ class PostgresClient:
             )
             raise e
 
+    def get_dashboard_summary(self, user_id: int, recent_limit: int = 5):
+        """
+        Get dashboard counts and recent items for a user in one round trip.
+
+        Company and job title counts cover all ingested embeddings, as they
+        are shared between users.
+        """
+        try:
+            query = """
+                SELECT
+                    (
+                        SELECT COUNT(*)
+                        FROM cv_data cd
+                        WHERE cd.user_id = :user_id
+                    ) AS total_cvs_uploaded,
+                    (
+                        SELECT COUNT(DISTINCT lpe.cmetadata->>'company_name')
+                        FROM langchain_pg_embedding lpe
+                    ) AS total_companies,
+                    (
+                        SELECT COUNT(DISTINCT lpe.cmetadata->>'job_title')
+                        FROM langchain_pg_embedding lpe
+                    ) AS total_job_titles,
+                    (
+                        SELECT COUNT(*)
+                        FROM cv_analysis_jobs caj
+                        WHERE caj.user_id = :user_id
+                    ) AS total_ai_analysis_jobs,
+                    (
+                        SELECT COALESCE(json_agg(recent_cvs), '[]'::json)
+                        FROM (
+                            SELECT
+                                cd.id,
+                                cd.file_name,
+                                cd.summary,
+                                cd.inserted_at,
+                                cd.updated_at
+                            FROM cv_data cd
+                            WHERE cd.user_id = :user_id
+                            ORDER BY cd.id DESC
+                            LIMIT :recent_limit
+                        ) recent_cvs
+                    ) AS recent_cvs,
+                    (
+                        SELECT COALESCE(json_agg(recent_jobs), '[]'::json)
+                        FROM (
+                            SELECT
+                                caj.id,
+                                caj.company_name,
+                                caj.job_title,
+                                caj.status,
+                                caj.match_score,
+                                caj.inserted_at
+                            FROM cv_analysis_jobs caj
+                            WHERE caj.user_id = :user_id
+                            ORDER BY caj.inserted_at DESC, caj.id DESC
+                            LIMIT :recent_limit
+                        ) recent_jobs
+                    ) AS recent_cv_analysis_jobs
+            """
+
+            result = self.query_db(
+                query, {"user_id": user_id, "recent_limit": recent_limit}
+            )
+
+            row = result.fetchone() if result else None
+
+            return row._asdict() if row else None
+
+        except Exception as e:
+            file_logger.error(f"Database error getting dashboard summary: {e}")
+            stream_logger.error(
+                f"Database error getting dashboard summary: {e}"
+            )
+            raise e
+
+    def insert_llm_usage_records(self, records: list[dict]):
+        """Insert a batch of LLM usage records into the database."""
+        try:
+            query = """
+                INSERT INTO llm_usage(
+                    username,
+                    endpoint,
+                    chain_name,
+                    route_name,
+                    model,
+                    input_tokens,
+                    output_tokens,
+                    latency_seconds,
+                    cost_usd,
+                    cache_hit
+                )
+                VALUES (
+                    :username,
+                    :endpoint,
+                    :chain_name,
+                    :route_name,
+                    :model,
+                    :input_tokens,
+                    :output_tokens,
+                    :latency_seconds,
+                    :cost_usd,
+                    :cache_hit
+                );
+            """
+
+            self.query_db(query, records)
+
+        except Exception as e:
+            file_logger.error(f"Database error inserting LLM usage: {e}")
+            stream_logger.error(f"Database error inserting LLM usage: {e}")
+            raise e
+
+    def get_llm_usage_summary(
+        self,
+        username: str,
+        start_date=None,
+        end_date=None,
+        group_by: list[str] | None = None,
+    ):
+        """
+        Get a user's LLM usage aggregated by the requested dimensions,
+        costliest first.
+
+        Dates are inclusive, and an empty bound is open.
+        """
+        select_list = build_select_list(
+            group_by, LLM_USAGE_GROUP_BY_COLUMNS, LLM_USAGE_DEFAULT_GROUP_BY
+        )
+        group_by = group_by or LLM_USAGE_DEFAULT_GROUP_BY
+
+        try:
+            query = f"""
+                SELECT
+                    {select_list},
+                    COUNT(*) AS calls,
+                    COUNT(*) FILTER (WHERE lu.cache_hit) AS cache_hits,
+                    SUM(lu.input_tokens) AS input_tokens,
+                    SUM(lu.output_tokens) AS output_tokens,
+                    SUM(lu.cost_usd) AS cost_usd,
+                    AVG(lu.latency_seconds)
+                        FILTER (WHERE NOT lu.cache_hit)
+                        AS latency_seconds_avg,
+                    PERCENTILE_CONT(0.95) WITHIN GROUP (
+                        ORDER BY lu.latency_seconds
+                    ) FILTER (WHERE NOT lu.cache_hit) AS latency_seconds_p95
+                FROM
+                    llm_usage lu
+                WHERE
+                    lu.username = :username
+                    AND (
+                        CAST(:start_date AS DATE) IS NULL
+                        OR lu.inserted_at >= CAST(:start_date AS DATE)
+                    )
+                    AND (
+                        CAST(:end_date AS DATE) IS NULL
+                        OR lu.inserted_at
+                            < CAST(:end_date AS DATE) + INTERVAL '1 day'
+                    )
+                GROUP BY {", ".join(group_by)}
+                ORDER BY cost_usd DESC
+            """
+
+            result = self.query_db(
+                query,
+                {
+                    "username": username,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            )
+
+            return rows_to_dicts(result.fetchall()) if result else []
+
+        except Exception as e:
+            file_logger.error(f"Database error getting LLM usage: {e}")
+            stream_logger.error(f"Database error getting LLM usage: {e}")
+            raise e
+
+    def get_llm_step_checkpoint(
+        self, step_name: str, input_hash: str, ttl_seconds: int
+    ):
+        """Get the checkpointed output of an LLM step from the database."""
+        try:
+            query = """
+                SELECT lsc.output
+                FROM llm_step_checkpoints lsc
+                WHERE
+                    lsc.step_name = :step_name
+                    AND lsc.input_hash = :input_hash
+                    AND lsc.updated_at
+                        >= now() - make_interval(secs => :ttl_seconds)
+            """
+
+            result = self.query_db(
+                query,
+                {
+                    "step_name": step_name,
+                    "input_hash": input_hash,
+                    "ttl_seconds": ttl_seconds,
+                },
+            )
+
+            row = result.fetchone() if result else None
+
+            return row[0] if row else None
+
+        except Exception as e:
+            file_logger.error(
+                f"Database error getting LLM step checkpoint: {e}"
+            )
+            stream_logger.error(
+                f"Database error getting LLM step checkpoint: {e}"
+            )
+            raise e
+
+    def save_llm_step_checkpoint(
+        self,
+        step_name: str,
+        input_hash: str,
+        model: str,
+        output: dict,
+    ):
+        """Save the output of an LLM step to the database."""
+        try:
+            query = """
+                INSERT INTO llm_step_checkpoints(
+                    step_name,
+                    input_hash,
+                    model,
+                    output
+                )
+                VALUES (
+                    :step_name,
+                    :input_hash,
+                    :model,
+                    :output
+                )
+                ON CONFLICT (step_name, input_hash) DO UPDATE
+                SET
+                    output = EXCLUDED.output,
+                    updated_at = now();
+            """
+
+            self.query_db(
+                query,
+                {
+                    "step_name": step_name,
+                    "input_hash": input_hash,
+                    "model": model,
+                    "output": json.dumps(output),
+                },
+            )
+
+        except Exception as e:
+            file_logger.error(
+                f"Database error saving LLM step checkpoint: {e}"
+            )
+            stream_logger.error(
+                f"Database error saving LLM step checkpoint: {e}"
+            )
+            raise e
+
+    def delete_expired_llm_step_checkpoints(self, ttl_seconds: int) -> int:
+        """Delete LLM step checkpoints older than ttl_seconds."""
+        try:
+            query = """
+                DELETE FROM llm_step_checkpoints lsc
+                WHERE
+                    lsc.updated_at
+                        < now() - make_interval(secs => :ttl_seconds)
+            """
+
+            result = self.query_db(query, {"ttl_seconds": ttl_seconds})
+
+            return result.rowcount if result else 0
+
+        except Exception as e:
+            file_logger.error(
+                f"Database error deleting expired LLM step checkpoints: {e}"
+            )
+            stream_logger.error(
+                f"Database error deleting expired LLM step checkpoints: {e}"
+            )
+            raise e
+
 
 class PGVectorClient:
 
@@ -304,6 +832,9 @@ class PGVectorClient:
         self.pgvector_client = self._get_pgvector_client()
 
     def _get_pgvector_client(self):
+        # Imported here so only processes that use embeddings pay for it
+        from langchain_community.vectorstores import PGVector
+
         return PGVector(
             connection_string=self.connection_string,
             embedding_function=self.embedding_function,
@@ -313,16 +844,30 @@ class PGVectorClient:
 
     def add_texts(self, texts, metadatas):
         try:
-            self.pgvector_client.add_texts(texts, metadatas)
+            with trace_span(
+                "pgvector.add_texts",
+                kind="CLIENT",
+                attributes={
+                    "db.collection": self.collection_name,
+                    "texts": len(texts),
+                },
+            ):
+                self.pgvector_client.add_texts(texts, metadatas)
             stream_logger.info(f"Texts added to database successfully!")
         except Exception as e:
             file_logger.error(f"Failed to add texts: {e}")
             stream_logger.error(f"Failed to add texts: {e}")
 
     def similarity_search(self, query, metadata_filter, k=10):
-        return self.pgvector_client.similarity_search(
-            query, k, metadata_filter
-        )
+        # The query embedding is a child span of the search
+        with trace_span(
+            "pgvector.similarity_search",
+            kind="CLIENT",
+            attributes={"db.collection": self.collection_name, "k": k},
+        ):
+            return self.pgvector_client.similarity_search(
+                query, k, metadata_filter
+            )
 
 
 if __name__ == "__main__":
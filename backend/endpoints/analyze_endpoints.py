@@ -4,8 +4,13 @@ Module to specify analyze endpoints for job research assistant app.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.concurrency import run_in_threadpool
+from general_utils.auth_utils import resolve_user
+from general_utils.clients import ClientContainer, get_clients
+from general_utils.deadline_utils import DeadlineExceededError
+from general_utils.json_utils import FastJSONResponse
+from general_utils.rate_limit_utils import ModelRateLimitError
 from services.analyze_services import AnalyzeServices
 
 router = APIRouter(
@@ -15,119 +20,178 @@ router = APIRouter(
 
 
 @router.post("/extract_jd_urls")
-async def extract_jd_urls(jd_urls: List[str]) -> JSONResponse:
+async def extract_jd_urls(
+    jd_urls: List[str], clients: ClientContainer = Depends(get_clients)
+) -> FastJSONResponse:
     try:
-        response = AnalyzeServices.extract_jd_urls(jd_urls, url_type="jd")
+        response = await AnalyzeServices.extract_jd_urls(
+            clients, jd_urls, url_type="jd"
+        )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="There are no new URLs to extract!",
             )
 
+    except (DeadlineExceededError, ModelRateLimitError):
+        # Answered by the app's exception handlers
+        raise
+
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
 @router.post("/extract_company_urls")
-async def extract_company_urls(company_urls: List[str]) -> JSONResponse:
+async def extract_company_urls(
+    company_urls: List[str], clients: ClientContainer = Depends(get_clients)
+) -> FastJSONResponse:
     try:
-        response = AnalyzeServices.extract_company_urls(
-            company_urls, url_type="company"
+        response = await AnalyzeServices.extract_company_urls(
+            clients, company_urls, url_type="company"
         )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="There are no new URLs to extract!",
             )
 
+    except (DeadlineExceededError, ModelRateLimitError):
+        # Answered by the app's exception handlers
+        raise
+
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
 @router.post("/analyze_cv")
 async def analyze(
-    username: str,
     cv_object_key: str,
     company_name: str,
     job_title: str,
-) -> JSONResponse:
+    force_refresh: bool = False,
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
     try:
-        response = AnalyzeServices.analyze(
-            username, cv_object_key, company_name, job_title
+        # force_refresh runs every step again instead of reusing checkpoints
+        response = await AnalyzeServices.analyze(
+            clients,
+            user,
+            cv_object_key,
+            company_name,
+            job_title,
+            force_refresh,
         )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="Error analyzing CV!",
             )
 
+    except (DeadlineExceededError, ModelRateLimitError):
+        # Answered by the app's exception handlers
+        raise
+
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
 @router.get("/get_cv_analysis_jobs")
-async def get_cv_analysis_jobs(username: str) -> JSONResponse:
+async def get_cv_analysis_jobs(
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
     try:
-        response = AnalyzeServices.get_cv_analysis_jobs(username)
+        response = AnalyzeServices.get_cv_analysis_jobs(clients, user)
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="There are no analysis jobs!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
+        )
+
+
+@router.get("/cv_analysis_jobs")
+async def get_cv_analysis_job_summaries(
+    limit: int = Query(20, ge=1, le=100),
+    before_id: Optional[int] = None,
+    fields: Optional[List[str]] = Query(None),
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
+    try:
+        response = await run_in_threadpool(
+            AnalyzeServices.get_cv_analysis_job_summaries,
+            clients,
+            user,
+            limit,
+            before_id,
+            fields,
+        )
+
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK, content=response
+        )
+
+    except Exception as e:
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
 @router.get("/get_cv_analysis_job_by_id")
-async def get_cv_analysis_job_by_id(job_id: int) -> JSONResponse:
+async def get_cv_analysis_job_by_id(
+    job_id: int, clients: ClientContainer = Depends(get_clients)
+) -> FastJSONResponse:
     try:
-        response = AnalyzeServices.get_cv_analysis_job_by_id(job_id)
+        response = AnalyzeServices.get_cv_analysis_job_by_id(clients, job_id)
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="Job not found!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
@@ -2,8 +2,13 @@
 CV data CRUD endpoints for the Job Research Assistant backend.
 """
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.concurrency import run_in_threadpool
+from general_utils.auth_utils import resolve_user
+from general_utils.clients import ClientContainer, get_clients
+from general_utils.json_utils import FastJSONResponse
 from services.cv_data_crud_services import CVDataCrudServices
 
 router = APIRouter(
@@ -13,44 +18,92 @@ router = APIRouter(
 
 
 @router.get("/get_cv_data_by_username/{username}")
-async def get_cv_data_by_username(username: str) -> JSONResponse:
+async def get_cv_data_by_username(
+    username: str, clients: ClientContainer = Depends(get_clients)
+) -> FastJSONResponse:
     try:
-        response = CVDataCrudServices.get_cv_data_by_username(username)
+        response = CVDataCrudServices.get_cv_data_by_username(
+            clients, username
+        )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="CV data not found!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
+        )
+
+
+@router.get("/cvs")
+async def get_cv_data_summaries(
+    limit: int = Query(20, ge=1, le=100),
+    before_id: Optional[int] = None,
+    fields: Optional[List[str]] = Query(None),
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
+    try:
+        response = await run_in_threadpool(
+            CVDataCrudServices.get_cv_data_summaries,
+            clients,
+            user["id"],
+            limit,
+            before_id,
+            fields,
+        )
+
+        if response:
+            return FastJSONResponse(
+                status_code=status.HTTP_200_OK, content=response
+            )
+
+        else:
+            return FastJSONResponse(
+                status_code=status.HTTP_408_REQUEST_TIMEOUT,
+                content="Database Server error!",
+            )
+
+    except Exception as e:
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
 @router.get("/get_cv_data_by_file_hash/{file_hash}")
-async def get_cv_data_by_file_hash(file_hash: str) -> JSONResponse:
+async def get_cv_data_by_file_hash(
+    file_hash: str,
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
     try:
-        response = CVDataCrudServices.get_cv_data_by_file_hash(file_hash)
+        response = await run_in_threadpool(
+            CVDataCrudServices.get_cv_data_by_file_hash,
+            clients,
+            file_hash,
+            user["id"],
+        )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="CV data not found!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
@@ -0,0 +1,42 @@
+"""
+Module to specify dashboard endpoints for job research assistant app.
+"""
+
+from fastapi import APIRouter, Depends, status
+from fastapi.concurrency import run_in_threadpool
+from general_utils.auth_utils import resolve_user
+from general_utils.clients import ClientContainer, get_clients
+from general_utils.json_utils import FastJSONResponse
+from services.dashboard_services import DashboardServices
+
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["dashboard"],
+)
+
+
+@router.get("/summary")
+async def get_dashboard_summary(
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
+    try:
+        response = await run_in_threadpool(
+            DashboardServices.get_dashboard_summary, clients, user
+        )
+
+        if response:
+            return FastJSONResponse(
+                status_code=status.HTTP_200_OK, content=response
+            )
+
+        else:
+            return FastJSONResponse(
+                status_code=status.HTTP_408_REQUEST_TIMEOUT,
+                content="Database Server error!",
+            )
+
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
+        )
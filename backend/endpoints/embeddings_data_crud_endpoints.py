@@ -4,8 +4,9 @@ Embeddings CRUD endpoints for the Job Research Assistant backend.
 
 from typing import Optional
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, status
+from general_utils.clients import ClientContainer, get_clients
+from general_utils.json_utils import FastJSONResponse
 from services.embeddings_data_crud_endpoints import EmbeddingsDataCrudServices
 
 router = APIRouter(
@@ -17,23 +18,26 @@ router = APIRouter(
 @router.get("/get_company_names")
 async def get_company_names(
     company_name: Optional[str] = None,
-) -> JSONResponse:
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
     try:
-        response = EmbeddingsDataCrudServices.get_company_names(company_name)
+        response = EmbeddingsDataCrudServices.get_company_names(
+            clients, company_name
+        )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="Error getting company names!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
@@ -41,22 +45,25 @@ async def get_company_names(
 @router.get("/get_job_titles")
 async def get_job_titles(
     company_name: Optional[str] = None,
-) -> JSONResponse:
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
     try:
-        response = EmbeddingsDataCrudServices.get_job_titles(company_name)
+        response = EmbeddingsDataCrudServices.get_job_titles(
+            clients, company_name
+        )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="Error getting job titles from company name!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
@@ -2,8 +2,11 @@
 Module to specify interview endpoints for job research assistant app.
 """
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, status
+from general_utils.auth_utils import resolve_user
+from general_utils.deadline_utils import DeadlineExceededError
+from general_utils.json_utils import FastJSONResponse
+from general_utils.rate_limit_utils import ModelRateLimitError
 from services.interview_prep_services import InterviewPrepServices
 
 router = APIRouter(
@@ -16,26 +19,29 @@ router = APIRouter(
 async def generate_interview_preparation_materials(
     company_name: str,
     job_title: str,
-) -> JSONResponse:
+    user: dict = Depends(resolve_user),
+) -> FastJSONResponse:
     try:
-        response = (
-            InterviewPrepServices.generate_interview_preparation_materials(
-                company_name, job_title
-            )
+        response = await InterviewPrepServices.generate_interview_preparation_materials(
+            user, company_name, job_title
         )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="MinIO Server error!",
             )
 
+    except (DeadlineExceededError, ModelRateLimitError):
+        # Answered by the app's exception handlers
+        raise
+
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
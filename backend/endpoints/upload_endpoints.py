@@ -2,8 +2,13 @@
 Module to specify file upload endpoints for job research assistant app.
 """
 
-from fastapi import APIRouter, File, UploadFile, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, File, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from general_utils.auth_utils import resolve_user
+from general_utils.clients import ClientContainer, get_clients
+from general_utils.deadline_utils import DeadlineExceededError
+from general_utils.json_utils import FastJSONResponse
+from general_utils.rate_limit_utils import ModelRateLimitError
 from pydantic_models.upload_models import FileUploadResponse
 from services.upload_services import UploadServices
 
@@ -15,28 +20,100 @@ router = APIRouter(
 
 @router.post("/")
 async def upload_file(
-    username: str, file: UploadFile = File(...)
-) -> JSONResponse:
+    file: UploadFile = File(...),
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
     try:
         # Validate file extension
         FileUploadResponse(filename=str(file.filename))
 
         file_content = await file.read()
 
-        response = UploadServices.upload_file(file, file_content, username)
+        response = await UploadServices.upload_file(
+            clients, file, file_content, user["username"]
+        )
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="MinIO Server error!",
             )
 
+    except (DeadlineExceededError, ModelRateLimitError):
+        # Answered by the app's exception handlers
+        raise
+
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
+        )
+
+
+@router.get("/check_file_hash/{file_hash}")
+async def check_file_hash(
+    file_hash: str,
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
+    try:
+        response = await run_in_threadpool(
+            UploadServices.check_file_hash,
+            clients,
+            file_hash,
+            user["username"],
+        )
+
+        if response:
+            return FastJSONResponse(
+                status_code=status.HTTP_200_OK, content=response
+            )
+
+        else:
+            return FastJSONResponse(
+                status_code=status.HTTP_408_REQUEST_TIMEOUT,
+                content="Database Server error!",
+            )
+
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
+        )
+
+
+@router.post("/by_hash")
+async def upload_file_by_hash(
+    file_hash: str,
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
+    try:
+        # Only the user's own uploads are registered again, under the
+        # filename they were first uploaded with
+        response = await run_in_threadpool(
+            UploadServices.upload_file_by_hash,
+            clients,
+            file_hash,
+            user["username"],
+        )
+
+        if response:
+            return FastJSONResponse(
+                status_code=status.HTTP_200_OK, content=response
+            )
+
+        else:
+            return FastJSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content="File not found, upload the file content instead!",
+            )
+
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
@@ -0,0 +1,40 @@
+"""
+Module to specify LLM usage endpoints for job research assistant app.
+"""
+
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from general_utils.auth_utils import resolve_user
+from general_utils.clients import ClientContainer, get_clients
+from general_utils.json_utils import FastJSONResponse
+from services.usage_services import UsageServices
+
+router = APIRouter(
+    prefix="/usage",
+    tags=["usage"],
+)
+
+
+@router.get("/summary")
+async def get_llm_usage_summary(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    group_by: Optional[List[str]] = Query(None),
+    user: dict = Depends(resolve_user),
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
+    try:
+        response = await UsageServices.get_llm_usage_summary(
+            clients, user, start_date, end_date, group_by
+        )
+
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK, content=response
+        )
+
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
+        )
@@ -2,9 +2,14 @@
 Users CRUD endpoints for the Job Research Assistant backend.
 """
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
-from pydantic_models.users_crud_models import UserCreateRequest
+from fastapi import APIRouter, Depends, status
+from general_utils.auth_utils import get_current_user
+from general_utils.clients import ClientContainer, get_clients
+from general_utils.json_utils import FastJSONResponse
+from pydantic_models.users_crud_models import (
+    UserAuthenticateRequest,
+    UserCreateRequest,
+)
 from services.users_crud_services import UsersServices
 
 router = APIRouter(
@@ -14,88 +19,131 @@ router = APIRouter(
 
 
 @router.get("/")
-async def get_users() -> JSONResponse:
+async def get_users(
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
     try:
-        response = UsersServices.get_users()
+        response = UsersServices.get_users(clients)
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="Database Server error!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
 @router.post("/create_user")
-async def create_user(user: UserCreateRequest) -> JSONResponse:
+async def create_user(
+    user: UserCreateRequest, clients: ClientContainer = Depends(get_clients)
+) -> FastJSONResponse:
     try:
-        response = UsersServices.create_user(user.model_dump())
+        response = await UsersServices.create_user(clients, user.model_dump())
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="Database Server error!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
+        )
+
+
+@router.post("/authenticate")
+async def authenticate_user(
+    user: UserAuthenticateRequest,
+    clients: ClientContainer = Depends(get_clients),
+) -> FastJSONResponse:
+    try:
+        response = await UsersServices.authenticate_user(
+            clients, user.login, user.password.get_secret_value()
+        )
+
+        if response:
+            return FastJSONResponse(
+                status_code=status.HTTP_200_OK, content=response
+            )
+
+        else:
+            return FastJSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content="Invalid username or password!",
+            )
+
+    except Exception as e:
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
+@router.get("/me")
+async def get_me(user: dict = Depends(get_current_user)) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={**user, "message": "User found!"},
+    )
+
+
 @router.get("/get_user/{username}")
-async def get_user_by_username(username: str) -> JSONResponse:
+async def get_user_by_username(
+    username: str, clients: ClientContainer = Depends(get_clients)
+) -> FastJSONResponse:
     try:
-        response = UsersServices.get_user_by_username(username)
+        response = UsersServices.get_user_by_username(clients, username)
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="User not found!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
 
 
 @router.get("/get_user/{email}")
-async def get_user_by_email(email: str) -> JSONResponse:
+async def get_user_by_email(
+    email: str, clients: ClientContainer = Depends(get_clients)
+) -> FastJSONResponse:
     try:
-        response = UsersServices.get_user_by_email(email)
+        response = UsersServices.get_user_by_email(clients, email)
 
         if response:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_200_OK, content=response
             )
 
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 content="User not found by email!",
             )
 
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST, content=str(e)
         )
@@ -0,0 +1,165 @@
+"""
+Module to authenticate backend requests from JWT tokens for job research assistant app.
+"""
+
+import time
+from pathlib import Path
+
+import jwt
+from config import (
+    ALGORITHM,
+    AUTH_CACHE_MAXSIZE,
+    AUTH_CACHE_TTL_SECONDS,
+    AUTH_USERNAME_FALLBACK_ENABLED,
+    SECRET_KEY,
+)
+from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from general_utils.clients import CLIENTS
+from general_utils.logging import get_logger
+from general_utils.ttl_cache import TTLCache
+
+# Decoded claims keyed by raw token, and user rows keyed by username
+TOKEN_CLAIMS_CACHE = TTLCache(AUTH_CACHE_TTL_SECONDS, AUTH_CACHE_MAXSIZE)
+USERS_CACHE = TTLCache(AUTH_CACHE_TTL_SECONDS, AUTH_CACHE_MAXSIZE)
+
+BEARER_SCHEME = HTTPBearer(auto_error=False)
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/backend/auth_utils.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+
+def decode_jwt_token(token: str) -> dict | None:
+    """
+    Verify a JWT token and return its claims.
+
+    Claims are cached until the token expires (bounded by the cache TTL),
+    so repeated requests with the same token skip signature checks.
+    """
+    claims = TOKEN_CLAIMS_CACHE.get(token)
+    if claims is not None:
+        return claims
+
+    try:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    except jwt.ExpiredSignatureError:
+        stream_logger.error(f"JWT token expired!")
+        return None
+
+    except jwt.InvalidTokenError:
+        file_logger.error(f"Invalid JWT token!")
+        stream_logger.error(f"Invalid JWT token!")
+        return None
+
+    time_to_expiry = claims.get("exp", time.time() + AUTH_CACHE_TTL_SECONDS)
+    TOKEN_CLAIMS_CACHE.set(
+        token,
+        claims,
+        ttl_seconds=min(AUTH_CACHE_TTL_SECONDS, time_to_expiry - time.time()),
+    )
+
+    return claims
+
+
+def get_cached_user(username: str) -> dict | None:
+    """Get the id, username and email of a user, cached by username."""
+    user = USERS_CACHE.get(username)
+    if user is not None:
+        return user
+
+    user_data = CLIENTS.postgres_client.get_user_by_username(username)
+    if user_data.get("message") != "User found!":
+        return None
+
+    user = {
+        "id": user_data["id"],
+        "username": user_data["username"],
+        "email": user_data["email"],
+    }
+    USERS_CACHE.set(username, user)
+
+    return user
+
+
+def invalidate_cached_user(username: str) -> None:
+    """Drop a user row from the cache after it changes."""
+    USERS_CACHE.pop(username)
+
+
+async def _get_cached_user_async(username: str) -> dict | None:
+    # Cache hits are served on the event loop, misses query the database
+    # on the threadpool
+    user = USERS_CACHE.get(username)
+    if user is not None:
+        return user
+
+    return await run_in_threadpool(get_cached_user, username)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(BEARER_SCHEME),
+) -> dict:
+    """FastAPI dependency resolving the user of a bearer token."""
+    claims = decode_jwt_token(credentials.credentials) if credentials else None
+
+    if not claims or not claims.get("username"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token!",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = await _get_cached_user_async(claims["username"])
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found!",
+        )
+
+    return user
+
+
+async def resolve_user(
+    username: str | None = None,
+    credentials: HTTPAuthorizationCredentials | None = Depends(BEARER_SCHEME),
+) -> dict:
+    """
+    FastAPI dependency resolving the user of a request.
+
+    Requires a bearer token. The deprecated username query parameter is
+    only accepted without a token when AUTH_USERNAME_FALLBACK_ENABLED is
+    set, for clients that do not send tokens yet.
+    """
+    if credentials:
+        return await get_current_user(credentials)
+
+    if not AUTH_USERNAME_FALLBACK_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing bearer token!",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    stream_logger.warning(
+        "Resolving a user from the deprecated username parameter, send a bearer token instead!"
+    )
+
+    user = await _get_cached_user_async(username) if username else None
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found!",
+        )
+
+    return user
@@ -0,0 +1,205 @@
+"""
+Module to checkpoint LLM step outputs so pipeline runs can resume for job research assistant app.
+"""
+
+import contextvars
+import hashlib
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from config import (
+    LLM_STEP_CHECKPOINT_TTL_SECONDS,
+    LLM_STEP_CHECKPOINTS_ENABLED,
+)
+from fastapi.concurrency import run_in_threadpool
+from general_utils.clients import CLIENTS
+from general_utils.deadline_utils import STEP_LATENCY_STATS
+from general_utils.logging import get_logger
+from general_utils.usage_accounting_utils import LLM_USAGE_RECORDER
+from pydantic import BaseModel, ValidationError
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/backend/checkpoint_utils.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+# Options of the pipeline run whose steps are checkpointed, if any. Steps
+# run outside a checkpointed run always call the model.
+_CHECKPOINT_RUN: contextvars.ContextVar[dict | None] = contextvars.ContextVar(
+    "llm_checkpoint_run", default=None
+)
+
+
+def hash_input(data: Any) -> str:
+    """Return a stable SHA-256 hash of JSON-serialisable input data."""
+    serialized_data = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_data.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def checkpoint_run(force_refresh: bool = False):
+    """
+    Checkpoint the output of every LLM step run inside the block.
+
+    With force_refresh, every step calls the model and its checkpoint is
+    overwritten, e.g. to regenerate an analysis the user was unhappy with.
+    """
+    if not LLM_STEP_CHECKPOINTS_ENABLED:
+        yield
+        return
+
+    token = _CHECKPOINT_RUN.set({"force_refresh": force_refresh})
+    try:
+        yield
+    finally:
+        _CHECKPOINT_RUN.reset(token)
+
+
+def _load_checkpoint(
+    step_name: str, input_hash: str, output_schema: type[BaseModel]
+) -> dict | None:
+    try:
+        output = CLIENTS.postgres_client.get_llm_step_checkpoint(
+            step_name, input_hash, LLM_STEP_CHECKPOINT_TTL_SECONDS
+        )
+        if output is None:
+            return None
+
+        return output_schema.model_validate(output).model_dump()
+
+    except ValidationError as e:
+        # Stored before the schema changed in a way its JSON schema missed
+        file_logger.warning(f"Stale checkpoint of '{step_name}': {e}")
+        stream_logger.warning(f"Stale checkpoint of '{step_name}': {e}")
+        return None
+
+    except Exception as e:
+        # A missing checkpoint only costs a model call, never fail the step
+        file_logger.error(f"Error loading checkpoint of '{step_name}': {e}")
+        stream_logger.error(f"Error loading checkpoint of '{step_name}': {e}")
+        return None
+
+
+def _save_checkpoint(
+    step_name: str, input_hash: str, model: str, output: dict
+) -> None:
+    try:
+        CLIENTS.postgres_client.save_llm_step_checkpoint(
+            step_name, input_hash, model, output
+        )
+    except Exception as e:
+        file_logger.error(f"Error saving checkpoint of '{step_name}': {e}")
+        stream_logger.error(f"Error saving checkpoint of '{step_name}': {e}")
+
+
+def delete_expired_checkpoints() -> None:
+    """Delete checkpoints past their TTL, which are no longer reused."""
+    if not LLM_STEP_CHECKPOINTS_ENABLED:
+        return
+
+    try:
+        deleted = CLIENTS.postgres_client.delete_expired_llm_step_checkpoints(
+            LLM_STEP_CHECKPOINT_TTL_SECONDS
+        )
+        stream_logger.info(f"Deleted {deleted} expired checkpoints!")
+
+    except Exception as e:
+        file_logger.error(f"Error deleting expired checkpoints: {e}")
+        stream_logger.error(f"Error deleting expired checkpoints: {e}")
+
+
+def _get_step_input_hash(
+    step_name: str, step_definition: dict, input_data: dict
+) -> str:
+    # The prompt, response schema and route settings are part of the key,
+    # so changing any of them never serves an output the current step
+    # would not produce
+    return hash_input(
+        {
+            "step_name": step_name,
+            "step_definition": step_definition,
+            "input_data": input_data,
+        }
+    )
+
+
+def _record_checkpoint_hit(
+    step_name: str, model: str, chain_name: str | None
+) -> None:
+    STEP_LATENCY_STATS.increment(step_name, "checkpoint_hits")
+    LLM_USAGE_RECORDER.record(chain_name or step_name, model, cache_hit=True)
+
+
+def run_checkpointed_step(
+    step_name: str,
+    model: str,
+    step_definition: dict,
+    output_schema: type[BaseModel],
+    input_data: dict,
+    func: Callable[[], dict],
+    chain_name: str | None = None,
+) -> dict:
+    """
+    Return the checkpointed output of a step, or run it and checkpoint it.
+
+    Checkpoints are keyed by the step's definition and its own input, so a
+    resumed run skips its completed steps, and a run sharing a step's
+    input (the same CV against another job) reuses it until the TTL ends.
+    Reused outputs are validated against output_schema and accounted as
+    cache hits of chain_name.
+    """
+    run_options = _CHECKPOINT_RUN.get()
+    if run_options is None:
+        return func()
+
+    input_hash = _get_step_input_hash(step_name, step_definition, input_data)
+
+    if not run_options["force_refresh"]:
+        output = _load_checkpoint(step_name, input_hash, output_schema)
+        if output is not None:
+            _record_checkpoint_hit(step_name, model, chain_name)
+            return output
+
+    output = func()
+    _save_checkpoint(step_name, input_hash, model, output)
+
+    return output
+
+
+async def arun_checkpointed_step(
+    step_name: str,
+    model: str,
+    step_definition: dict,
+    output_schema: type[BaseModel],
+    input_data: dict,
+    afunc: Callable[[], Awaitable[dict]],
+    chain_name: str | None = None,
+) -> dict:
+    """Async version of run_checkpointed_step, database calls use threads."""
+    run_options = _CHECKPOINT_RUN.get()
+    if run_options is None:
+        return await afunc()
+
+    input_hash = _get_step_input_hash(step_name, step_definition, input_data)
+
+    if not run_options["force_refresh"]:
+        output = await run_in_threadpool(
+            _load_checkpoint, step_name, input_hash, output_schema
+        )
+        if output is not None:
+            _record_checkpoint_hit(step_name, model, chain_name)
+            return output
+
+    output = await afunc()
+    await run_in_threadpool(
+        _save_checkpoint, step_name, input_hash, model, output
+    )
+
+    return output
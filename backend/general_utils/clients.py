@@ -0,0 +1,199 @@
+"""
+Module to specify the lazily initialized client container for job research assistant app.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from config import (
+    LLM_KEEPALIVE_EXPIRY_SECONDS,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_STEP_TIMEOUT_SECONDS,
+)
+from db_connectors.minio.minio_client import MinioClient
+from db_connectors.postgres.postgres_client import (
+    PGVectorClient,
+    PostgresClient,
+)
+from fastapi import Depends, Request
+from general_utils.logging import get_logger
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/backend/clients.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+
+class ClientContainer:
+    """
+    Process-wide container of database, storage, embedding and LLM clients.
+
+    Each client is created once, on first use, so importing the app does
+    not connect to Postgres or MinIO and a briefly unavailable service
+    only fails the requests that need it.
+    """
+
+    def __init__(self):
+        self._clients: dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        with self._lock:
+            if name not in self._clients:
+                self._clients[name] = factory()
+                stream_logger.info(f"Client '{name}' initialized!")
+
+            return self._clients[name]
+
+    @property
+    def postgres_client(self) -> PostgresClient:
+        return self._get_or_create("postgres_client", PostgresClient)
+
+    @property
+    def minio_client(self) -> MinioClient:
+        return self._get_or_create("minio_client", MinioClient)
+
+    @property
+    def embedding_function(self):
+        # langchain_openai is only imported when embeddings are first needed
+        from general_utils.rate_limit_utils import (
+            EMBEDDINGS_LIMITER,
+            RateLimitedEmbeddings,
+        )
+        from langchain_openai import OpenAIEmbeddings
+
+        # Retries are left to the limiter, which honors Retry-After
+        return self._get_or_create(
+            "embedding_function",
+            lambda: RateLimitedEmbeddings(
+                OpenAIEmbeddings(max_retries=0), EMBEDDINGS_LIMITER
+            ),
+        )
+
+    @property
+    def pgvector_jd(self) -> PGVectorClient:
+        return self._get_or_create(
+            "pgvector_jd",
+            lambda: PGVectorClient(
+                self.embedding_function, "job_descriptions"
+            ),
+        )
+
+    @property
+    def pgvector_company_info(self) -> PGVectorClient:
+        return self._get_or_create(
+            "pgvector_company_info",
+            lambda: PGVectorClient(self.embedding_function, "company_info"),
+        )
+
+    def _build_llm_connection_limits(self):
+        import httpx
+
+        return httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY_SECONDS,
+        )
+
+    @property
+    def llm_http_client(self):
+        import httpx
+
+        return self._get_or_create(
+            "llm_http_client",
+            lambda: httpx.Client(limits=self._build_llm_connection_limits()),
+        )
+
+    @property
+    def llm_async_http_client(self):
+        import httpx
+
+        return self._get_or_create(
+            "llm_async_http_client",
+            lambda: httpx.AsyncClient(
+                limits=self._build_llm_connection_limits()
+            ),
+        )
+
+    def get_chat_model(self, route):
+        """
+        Return the chat model of a model route.
+
+        All chat models share one pooled HTTP client per process, so
+        connections to the model endpoints are reused across chains and
+        requests. Routes with a base URL target OpenAI-compatible servers.
+        """
+        from langchain_openai import ChatOpenAI
+        from pydantic import SecretStr
+
+        return self._get_or_create(
+            f"chat_model:{route.name}",
+            lambda: ChatOpenAI(
+                model=route.model,
+                api_key=SecretStr(route.get_api_key()),
+                base_url=route.base_url,
+                temperature=route.temperature,
+                max_tokens=route.max_tokens,
+                http_client=self.llm_http_client,
+                http_async_client=self.llm_async_http_client,
+                max_retries=0,
+                timeout=LLM_STEP_TIMEOUT_SECONDS,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Release the async LLM client, then every other client."""
+        llm_async_http_client = self._clients.get("llm_async_http_client")
+
+        if llm_async_http_client is not None:
+            await llm_async_http_client.aclose()
+
+        self.close()
+
+    def close(self) -> None:
+        """Release connection pools of the clients created so far."""
+        with self._lock:
+            llm_http_client = self._clients.get("llm_http_client")
+
+            if llm_http_client is not None:
+                llm_http_client.close()
+
+            postgres_client = self._clients.get("postgres_client")
+
+            if postgres_client is not None:
+                try:
+                    postgres_client.engine.dispose()
+
+                except Exception as e:
+                    file_logger.error(f"Failed to close Postgres engine: {e}")
+                    stream_logger.error(
+                        f"Failed to close Postgres engine: {e}"
+                    )
+
+            self._clients.clear()
+
+
+CLIENTS = ClientContainer()
+
+
+def get_clients(request: Request) -> ClientContainer:
+    """FastAPI dependency returning the app's client container."""
+    return getattr(request.app.state, "clients", CLIENTS)
+
+
+def get_postgres_client(
+    clients: ClientContainer = Depends(get_clients),
+) -> PostgresClient:
+    """FastAPI dependency returning the shared Postgres client."""
+    return clients.postgres_client
@@ -0,0 +1,247 @@
+"""
+Module to bound LLM step latency with deadlines and hedged requests for job research assistant app.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from config import (
+    LLM_HEDGE_MIN_DELAY_SECONDS,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_PERCENTILE,
+    LLM_HEDGING_ENABLED,
+    LLM_STEP_TIMEOUT_SECONDS,
+)
+from general_utils.logging import get_logger
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/backend/deadline_utils.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+# Monotonic time by which the current pipeline must finish, if any.
+# Context variables follow asyncio tasks and langchain's executor threads,
+# so every step of a pipeline sees the budget set by its caller.
+_DEADLINE: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "llm_deadline", default=None
+)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a step cannot finish within its pipeline's deadline."""
+
+
+@contextmanager
+def deadline_budget(seconds: float):
+    """Set a deadline budget for every LLM step run inside the block."""
+    token = _DEADLINE.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def get_step_timeout(step_name: str) -> float:
+    """Return the timeout of a step, capped by the remaining budget."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return LLM_STEP_TIMEOUT_SECONDS
+
+    remaining_seconds = deadline - time.monotonic()
+    if remaining_seconds <= 0:
+        raise DeadlineExceededError(
+            f"Deadline exceeded before step '{step_name}' started!"
+        )
+
+    return min(LLM_STEP_TIMEOUT_SECONDS, remaining_seconds)
+
+
+def _percentile(sorted_latencies: list[float], percentile: float):
+    if not sorted_latencies:
+        return None
+
+    index = int(len(sorted_latencies) * percentile / 100)
+    return sorted_latencies[min(len(sorted_latencies) - 1, index)]
+
+
+class StepLatencyStats:
+    """
+    Recent latencies, timeouts and hedge outcomes per pipeline step.
+
+    Latency percentiles use a window of the most recent calls, so hedge
+    delays follow the current behaviour of the model endpoint.
+    """
+
+    def __init__(self, window_size: int = 200):
+        self._latencies = defaultdict(lambda: deque(maxlen=window_size))
+        self._counters = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def record_latency(self, step_name: str, latency_seconds: float) -> None:
+        with self._lock:
+            self._latencies[step_name].append(latency_seconds)
+            self._counters[step_name]["calls"] += 1
+
+    def increment(self, step_name: str, counter: str) -> None:
+        with self._lock:
+            self._counters[step_name][counter] += 1
+
+    def percentile(self, step_name: str, percentile: float) -> float | None:
+        with self._lock:
+            latencies = sorted(self._latencies[step_name])
+
+        if len(latencies) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+
+        return _percentile(latencies, percentile)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            step_names = set(self._latencies) | set(self._counters)
+            latencies = {
+                name: sorted(self._latencies[name]) for name in step_names
+            }
+            counters = {
+                name: dict(self._counters[name]) for name in step_names
+            }
+
+        snapshot = {}
+        for name in step_names:
+            hedges = counters[name].get("hedges", 0)
+
+            snapshot[name] = {
+                **counters[name],
+                "hedge_win_rate": (
+                    counters[name].get("hedge_wins", 0) / hedges
+                    if hedges
+                    else 0.0
+                ),
+            }
+
+            for percentile in (50, 95, 99):
+                snapshot[name][f"p{percentile}_seconds"] = _percentile(
+                    latencies[name], percentile
+                )
+
+        return snapshot
+
+
+STEP_LATENCY_STATS = StepLatencyStats()
+
+
+def get_step_latency_metrics() -> dict:
+    return STEP_LATENCY_STATS.snapshot()
+
+
+def run_step(step_name: str, func: Callable[[], Any]) -> Any:
+    """
+    Run a blocking LLM step within the deadline budget.
+
+    A blocking call cannot be cancelled, so the budget is checked before it
+    starts and the chat model's request timeout bounds the call itself.
+    """
+    get_step_timeout(step_name)
+
+    start_time = time.perf_counter()
+    result = func()
+    STEP_LATENCY_STATS.record_latency(
+        step_name, time.perf_counter() - start_time
+    )
+
+    return result
+
+
+async def _timed(step_name: str, afunc: Callable[[], Awaitable[Any]]):
+    start_time = time.perf_counter()
+    result = await afunc()
+    STEP_LATENCY_STATS.record_latency(
+        step_name, time.perf_counter() - start_time
+    )
+    return result
+
+
+async def _run_hedged(
+    step_name: str,
+    afunc: Callable[[], Awaitable[Any]],
+    hedge_delay_seconds: float,
+) -> Any:
+    primary = asyncio.ensure_future(_timed(step_name, afunc))
+    pending = {primary}
+
+    try:
+        done, _ = await asyncio.wait(pending, timeout=hedge_delay_seconds)
+        if done:
+            return primary.result()
+
+        # The primary is slower than usual, race a duplicate request against it
+        STEP_LATENCY_STATS.increment(step_name, "hedges")
+        hedge = asyncio.ensure_future(_timed(step_name, afunc))
+        pending = {primary, hedge}
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        STEP_LATENCY_STATS.increment(step_name, "hedge_wins")
+                    return task.result()
+
+        # Both requests failed, surface the primary's error
+        return primary.result()
+
+    finally:
+        # Also runs when the step timeout cancels this coroutine
+        for task in pending:
+            task.cancel()
+
+
+async def arun_step(
+    step_name: str, afunc: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Await an LLM step within its step timeout and the deadline budget.
+
+    With hedging enabled, a duplicate request is sent once the step runs
+    longer than its recent p95 latency, and the first result wins.
+    """
+    timeout_seconds = get_step_timeout(step_name)
+    hedge_delay_seconds = (
+        STEP_LATENCY_STATS.percentile(step_name, LLM_HEDGE_PERCENTILE)
+        if LLM_HEDGING_ENABLED
+        else None
+    )
+
+    if hedge_delay_seconds is not None:
+        step = _run_hedged(
+            step_name,
+            afunc,
+            max(LLM_HEDGE_MIN_DELAY_SECONDS, hedge_delay_seconds),
+        )
+    else:
+        step = _timed(step_name, afunc)
+
+    try:
+        return await asyncio.wait_for(step, timeout=timeout_seconds)
+
+    except asyncio.TimeoutError as e:
+        STEP_LATENCY_STATS.increment(step_name, "timeouts")
+
+        message = f"Step '{step_name}' timed out after {timeout_seconds:.1f}s!"
+        file_logger.error(message)
+        stream_logger.error(message)
+
+        raise DeadlineExceededError(message) from e
@@ -0,0 +1,61 @@
+"""
+Module to specify fast JSON serialization for job research assistant backend.
+"""
+
+from decimal import Decimal
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes with orjson.
+
+    datetime, date, UUID and dataclasses are encoded natively; Decimal and
+    SQLAlchemy rows are handled by the default hook.
+
+    Args:
+        content: Any
+
+    Returns:
+        bytes
+    """
+    return orjson.dumps(
+        content, default=_orjson_default, option=ORJSON_OPTIONS
+    )
+
+
+def rows_to_dicts(rows: Iterable) -> list[dict]:
+    """
+    Convert SQLAlchemy rows to dicts without walking their values.
+
+    Values such as datetime and Decimal are left for the response class to
+    encode.
+
+    Args:
+        rows: Iterable of SQLAlchemy Row
+
+    Returns:
+        list[dict]
+    """
+    return [row._asdict() for row in rows]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
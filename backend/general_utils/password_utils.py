@@ -0,0 +1,50 @@
+"""
+Module to hash and verify passwords off the event loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from config import BCRYPT_ROUNDS, PASSWORD_HASHING_WORKERS
+
+# bcrypt releases the GIL while hashing, so a small dedicated pool runs
+# hashes in parallel without starving the default threadpool used by
+# FastAPI for sync work. The bound also caps CPU spent on signup bursts.
+PASSWORD_HASHING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASHING_WORKERS,
+    thread_name_prefix="password_hashing",
+)
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt using the configured cost factor."""
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("utf-8")
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    """Verify a password against a bcrypt hashed password."""
+    if not hashed_password:
+        return False
+
+    return bcrypt.checkpw(
+        password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        PASSWORD_HASHING_EXECUTOR, hash_password, password
+    )
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        PASSWORD_HASHING_EXECUTOR, verify_password, password, hashed_password
+    )
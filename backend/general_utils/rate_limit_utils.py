@@ -0,0 +1,430 @@
+"""
+Module to limit and retry model and embedding calls for job research assistant app.
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from config import (
+    EMBEDDINGS_REQUESTS_PER_MINUTE,
+    EMBEDDINGS_TOKENS_PER_MINUTE,
+    LLM_ESTIMATED_COMPLETION_TOKENS,
+    LLM_INITIAL_CONCURRENCY,
+    LLM_MAX_BACKOFF_SECONDS,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_RETRIES,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+    RATE_LIMIT_WORKERS,
+)
+from general_utils.logging import get_logger
+from general_utils.tracing_utils import trace_span
+from langchain.schema.runnable import RunnableLambda
+from langchain_core.embeddings import Embeddings
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/backend/rate_limit_utils.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+# Responses that mean the provider is overloaded or limiting us
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Rough characters per token, used to charge the token bucket up front
+CHARACTERS_PER_TOKEN = 4
+
+
+class ModelRateLimitError(Exception):
+    """Raised when a model call is still rate limited after all retries."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        # Whole seconds, as sent back to clients in Retry-After
+        self.retry_after_seconds = math.ceil(retry_after or 1)
+
+
+def estimate_tokens(data: Any) -> int:
+    """Estimate the prompt tokens of a string, list or dict of inputs."""
+    return len(str(data)) // CHARACTERS_PER_TOKEN + 1
+
+
+def get_retry_after_seconds(error: Exception) -> float | None:
+    """
+    Return how long to wait before retrying a failed call.
+
+    Returns None when the error is not a rate limit or transient provider
+    error, 0.0 when it is but the provider gave no Retry-After header.
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code not in RETRYABLE_STATUS_CODES:
+        return None
+
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+
+    except ValueError:
+        # HTTP-date Retry-After values fall back to exponential backoff
+        pass
+
+    return 0.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a per-minute rate.
+
+    Callers reserve capacity up front and are told how long to wait, so the
+    same bucket serves blocking threads and coroutines.
+    """
+
+    def __init__(self, rate_per_minute: float, burst_seconds: float = 10.0):
+        self.rate_per_second = rate_per_minute / 60
+        self.capacity = self.rate_per_second * burst_seconds
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take amount from the bucket and return seconds to wait for it."""
+        if self.rate_per_second <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.updated_at) * self.rate_per_second,
+            )
+            self.updated_at = now
+            self.tokens -= amount
+
+            return max(0.0, -self.tokens / self.rate_per_second)
+
+
+class AIMDConcurrencyLimit:
+    """
+    Concurrency limit with additive increase and multiplicative decrease.
+
+    The limit grows by about one slot per window of successful calls and
+    halves on every rate limited response, so it settles just under the
+    concurrency the provider accepts.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+    ):
+        self.limit = float(initial_limit)
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def try_acquire(self) -> bool:
+        with self._condition:
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return True
+
+            return False
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+
+            self.in_flight += 1
+
+    async def aacquire(self, poll_interval: float = 0.05) -> None:
+        while not self.try_acquire():
+            await asyncio.sleep(poll_interval)
+
+    def release(self, overloaded: bool) -> None:
+        with self._condition:
+            self.in_flight -= 1
+
+            if overloaded:
+                self.limit = max(
+                    self.min_limit, self.limit * self.decrease_factor
+                )
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+            self._condition.notify_all()
+
+
+class ModelCallLimiter:
+    """
+    Process-wide limiter for calls to one model provider endpoint.
+
+    Each call reserves a request and its estimated tokens from per-minute
+    token buckets, then takes an AIMD concurrency slot. Rate limited and
+    transient provider errors are retried with exponential backoff that
+    honors Retry-After.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        initial_concurrency: int = LLM_INITIAL_CONCURRENCY,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        max_retries: int = LLM_MAX_RETRIES,
+        max_backoff_seconds: float = LLM_MAX_BACKOFF_SECONDS,
+    ):
+        self.name = name
+        self.requests_bucket = TokenBucket(requests_per_minute)
+        self.tokens_bucket = TokenBucket(tokens_per_minute)
+        self.concurrency = AIMDConcurrencyLimit(
+            initial_concurrency, max_concurrency
+        )
+        self.max_retries = max_retries
+        self.max_backoff_seconds = max_backoff_seconds
+        self._metrics_lock = threading.Lock()
+        self._metrics = self._empty_metrics()
+
+    @staticmethod
+    def _empty_metrics() -> dict:
+        return {
+            "calls": 0,
+            "queued_calls": 0,
+            "queue_seconds_total": 0.0,
+            "queue_seconds_max": 0.0,
+            "retries": 0,
+            "rate_limited_responses": 0,
+            "failures": 0,
+        }
+
+    def _record(self, **increments) -> None:
+        with self._metrics_lock:
+            for key, value in increments.items():
+                self._metrics[key] += value
+
+    def _record_queue_delay(self, queue_seconds: float) -> None:
+        with self._metrics_lock:
+            self._metrics["calls"] += 1
+            self._metrics["queue_seconds_total"] += queue_seconds
+            self._metrics["queue_seconds_max"] = max(
+                self._metrics["queue_seconds_max"], queue_seconds
+            )
+
+            if queue_seconds > 0.01:
+                self._metrics["queued_calls"] += 1
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        return max(
+            self.requests_bucket.reserve(1),
+            self.tokens_bucket.reserve(estimated_tokens),
+        )
+
+    def _backoff_seconds(self, attempt: int, retry_after: float) -> float:
+        # Full jitter, but never earlier than the provider asked for
+        backoff_seconds = random.uniform(
+            0, min(self.max_backoff_seconds, 2**attempt)
+        )
+        return max(retry_after, backoff_seconds)
+
+    def _handle_error(self, error: Exception, attempt: int) -> float | None:
+        """Record an error and return the wait before retrying it, if any."""
+        retry_after = get_retry_after_seconds(error)
+
+        if retry_after is None:
+            self._record(failures=1)
+            return None
+
+        self._record(rate_limited_responses=1)
+
+        if attempt >= self.max_retries:
+            self._record(failures=1)
+            message = (
+                f"{self.name} calls are rate limited after "
+                f"{self.max_retries} retries: {error}"
+            )
+            file_logger.error(message)
+            stream_logger.error(message)
+            raise ModelRateLimitError(message, retry_after) from error
+
+        self._record(retries=1)
+        return self._backoff_seconds(attempt, retry_after)
+
+    def call(self, func: Callable[[], Any], estimated_tokens: int) -> Any:
+        """Run a blocking model call within the limits, with retries."""
+        for attempt in range(self.max_retries + 1):
+            start_time = time.perf_counter()
+            time.sleep(self._reserve(estimated_tokens))
+            self.concurrency.acquire()
+            self._record_queue_delay(time.perf_counter() - start_time)
+
+            overloaded = False
+            try:
+                return func()
+
+            except Exception as e:
+                overloaded = get_retry_after_seconds(e) is not None
+                wait_seconds = self._handle_error(e, attempt)
+                if wait_seconds is None:
+                    raise
+
+            finally:
+                self.concurrency.release(overloaded)
+
+            time.sleep(wait_seconds)
+
+    async def acall(
+        self, afunc: Callable[[], Awaitable[Any]], estimated_tokens: int
+    ) -> Any:
+        """Await a model call within the limits, with retries."""
+        for attempt in range(self.max_retries + 1):
+            start_time = time.perf_counter()
+            await asyncio.sleep(self._reserve(estimated_tokens))
+            await self.concurrency.aacquire()
+            self._record_queue_delay(time.perf_counter() - start_time)
+
+            overloaded = False
+            try:
+                return await afunc()
+
+            except Exception as e:
+                overloaded = get_retry_after_seconds(e) is not None
+                wait_seconds = self._handle_error(e, attempt)
+                if wait_seconds is None:
+                    raise
+
+            finally:
+                self.concurrency.release(overloaded)
+
+            await asyncio.sleep(wait_seconds)
+
+    def snapshot(self) -> dict:
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+
+        metrics["queue_seconds_avg"] = (
+            metrics["queue_seconds_total"] / metrics["calls"]
+            if metrics["calls"]
+            else 0.0
+        )
+        metrics["concurrency_limit"] = int(self.concurrency.limit)
+        metrics["in_flight"] = self.concurrency.in_flight
+
+        return metrics
+
+
+# Provider limits are per account, so each worker takes an equal share
+CHAT_MODEL_LIMITER = ModelCallLimiter(
+    "chat_model",
+    requests_per_minute=LLM_REQUESTS_PER_MINUTE / RATE_LIMIT_WORKERS,
+    tokens_per_minute=LLM_TOKENS_PER_MINUTE / RATE_LIMIT_WORKERS,
+)
+
+EMBEDDINGS_LIMITER = ModelCallLimiter(
+    "embeddings",
+    requests_per_minute=EMBEDDINGS_REQUESTS_PER_MINUTE / RATE_LIMIT_WORKERS,
+    tokens_per_minute=EMBEDDINGS_TOKENS_PER_MINUTE / RATE_LIMIT_WORKERS,
+)
+
+
+# Self-hosted OpenAI-compatible servers, by base URL, have no account
+# limits so only adaptive concurrency and retries apply
+_SELF_HOSTED_LIMITERS: dict[str, ModelCallLimiter] = {}
+_SELF_HOSTED_LIMITERS_LOCK = threading.Lock()
+
+
+def get_chat_model_limiter(base_url: str | None = None) -> ModelCallLimiter:
+    """Return the limiter of the endpoint serving a chat model."""
+    if base_url is None:
+        return CHAT_MODEL_LIMITER
+
+    with _SELF_HOSTED_LIMITERS_LOCK:
+        if base_url not in _SELF_HOSTED_LIMITERS:
+            _SELF_HOSTED_LIMITERS[base_url] = ModelCallLimiter(
+                f"chat_model:{base_url}",
+                requests_per_minute=0,
+                tokens_per_minute=0,
+            )
+
+        return _SELF_HOSTED_LIMITERS[base_url]
+
+
+def get_rate_limit_metrics() -> dict:
+    limiters = [CHAT_MODEL_LIMITER, EMBEDDINGS_LIMITER]
+    limiters.extend(_SELF_HOSTED_LIMITERS.values())
+
+    return {limiter.name: limiter.snapshot() for limiter in limiters}
+
+
+def with_rate_limit(runnable, limiter: ModelCallLimiter = CHAT_MODEL_LIMITER):
+    """Wrap a langchain runnable so invoke and ainvoke go through limiter."""
+
+    def estimate(input_data):
+        return estimate_tokens(input_data) + LLM_ESTIMATED_COMPLETION_TOKENS
+
+    def run(input_data):
+        return limiter.call(
+            lambda: runnable.invoke(input_data), estimate(input_data)
+        )
+
+    async def arun(input_data):
+        return await limiter.acall(
+            lambda: runnable.ainvoke(input_data), estimate(input_data)
+        )
+
+    return RunnableLambda(run, afunc=arun)
+
+
+class RateLimitedEmbeddings(Embeddings):
+    """Embeddings wrapper sending every request through a limiter."""
+
+    def __init__(self, embeddings, limiter: ModelCallLimiter):
+        self.embeddings = embeddings
+        self.limiter = limiter
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        with trace_span("embeddings.embed_documents", kind="CLIENT"):
+            return self.limiter.call(
+                lambda: self.embeddings.embed_documents(texts),
+                estimate_tokens(texts),
+            )
+
+    def embed_query(self, text: str) -> list[float]:
+        with trace_span("embeddings.embed_query", kind="CLIENT"):
+            return self.limiter.call(
+                lambda: self.embeddings.embed_query(text),
+                estimate_tokens(text),
+            )
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        with trace_span("embeddings.embed_documents", kind="CLIENT"):
+            return await self.limiter.acall(
+                lambda: self.embeddings.aembed_documents(texts),
+                estimate_tokens(texts),
+            )
+
+    async def aembed_query(self, text: str) -> list[float]:
+        with trace_span("embeddings.embed_query", kind="CLIENT"):
+            return await self.limiter.acall(
+                lambda: self.embeddings.aembed_query(text),
+                estimate_tokens(text),
+            )
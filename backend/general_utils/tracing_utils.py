@@ -0,0 +1,439 @@
+"""
+Module to trace requests across endpoints, chain steps, database and storage calls for job research assistant app.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+from config import (
+    TRACING_EXPORTER,
+    TRACING_FILE_PATH,
+    TRACING_FLUSH_BATCH_SIZE,
+    TRACING_FLUSH_INTERVAL_SECONDS,
+    TRACING_OTLP_ENDPOINT,
+    TRACING_SERVICE_NAME,
+)
+from general_utils.logging import get_logger
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/backend/tracing_utils.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+# Span the code currently runs in. Like the deadline budget, it follows
+# asyncio tasks and executor threads, so child spans find their parent.
+_CURRENT_SPAN: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+# OTLP span kinds
+SPAN_KINDS = {"INTERNAL": 1, "SERVER": 2, "CLIENT": 3}
+
+# Longest attribute value kept, e.g. for SQL statements
+MAX_ATTRIBUTE_LENGTH = 500
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str] | None:
+    """Return the (trace_id, parent_span_id) of a W3C traceparent header."""
+    if not header:
+        return None
+
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+
+    trace_id, parent_span_id = parts[1].lower(), parts[2].lower()
+    if set(trace_id) == {"0"} or set(parent_span_id) == {"0"}:
+        return None
+
+    return trace_id, parent_span_id
+
+
+class Span:
+    """A timed operation of a trace, with OpenTelemetry-style fields."""
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: str | None = None,
+        kind: str = "INTERNAL",
+        attributes: dict | None = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes = {}
+        self.status = "OK"
+        self.status_message = None
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano = None
+
+        for key, value in (attributes or {}).items():
+            self.set_attribute(key, value)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is None:
+            return
+
+        if not isinstance(value, (bool, int, float)):
+            value = str(value)[:MAX_ATTRIBUTE_LENGTH]
+
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "ERROR"
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        self.end_time_unix_nano = time.time_ns()
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": self.end_time_unix_nano,
+            "duration_ms": (
+                (self.end_time_unix_nano - self.start_time_unix_nano) / 1e6
+            ),
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes,
+            "service_name": TRACING_SERVICE_NAME,
+        }
+
+    def to_otlp(self) -> dict:
+        """The span in the OTLP/JSON encoding used by collectors."""
+
+        def otlp_value(value):
+            if isinstance(value, bool):
+                return {"boolValue": value}
+            if isinstance(value, int):
+                return {"intValue": str(value)}
+            if isinstance(value, float):
+                return {"doubleValue": value}
+            return {"stringValue": value}
+
+        otlp_span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano),
+            "attributes": [
+                {"key": key, "value": otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            # 1 is OK, 2 is ERROR
+            "status": {
+                "code": 2 if self.status == "ERROR" else 1,
+                "message": self.status_message or "",
+            },
+        }
+        if self.parent_span_id:
+            otlp_span["parentSpanId"] = self.parent_span_id
+
+        return otlp_span
+
+
+class SpanExporter(ABC):
+    """
+    Buffer finished spans and export them in batches.
+
+    Batches are exported on a background thread, so ending a span never
+    waits on a file or a collector.
+    """
+
+    def __init__(self, batch_size: int, flush_interval_seconds: float):
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._spans = []
+        self._last_flush_time = time.monotonic()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="span_exporter"
+        )
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+            should_flush = (
+                len(self._spans) >= self.batch_size
+                or time.monotonic() - self._last_flush_time
+                >= self.flush_interval_seconds
+            )
+
+        if should_flush:
+            self._executor.submit(self.flush)
+
+    def flush(self) -> None:
+        with self._lock:
+            spans, self._spans = self._spans, []
+            self._last_flush_time = time.monotonic()
+
+        if not spans:
+            return
+
+        try:
+            self._export_batch(spans)
+
+        except Exception as e:
+            # Tracing never fails a request, the batch is dropped
+            file_logger.error(f"Dropped {len(spans)} spans: {e}")
+            stream_logger.error(f"Dropped {len(spans)} spans: {e}")
+
+    async def flush_periodically(self) -> None:
+        """Flush every interval, so the last spans of a quiet period leave."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await loop.run_in_executor(self._executor, self.flush)
+
+    def close(self) -> None:
+        """Export the remaining spans and stop the background thread."""
+        self._executor.shutdown(wait=True)
+        self.flush()
+
+    @abstractmethod
+    def _export_batch(self, spans: list[Span]) -> None:
+        pass
+
+
+class JsonFileSpanExporter(SpanExporter):
+    """Append spans to a file, one JSON object per line."""
+
+    def __init__(self, file_path: str | Path, **kwargs):
+        super().__init__(**kwargs)
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _export_batch(self, spans: list[Span]) -> None:
+        with self.file_path.open("a", encoding="utf-8") as file:
+            for span in spans:
+                file.write(json.dumps(span.to_dict()) + "\n")
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """Send spans to an OpenTelemetry collector over OTLP/HTTP JSON."""
+
+    def __init__(self, endpoint: str, **kwargs):
+        super().__init__(**kwargs)
+        self.traces_url = f"{endpoint.rstrip('/')}/v1/traces"
+
+    def _export_batch(self, spans: list[Span]) -> None:
+        # Imported here so the default, untraced setup does not need it
+        import httpx
+
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": TRACING_SERVICE_NAME},
+                            },
+                            {
+                                "key": "process.pid",
+                                "value": {"intValue": str(os.getpid())},
+                            },
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+        response = httpx.post(self.traces_url, json=payload, timeout=5)
+        response.raise_for_status()
+
+
+def create_span_exporter(exporter: str) -> SpanExporter | None:
+    """Exporter named by TRACING_EXPORTER: none, file or otlp."""
+    options = {
+        "batch_size": TRACING_FLUSH_BATCH_SIZE,
+        "flush_interval_seconds": TRACING_FLUSH_INTERVAL_SECONDS,
+    }
+
+    if exporter == "file":
+        return JsonFileSpanExporter(TRACING_FILE_PATH, **options)
+    if exporter == "otlp":
+        return OtlpHttpSpanExporter(TRACING_OTLP_ENDPOINT, **options)
+    if exporter != "none":
+        stream_logger.warning(
+            f"Unknown tracing exporter '{exporter}', tracing is disabled!"
+        )
+
+    return None
+
+
+SPAN_EXPORTER = create_span_exporter(TRACING_EXPORTER)
+
+
+def close_span_exporter() -> None:
+    if SPAN_EXPORTER is not None:
+        SPAN_EXPORTER.close()
+
+
+def get_current_span() -> Span | None:
+    return _CURRENT_SPAN.get()
+
+
+@contextmanager
+def trace_span(
+    name: str,
+    kind: str = "INTERNAL",
+    attributes: dict | None = None,
+    traceparent: str | None = None,
+):
+    """
+    Run the block in a span, child of the current span if there is one.
+
+    traceparent continues a trace started by a caller, such as the
+    frontend. Yields None when tracing is disabled.
+    """
+    if SPAN_EXPORTER is None:
+        yield None
+        return
+
+    parent_span = _CURRENT_SPAN.get()
+    remote_parent = parse_traceparent(traceparent)
+
+    if parent_span is not None:
+        trace_id, parent_span_id = parent_span.trace_id, parent_span.span_id
+    elif remote_parent is not None:
+        trace_id, parent_span_id = remote_parent
+    else:
+        trace_id, parent_span_id = secrets.token_hex(16), None
+
+    span = Span(name, trace_id, parent_span_id, kind, attributes)
+    token = _CURRENT_SPAN.set(span)
+
+    try:
+        yield span
+
+    except BaseException as e:
+        span.record_error(e)
+        raise
+
+    finally:
+        _CURRENT_SPAN.reset(token)
+        span.end()
+        SPAN_EXPORTER.export(span)
+
+
+def traced(name: str, kind: str = "INTERNAL") -> Callable:
+    """Decorator running every call of a sync or async function in a span."""
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with trace_span(name, kind):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name, kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TracedClient:
+    """
+    Proxy running every method call of a client in a client span.
+
+    Used for SDK clients whose methods are called from many places, so
+    each call is traced without wrapping them one by one. Lazy results,
+    such as listing iterators, are only timed until they are returned.
+    """
+
+    def __init__(self, client: Any, span_prefix: str):
+        self._client = client
+        self._span_prefix = span_prefix
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def traced_method(*args, **kwargs):
+            with trace_span(f"{self._span_prefix}.{name}", kind="CLIENT"):
+                return attribute(*args, **kwargs)
+
+        return traced_method
+
+
+async def trace_http_request(request, call_next):
+    """
+    HTTP middleware running each request in a server span.
+
+    The trace continues from the caller's traceparent header, and the
+    response carries the request's traceparent back.
+    """
+    with trace_span(
+        f"{request.method} {request.url.path}",
+        kind="SERVER",
+        attributes={
+            "http.method": request.method,
+            "http.target": request.url.path,
+        },
+        traceparent=request.headers.get("traceparent"),
+    ) as span:
+        response = await call_next(request)
+
+        if span is not None:
+            route = request.scope.get("route")
+            if route is not None:
+                span.name = f"{request.method} {route.path}"
+                span.set_attribute("http.route", route.path)
+
+            span.set_attribute("http.status_code", response.status_code)
+            if response.status_code >= 500:
+                span.status = "ERROR"
+
+            response.headers["traceparent"] = span.traceparent
+
+    return response
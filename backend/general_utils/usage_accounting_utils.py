@@ -0,0 +1,200 @@
+"""
+Module to account LLM token usage, latency and cost per chain, user and endpoint for job research assistant app.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from config import (
+    LLM_USAGE_FLUSH_BATCH_SIZE,
+    LLM_USAGE_FLUSH_INTERVAL_SECONDS,
+)
+from fastapi import Request
+from general_utils.clients import CLIENTS
+from general_utils.logging import get_logger
+
+file_logger = get_logger(
+    "file_" + __name__,
+    write_to_file=True,
+    log_filepath=Path(r"logs/backend/usage_accounting_utils.log"),
+)
+
+stream_logger = get_logger(
+    "stream_" + __name__,
+)
+
+# Endpoint and user that LLM calls in the current request are billed to.
+# Like the deadline budget, it follows asyncio tasks and executor threads.
+_USAGE_CONTEXT: contextvars.ContextVar[dict] = contextvars.ContextVar(
+    "llm_usage_context", default={}
+)
+
+
+@contextmanager
+def usage_context(endpoint: str | None = None, username: str | None = None):
+    """Bill LLM calls run inside the block to an endpoint and user."""
+    context = dict(_USAGE_CONTEXT.get())
+
+    if endpoint is not None:
+        context["endpoint"] = endpoint
+    if username is not None:
+        context["username"] = username
+
+    token = _USAGE_CONTEXT.set(context)
+    try:
+        yield
+    finally:
+        _USAGE_CONTEXT.reset(token)
+
+
+async def set_usage_endpoint(request: Request) -> None:
+    """
+    App-wide FastAPI dependency billing a request's LLM calls to its route.
+
+    Async dependencies run in the endpoint's context, so the value is seen
+    by the endpoint and everything it awaits or runs on the threadpool.
+    """
+    route = request.scope.get("route")
+    endpoint = getattr(route, "path", request.url.path)
+
+    _USAGE_CONTEXT.set({**_USAGE_CONTEXT.get(), "endpoint": endpoint})
+
+
+class LLMUsageRecorder:
+    """
+    Buffer LLM usage records and write them to Postgres in batches.
+
+    Records are written on a background thread, so model callbacks running
+    on the event loop never wait on the database. Totals per chain are
+    also kept in memory for the health endpoint.
+    """
+
+    def __init__(self, batch_size: int, flush_interval_seconds: float):
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._records = []
+        self._totals = defaultdict(
+            lambda: {
+                "calls": 0,
+                "cache_hits": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "latency_seconds_total": 0.0,
+                "cost_usd": 0.0,
+            }
+        )
+        self._last_flush_time = time.monotonic()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="llm_usage"
+        )
+
+    def record(
+        self,
+        chain_name: str,
+        model: str,
+        route_name: str | None = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        latency_seconds: float = 0.0,
+        cost_usd: float = 0.0,
+        cache_hit: bool = False,
+    ) -> None:
+        context = _USAGE_CONTEXT.get()
+
+        with self._lock:
+            self._records.append(
+                {
+                    "username": context.get("username"),
+                    "endpoint": context.get("endpoint"),
+                    "chain_name": chain_name,
+                    "route_name": route_name,
+                    "model": model,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "latency_seconds": latency_seconds,
+                    "cost_usd": cost_usd,
+                    "cache_hit": cache_hit,
+                }
+            )
+
+            totals = self._totals[chain_name]
+            totals["calls"] += 1
+            totals["cache_hits"] += int(cache_hit)
+            totals["input_tokens"] += input_tokens
+            totals["output_tokens"] += output_tokens
+            totals["latency_seconds_total"] += latency_seconds
+            totals["cost_usd"] += cost_usd
+
+            should_flush = (
+                len(self._records) >= self.batch_size
+                or time.monotonic() - self._last_flush_time
+                >= self.flush_interval_seconds
+            )
+
+        if should_flush:
+            self._executor.submit(self.flush)
+
+    def flush(self) -> None:
+        """Write the buffered records to the database."""
+        with self._lock:
+            records, self._records = self._records, []
+            self._last_flush_time = time.monotonic()
+
+        if not records:
+            return
+
+        try:
+            CLIENTS.postgres_client.insert_llm_usage_records(records)
+
+        except Exception as e:
+            # Usage accounting never fails a request, the batch is dropped
+            file_logger.error(f"Dropped {len(records)} usage records: {e}")
+            stream_logger.error(f"Dropped {len(records)} usage records: {e}")
+
+    async def flush_periodically(self) -> None:
+        """
+        Flush every interval, run as a task for the worker's lifetime.
+
+        record only flushes when a new record arrives, so without this the
+        last records of a quiet period would wait for the next call, and be
+        lost if the worker were killed without closing the recorder.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            # On the recorder's own thread, after any flush record queued
+            await loop.run_in_executor(self._executor, self.flush)
+
+    def close(self) -> None:
+        """Write the remaining records and stop the background thread."""
+        self._executor.shutdown(wait=True)
+        self.flush()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                name: dict(totals) for name, totals in self._totals.items()
+            }
+
+
+LLM_USAGE_RECORDER = LLMUsageRecorder(
+    LLM_USAGE_FLUSH_BATCH_SIZE, LLM_USAGE_FLUSH_INTERVAL_SECONDS
+)
+
+
+def get_llm_usage_metrics() -> dict:
+    """Usage totals per chain since the worker started, costliest first."""
+    return dict(
+        sorted(
+            LLM_USAGE_RECORDER.snapshot().items(),
+            key=lambda item: item[1]["cost_usd"],
+            reverse=True,
+        )
+    )
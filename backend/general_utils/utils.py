@@ -40,3 +40,33 @@ def serialize_for_json(obj) -> dict | list | str | int | float | bool | None:
         return serialize_for_json(obj._asdict())
     else:
         return obj
+
+
+def build_select_list(
+    fields: list[str] | None,
+    allowed_columns: dict[str, str],
+    default_fields: list[str],
+) -> str:
+    """
+    Build a SQL select list from requested field names.
+
+    Args:
+        fields: list[str] | None, requested field names (default_fields if empty)
+        allowed_columns: dict[str, str], field name to SQL expression
+        default_fields: list[str]
+
+    Returns:
+        str
+    """
+    fields = fields or default_fields
+
+    unknown_fields = set(fields) - allowed_columns.keys()
+    if unknown_fields:
+        raise ValueError(
+            f"Unknown fields: {sorted(unknown_fields)}. Allowed fields are: {list(allowed_columns)}"
+        )
+
+    return ", ".join(
+        f"{allowed_columns[field]} AS {field}"
+        for field in dict.fromkeys(fields)
+    )
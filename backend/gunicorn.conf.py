@@ -0,0 +1,38 @@
+"""
+Gunicorn configuration for running the FastAPI backend in production.
+
+Every setting can be overridden through environment variables, e.g.
+WEB_CONCURRENCY=8 gunicorn -c gunicorn.conf.py app:app
+
+Defaults and the load tests behind them are documented in the README
+("Production Server").
+"""
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:80")
+
+# Uvicorn workers run the ASGI app; each worker is a separate process with
+# its own event loop, database pool and threadpool for sync endpoints
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+
+# LLM chains routinely take tens of seconds, so the worker timeout is far
+# above gunicorn's 30s default. On SIGTERM, in-flight requests get
+# graceful_timeout seconds to finish.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "60"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Recycle workers periodically to bound memory growth from parsers and
+# models; the jitter keeps them from restarting together
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Preloading imports the app once before forking, which saves memory and
+# start-up time. Module level clients must then open connections lazily.
+preload_app = os.getenv("GUNICORN_PRELOAD", "false").lower() == "true"
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
@@ -0,0 +1,151 @@
+"""Baseline schema for users, cv_data and cv_analysis_jobs
+
+Creates the tables only when missing so databases bootstrapped before
+migrations existed can be stamped forward without data loss. Duplicate
+CV rows of the same content and user are merged before the unique
+(file_hash, user_id) index is built.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _audit_columns(with_inserted_at: bool = True) -> list[sa.Column]:
+    inserted_at_columns = [
+        sa.Column(
+            "inserted_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    ]
+
+    return (inserted_at_columns if with_inserted_at else []) + [
+        sa.Column(
+            "inserted_by",
+            sa.String(),
+            nullable=False,
+            server_default=sa.func.session_user(),
+        ),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column(
+            "updated_by", sa.String(), server_default=sa.func.session_user()
+        ),
+    ]
+
+
+def upgrade() -> None:
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing_tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("username", sa.String(), nullable=False, unique=True),
+            sa.Column("email", sa.String(), nullable=False, unique=True),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            *_audit_columns(),
+        )
+
+    if "cv_data" not in existing_tables:
+        op.create_table(
+            "cv_data",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "user_id",
+                sa.Integer(),
+                sa.ForeignKey("users.id"),
+                nullable=False,
+            ),
+            sa.Column("file_path", sa.String(), nullable=False),
+            sa.Column("file_name", sa.String(), nullable=False),
+            sa.Column("file_hash", sa.String(), nullable=False),
+            sa.Column("raw_text", sa.String(), nullable=False),
+            sa.Column("extracted_text", JSONB(), nullable=False),
+            sa.Column("contact", sa.String()),
+            sa.Column("certifications", sa.String()),
+            sa.Column("skills", sa.String()),
+            sa.Column("summary", sa.String()),
+            sa.Column("languages", sa.String()),
+            sa.Column("education", JSONB()),
+            sa.Column("experience", JSONB()),
+            sa.Column("projects", JSONB()),
+            *_audit_columns(),
+        )
+    else:
+        # Uploads used to be deduplicated on hash and filename, so a user
+        # may hold several rows of the same content. Analysis jobs are
+        # moved to the oldest row and the others dropped before indexing.
+        if "cv_analysis_jobs" in existing_tables:
+            op.execute("""
+                UPDATE cv_analysis_jobs caj
+                SET cv_id = kept.id
+                FROM
+                    cv_data cd
+                    JOIN (
+                        SELECT file_hash, user_id, MIN(id) AS id
+                        FROM cv_data
+                        GROUP BY file_hash, user_id
+                    ) kept
+                        ON cd.file_hash = kept.file_hash
+                        AND cd.user_id = kept.user_id
+                WHERE
+                    caj.cv_id = cd.id
+                    AND cd.id <> kept.id;
+                """)
+
+        op.execute("""
+            DELETE FROM cv_data cd
+            USING cv_data kept
+            WHERE
+                cd.file_hash = kept.file_hash
+                AND cd.user_id = kept.user_id
+                AND cd.id > kept.id;
+            """)
+
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_cv_data_file_hash_user_id
+            ON cv_data (file_hash, user_id);
+        """)
+
+    if "cv_analysis_jobs" not in existing_tables:
+        op.create_table(
+            "cv_analysis_jobs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "user_id",
+                sa.Integer(),
+                sa.ForeignKey("users.id"),
+                nullable=False,
+            ),
+            sa.Column(
+                "cv_id",
+                sa.Integer(),
+                sa.ForeignKey("cv_data.id"),
+                nullable=False,
+            ),
+            sa.Column("company_name", sa.String(), nullable=False),
+            sa.Column("job_title", sa.String(), nullable=False),
+            sa.Column("raw_analysis_result", JSONB()),
+            # The baseline table had no inserted_at, 0002 adds it
+            *_audit_columns(with_inserted_at=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("cv_analysis_jobs")
+    op.execute("DROP INDEX IF EXISTS ix_cv_data_file_hash_user_id;")
+    op.drop_table("cv_data")
+    op.drop_table("users")
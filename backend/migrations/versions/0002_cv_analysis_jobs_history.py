@@ -0,0 +1,78 @@
+"""Typed status and match_score on cv_analysis_jobs plus history indexes
+
+Adds the inserted_at audit column the baseline table lacked, backfilled
+from updated_at, backfills match_score from raw_analysis_result so the
+history list no longer has to read the JSONB document, and indexes
+(user_id, inserted_at DESC, id DESC) for newest-first per-user
+pagination.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cv_analysis_jobs",
+        sa.Column(
+            "status",
+            sa.String(),
+            nullable=False,
+            server_default="completed",
+        ),
+    )
+    op.add_column("cv_analysis_jobs", sa.Column("match_score", sa.Float()))
+    op.add_column(
+        "cv_analysis_jobs",
+        sa.Column(
+            "inserted_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    # Existing rows were never updated, so updated_at is their insert time
+    op.execute("""
+        UPDATE cv_analysis_jobs
+        SET inserted_at = updated_at
+        WHERE updated_at IS NOT NULL;
+        """)
+
+    # Only rows whose stored score is numeric are copied over
+    op.execute("""
+        UPDATE cv_analysis_jobs
+        SET match_score = (raw_analysis_result->>'match_score')::float
+        WHERE
+            match_score IS NULL
+            AND jsonb_typeof(raw_analysis_result->'match_score') = 'number';
+        """)
+
+    op.create_index(
+        "ix_cv_analysis_jobs_user_id_inserted_at",
+        "cv_analysis_jobs",
+        ["user_id", sa.text("inserted_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index("ix_cv_analysis_jobs_cv_id", "cv_analysis_jobs", ["cv_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cv_analysis_jobs_cv_id", table_name="cv_analysis_jobs")
+    op.drop_index(
+        "ix_cv_analysis_jobs_user_id_inserted_at",
+        table_name="cv_analysis_jobs",
+    )
+    op.drop_column("cv_analysis_jobs", "inserted_at")
+    op.drop_column("cv_analysis_jobs", "match_score")
+    op.drop_column("cv_analysis_jobs", "status")
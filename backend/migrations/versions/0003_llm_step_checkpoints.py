@@ -0,0 +1,72 @@
+"""Checkpointed LLM step outputs for resumable CV analysis runs
+
+Stores each completed step's output keyed by (step_name, input_hash), so
+a failed or cancelled run resumes from its last completed step and runs
+sharing a step input reuse its output. Rows older than the checkpoint TTL
+are no longer reused, and are deleted by updated_at.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_step_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("step_name", sa.String(), nullable=False),
+        sa.Column("input_hash", sa.String(), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("output", JSONB(), nullable=False),
+        sa.Column(
+            "inserted_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "inserted_by",
+            sa.String(),
+            nullable=False,
+            server_default=sa.func.session_user(),
+        ),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column(
+            "updated_by", sa.String(), server_default=sa.func.session_user()
+        ),
+    )
+    op.create_index(
+        "ix_llm_step_checkpoints_step_name_input_hash",
+        "llm_step_checkpoints",
+        ["step_name", "input_hash"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_llm_step_checkpoints_updated_at",
+        "llm_step_checkpoints",
+        ["updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_llm_step_checkpoints_updated_at",
+        table_name="llm_step_checkpoints",
+    )
+    op.drop_index(
+        "ix_llm_step_checkpoints_step_name_input_hash",
+        table_name="llm_step_checkpoints",
+    )
+    op.drop_table("llm_step_checkpoints")
@@ -0,0 +1,68 @@
+"""Per-call LLM usage records for token, latency and cost accounting
+
+One row per model call or checkpoint reuse, with the endpoint and user it
+was billed to, indexed for per-user and per-day aggregation.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_usage",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String()),
+        sa.Column("endpoint", sa.String()),
+        sa.Column("chain_name", sa.String(), nullable=False),
+        sa.Column("route_name", sa.String()),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column(
+            "input_tokens", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "output_tokens", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "latency_seconds", sa.Float(), nullable=False, server_default="0"
+        ),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "cache_hit", sa.Boolean(), nullable=False, server_default="false"
+        ),
+        sa.Column(
+            "inserted_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "inserted_by",
+            sa.String(),
+            nullable=False,
+            server_default=sa.func.session_user(),
+        ),
+    )
+    op.create_index(
+        "ix_llm_usage_username_inserted_at",
+        "llm_usage",
+        ["username", "inserted_at"],
+    )
+    op.create_index("ix_llm_usage_inserted_at", "llm_usage", ["inserted_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_usage_inserted_at", table_name="llm_usage")
+    op.drop_index("ix_llm_usage_username_inserted_at", table_name="llm_usage")
+    op.drop_table("llm_usage")
@@ -0,0 +1,81 @@
+"""
+Module to specify Pydantic models for the LLM model routing config.
+"""
+
+import os
+from typing import Literal
+
+from config import LLM_MODEL_NAME, LLM_TEMPERATURE
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class ModelRoute(BaseModel):
+    """A chat model and the endpoint serving it."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = "default"
+    model: str = LLM_MODEL_NAME
+    temperature: float = LLM_TEMPERATURE
+    max_tokens: int | None = None
+    # OpenAI-compatible endpoint, e.g. a local server; None is OpenAI
+    base_url: str | None = None
+    # Environment variable holding the API key, None for keyless servers
+    api_key_env: str | None = "OPENAI_API_KEY"
+    # Send response schemas as a tool or response format instead of prompt
+    # format instructions; None parses free text with the output parser
+    structured_output_method: (
+        Literal["function_calling", "json_schema"] | None
+    ) = None
+    input_cost_per_1k_tokens: float = 0.0
+    output_cost_per_1k_tokens: float = 0.0
+
+    def get_api_key(self) -> str:
+        # OpenAI-compatible servers without auth still expect some key
+        if self.api_key_env is None:
+            return "not-needed"
+
+        return os.getenv(self.api_key_env) or ""
+
+    def get_cost_usd(self, input_tokens: int, output_tokens: int) -> float:
+        return (
+            input_tokens * self.input_cost_per_1k_tokens
+            + output_tokens * self.output_cost_per_1k_tokens
+        ) / 1000
+
+
+class ModelRoutingConfig(BaseModel):
+    """Routes by name, and the route used by each chain type."""
+
+    routes: dict[str, ModelRoute] = Field(
+        default_factory=lambda: {"default": ModelRoute()}
+    )
+    chains: dict[str, str] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def name_routes(cls, data):
+        # Route names come from their keys in the config file
+        if isinstance(data, dict) and isinstance(data.get("routes"), dict):
+            data["routes"] = {
+                name: {**route, "name": name}
+                for name, route in data["routes"].items()
+            }
+
+        return data
+
+    @model_validator(mode="after")
+    def validate_routes(self):
+        if "default" not in self.routes:
+            raise ValueError("Model routing config needs a 'default' route!")
+
+        unknown_routes = set(self.chains.values()) - set(self.routes)
+        if unknown_routes:
+            raise ValueError(
+                f"Chains are routed to unknown routes: {sorted(unknown_routes)}"
+            )
+
+        return self
+
+    def route_for(self, chain_type: str) -> ModelRoute:
+        return self.routes[self.chains.get(chain_type, "default")]
@@ -1,4 +1,14 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -31,6 +41,16 @@ class User(Base):
 
 class CVData(Base):
     __tablename__ = "cv_data"
+    __table_args__ = (
+        # One row per (content, user); file_hash leads so lookups by hash
+        # alone are index scans too
+        Index(
+            "ix_cv_data_file_hash_user_id",
+            "file_hash",
+            "user_id",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -72,8 +92,11 @@ class CVAnalysisJobs(Base):
     cv_id = Column(Integer, ForeignKey("cv_data.id"), nullable=False)
     company_name = Column(String, nullable=False)
     job_title = Column(String, nullable=False)
+    status = Column(String, nullable=False, server_default="completed")
+    match_score = Column(Float)
     raw_analysis_result = Column(JSONB)
 
+    inserted_at = Column(DateTime, nullable=False, server_default=func.now())
     inserted_by = Column(
         String, nullable=False, server_default=func.session_user()
     )
@@ -88,3 +111,77 @@ class CVAnalysisJobs(Base):
 
     user = relationship("User", back_populates="cv_analysis_jobs")
     cv = relationship("CVData", back_populates="cv_analysis_jobs")
+
+
+# Per-user history, newest first, with id as the keyset tie-breaker
+Index(
+    "ix_cv_analysis_jobs_user_id_inserted_at",
+    CVAnalysisJobs.user_id,
+    CVAnalysisJobs.inserted_at.desc(),
+    CVAnalysisJobs.id.desc(),
+)
+Index("ix_cv_analysis_jobs_cv_id", CVAnalysisJobs.cv_id)
+
+
+class LLMStepCheckpoints(Base):
+    __tablename__ = "llm_step_checkpoints"
+    __table_args__ = (
+        # One output per step and step input, shared by every run
+        Index(
+            "ix_llm_step_checkpoints_step_name_input_hash",
+            "step_name",
+            "input_hash",
+            unique=True,
+        ),
+        Index("ix_llm_step_checkpoints_run_hash", "run_hash"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    step_name = Column(String, nullable=False)
+    input_hash = Column(String, nullable=False)
+    run_hash = Column(String, nullable=False)
+    model = Column(String, nullable=False)
+    output = Column(JSONB, nullable=False)
+
+    inserted_at = Column(DateTime, nullable=False, server_default=func.now())
+    inserted_by = Column(
+        String, nullable=False, server_default=func.session_user()
+    )
+    updated_at = Column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
+    updated_by = Column(
+        String,
+        server_default=func.session_user(),
+        onupdate=func.session_user(),
+    )
+
+
+class LLMUsage(Base):
+    __tablename__ = "llm_usage"
+
+    id = Column(Integer, primary_key=True)
+    username = Column(String)
+    endpoint = Column(String)
+    chain_name = Column(String, nullable=False)
+    route_name = Column(String)
+    model = Column(String, nullable=False)
+    input_tokens = Column(Integer, nullable=False, server_default="0")
+    output_tokens = Column(Integer, nullable=False, server_default="0")
+    latency_seconds = Column(Float, nullable=False, server_default="0")
+    cost_usd = Column(Float, nullable=False, server_default="0")
+    cache_hit = Column(Boolean, nullable=False, server_default="false")
+
+    inserted_at = Column(DateTime, nullable=False, server_default=func.now())
+    inserted_by = Column(
+        String, nullable=False, server_default=func.session_user()
+    )
+
+
+# Per-user usage by day, and daily usage across users
+Index(
+    "ix_llm_usage_username_inserted_at",
+    LLMUsage.username,
+    LLMUsage.inserted_at,
+)
+Index("ix_llm_usage_inserted_at", LLMUsage.inserted_at)
@@ -9,3 +9,8 @@ class UserCreateRequest(BaseModel):
     username: str
     email: EmailStr
     password: SecretStr
+
+
+class UserAuthenticateRequest(BaseModel):
+    login: str
+    password: SecretStr
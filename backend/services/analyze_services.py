@@ -8,23 +8,43 @@ from api_utils.analyze_api_utils import AnalyzeApiUtils
 class AnalyzeServices:
 
     @staticmethod
-    def extract_jd_urls(jd_urls, url_type):
-        return AnalyzeApiUtils.extract_urls(jd_urls, url_type)
+    async def extract_jd_urls(clients, jd_urls, url_type):
+        return await AnalyzeApiUtils.extract_urls(clients, jd_urls, url_type)
 
     @staticmethod
-    def extract_company_urls(company_urls, url_type):
-        return AnalyzeApiUtils.extract_urls(company_urls, url_type)
+    async def extract_company_urls(clients, company_urls, url_type):
+        return await AnalyzeApiUtils.extract_urls(
+            clients, company_urls, url_type
+        )
 
     @staticmethod
-    def analyze(username, cv_object_key, company_name, job_title):
-        return AnalyzeApiUtils.analyze(
-            username, cv_object_key, company_name, job_title
+    async def analyze(
+        clients,
+        user,
+        cv_object_key,
+        company_name,
+        job_title,
+        force_refresh=False,
+    ):
+        return await AnalyzeApiUtils.analyze(
+            clients,
+            user,
+            cv_object_key,
+            company_name,
+            job_title,
+            force_refresh,
         )
 
     @staticmethod
-    def get_cv_analysis_jobs(username):
-        return AnalyzeApiUtils.get_cv_analysis_jobs(username)
+    def get_cv_analysis_jobs(clients, user):
+        return AnalyzeApiUtils.get_cv_analysis_jobs(clients, user)
+
+    @staticmethod
+    def get_cv_analysis_job_summaries(clients, user, limit, before_id, fields):
+        return AnalyzeApiUtils.get_cv_analysis_job_summaries(
+            clients, user, limit, before_id, fields
+        )
 
     @staticmethod
-    def get_cv_analysis_job_by_id(job_id):
-        return AnalyzeApiUtils.get_cv_analysis_job_by_id(job_id)
+    def get_cv_analysis_job_by_id(clients, job_id):
+        return AnalyzeApiUtils.get_cv_analysis_job_by_id(clients, job_id)
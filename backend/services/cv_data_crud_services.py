@@ -7,9 +7,25 @@ from api_utils.cv_data_crud_utils import CVDataCrudApiUtils
 
 class CVDataCrudServices:
     @staticmethod
-    def get_cv_data_by_username(username: str) -> list[dict] | None:
-        return CVDataCrudApiUtils.get_cv_data_by_username(username)
+    def get_cv_data_by_username(clients, username: str) -> list[dict] | None:
+        return CVDataCrudApiUtils.get_cv_data_by_username(clients, username)
 
     @staticmethod
-    def get_cv_data_by_file_hash(file_hash: str) -> dict | None:
-        return CVDataCrudApiUtils.get_cv_data_by_file_hash(file_hash)
+    def get_cv_data_by_file_hash(
+        clients, file_hash: str, user_id: int
+    ) -> dict | None:
+        return CVDataCrudApiUtils.get_cv_data_by_file_hash(
+            clients, file_hash, user_id
+        )
+
+    @staticmethod
+    def get_cv_data_summaries(
+        clients,
+        user_id: int,
+        limit: int = 20,
+        before_id: int | None = None,
+        fields: list[str] | None = None,
+    ) -> dict | None:
+        return CVDataCrudApiUtils.get_cv_data_summaries(
+            clients, user_id, limit, before_id, fields
+        )
@@ -0,0 +1,12 @@
+"""
+Module to specify dashboard services for job research assistant app.
+"""
+
+from api_utils.dashboard_api_utils import DashboardApiUtils
+
+
+class DashboardServices:
+
+    @staticmethod
+    def get_dashboard_summary(clients, user):
+        return DashboardApiUtils.get_dashboard_summary(clients, user)
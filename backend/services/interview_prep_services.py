@@ -7,7 +7,9 @@ from api_utils.interviews_prep_api_utils import InterviewsPrepApiUtils
 
 class InterviewPrepServices:
     @staticmethod
-    def generate_interview_preparation_materials(company_name, job_title):
-        return InterviewsPrepApiUtils.generate_interview_preparation_materials(
-            company_name, job_title
+    async def generate_interview_preparation_materials(
+        user, company_name, job_title
+    ):
+        return await InterviewsPrepApiUtils.generate_interview_preparation_materials(
+            user, company_name, job_title
         )
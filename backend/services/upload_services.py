@@ -8,5 +8,15 @@ from api_utils.upload_api_utils import UploadApiUtils
 class UploadServices:
 
     @staticmethod
-    def upload_file(file, file_content, username):
-        return UploadApiUtils.upload_file(file, file_content, username)
+    async def upload_file(clients, file, file_content, username):
+        return await UploadApiUtils.upload_file(
+            clients, file, file_content, username
+        )
+
+    @staticmethod
+    def check_file_hash(clients, file_hash, username):
+        return UploadApiUtils.check_file_hash(clients, file_hash, username)
+
+    @staticmethod
+    def upload_file_by_hash(clients, file_hash, username):
+        return UploadApiUtils.upload_file_by_hash(clients, file_hash, username)
@@ -0,0 +1,16 @@
+"""
+Module to specify LLM usage services for job research assistant app.
+"""
+
+from api_utils.usage_api_utils import UsageApiUtils
+
+
+class UsageServices:
+
+    @staticmethod
+    async def get_llm_usage_summary(
+        clients, user, start_date, end_date, group_by
+    ):
+        return await UsageApiUtils.get_llm_usage_summary(
+            clients, user, start_date, end_date, group_by
+        )
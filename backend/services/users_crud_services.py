@@ -7,17 +7,25 @@ from api_utils.users_crud_api_utils import UsersCrudApiUtils
 
 class UsersServices:
     @staticmethod
-    def get_users() -> list[dict] | None:
-        return UsersCrudApiUtils.get_users()
+    def get_users(clients) -> list[dict] | None:
+        return UsersCrudApiUtils.get_users(clients)
 
     @staticmethod
-    def create_user(user: dict) -> dict | None:
-        return UsersCrudApiUtils.create_user(user)
+    async def create_user(clients, user: dict) -> dict | None:
+        return await UsersCrudApiUtils.create_user(clients, user)
 
     @staticmethod
-    def get_user_by_username(username: str) -> dict | None:
-        return UsersCrudApiUtils.get_user_by_username(username)
+    async def authenticate_user(
+        clients, login: str, password: str
+    ) -> dict | None:
+        return await UsersCrudApiUtils.authenticate_user(
+            clients, login, password
+        )
 
     @staticmethod
-    def get_user_by_email(email: str) -> dict | None:
-        return UsersCrudApiUtils.get_user_by_email(email)
+    def get_user_by_username(clients, username: str) -> dict | None:
+        return UsersCrudApiUtils.get_user_by_username(clients, username)
+
+    @staticmethod
+    def get_user_by_email(clients, email: str) -> dict | None:
+        return UsersCrudApiUtils.get_user_by_email(clients, email)
@@ -0,0 +1,13 @@
+"""
+Shared test setup for the backend, run from the backend directory with pytest.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Backend modules import each other from the backend root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# No request reaches a provider, but config requires a key to be set
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
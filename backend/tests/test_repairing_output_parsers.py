@@ -0,0 +1,33 @@
+"""
+Tests for the local JSON repair of LLM output.
+"""
+
+import json
+
+import pytest
+from core_langchain.output_parsers.repairing_output_parsers import (
+    repair_json_text,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": 1}', {"a": 1}),
+        ('```json\n{"a": 1}\n```', {"a": 1}),
+        ('Sure, here it is:\n```\n{"a": [1, 2,]}\n```\nDone.', {"a": [1, 2]}),
+        ('Here is it {"a": 1} hope it helps', {"a": 1}),
+        # Backticks inside a string are not a code fence
+        ('Here is it {"s": "a ``` b"}', {"s": "a ``` b"}),
+        # Truncated completions
+        ('{"a": [1, 2', {"a": [1, 2]}),
+        ('{"a": "trunc', {"a": "trunc"}),
+        ('{"a": 1, "b":', {"a": 1}),
+        ('{"a": {"b": 1}, "c', {"a": {"b": 1}}),
+        ('{"a": {"b": 1}, "c"', {"a": {"b": 1}}),
+        # A truncated string in an array is a value, not a key
+        ('{"a": ["x", "y', {"a": ["x", "y"]}),
+    ],
+)
+def test_repair_json_text(text, expected):
+    assert json.loads(repair_json_text(text)) == expected
@@ -15,6 +15,7 @@ from dash import dcc, html
 from dash.dependencies import Input, Output, State
 from utils.auth_utils import JWTTokenAuthUtils
 from utils.backend_api_client import BackendApiClient
+from utils.background_callbacks import BACKGROUND_CALLBACK_MANAGER
 
 # Initialize auth utils
 JWT_AUTH_UTILS = JWTTokenAuthUtils()
@@ -34,6 +35,7 @@ app = dash.Dash(
     __name__,
     title="Job Interview Preparation Assistant",
     external_stylesheets=[dbc.themes.BOOTSTRAP],
+    background_callback_manager=BACKGROUND_CALLBACK_MANAGER,
 )
 
 app.layout = dbc.Container(
@@ -292,11 +294,14 @@ def display_components(pathname, session_data):
                 "/login",
             )
 
-        # Verify user still exists in database
+        # Verify user still exists, resolved by the backend from the token
+        # against its cached user rows
         username = session_data.get("username")
-        user_data = BACKEND_API_CLIENT.get_user_by_username(username)
+        user_response = BACKEND_API_CLIENT.get_current_user(
+            session_data.get("token")
+        )
 
-        if not user_data:
+        if not user_response.get("success"):
             # User no longer exists, logout
             return (
                 LOG_IN_SCREEN.render(),
@@ -2,7 +2,11 @@
 
 import dash_bootstrap_components as dbc
 import pandas as pd
-from components.base_components import BaseComponent
+from components.base_components import (
+    BackgroundJobControls,
+    BaseComponent,
+)
+from config import BACKEND_DROPDOWN_PAGE_SIZE
 from dash import Input, Output, State, dash, dcc, html
 from utils.backend_api_client import BackendApiClient
 
@@ -246,8 +250,11 @@ class AnalyzeScreen(BaseComponent):
         def update_analyze_left_side_content(active_tab, session_store):
             if active_tab == "tab-1":
                 cv_analysis_jobs_response = (
-                    BACKEND_API_CLIENT.get_cv_analysis_jobs(
-                        session_store["username"]
+                    BACKEND_API_CLIENT.list_cv_analysis_jobs(
+                        session_store["username"],
+                        token=session_store.get("token"),
+                        fields=["id"],
+                        limit=BACKEND_DROPDOWN_PAGE_SIZE,
                     )
                 )
 
@@ -256,7 +263,7 @@ class AnalyzeScreen(BaseComponent):
                     if cv_analysis_jobs_response
                     and cv_analysis_jobs_response.get("success")
                     else {}
-                )
+                ).get("items", [])
 
                 cv_analysis_jobs_dropdown_options = [
                     {
@@ -269,7 +276,7 @@ class AnalyzeScreen(BaseComponent):
                 return (
                     dbc.Row(
                         [
-                            # CV dropdown
+                            # Analysis job dropdown
                             html.H6(
                                 "Analysis Job",
                                 style={
@@ -353,16 +360,30 @@ class AnalyzeScreen(BaseComponent):
                 )
 
             elif active_tab == "tab-2":
-                # CV dropdown
-                cv_response = BACKEND_API_CLIENT.get_cv_data_by_username(
-                    session_store["username"]
+                # Fetch all dropdown options concurrently
+                cv_response, company_names_response, job_titles_response = (
+                    BACKEND_API_CLIENT.gather(
+                        lambda: BACKEND_API_CLIENT.list_cvs(
+                            session_store["username"],
+                            token=session_store.get("token"),
+                            fields=["file_name", "file_hash"],
+                            limit=BACKEND_DROPDOWN_PAGE_SIZE,
+                        ),
+                        lambda: BACKEND_API_CLIENT.get_company_names(
+                            session_store["username"]
+                        ),
+                        lambda: BACKEND_API_CLIENT.get_job_titles(
+                            session_store["username"]
+                        ),
+                    )
                 )
 
+                # CV dropdown
                 cv_data = (
                     cv_response.get("data", {})
                     if cv_response and cv_response.get("success")
                     else {}
-                )
+                ).get("items", [])
 
                 cv_dropdown_options = [
                     {
@@ -373,10 +394,6 @@ class AnalyzeScreen(BaseComponent):
                 ]
 
                 # Company dropdown
-                company_names_response = BACKEND_API_CLIENT.get_company_names(
-                    session_store["username"]
-                )
-
                 company_names = (
                     company_names_response.get("data", {})
                     if company_names_response
@@ -393,10 +410,6 @@ class AnalyzeScreen(BaseComponent):
                 ]
 
                 # Job title dropdown
-                job_titles_response = BACKEND_API_CLIENT.get_job_titles(
-                    session_store["username"]
-                )
-
                 job_titles = (
                     job_titles_response.get("data", {})
                     if job_titles_response
@@ -489,6 +502,14 @@ class AnalyzeScreen(BaseComponent):
                                 id="upload-tab-2-status-3",
                                 className="mb-3",
                             ),
+                            # Results of an identical analysis are reused
+                            # unless the user asks to regenerate them
+                            dbc.Checkbox(
+                                id="analyze-force-refresh-2",
+                                label="Regenerate instead of reusing earlier results",
+                                value=False,
+                                className="mb-3",
+                            ),
                             html.Div(
                                 dbc.Button(
                                     "Analyze",
@@ -505,23 +526,28 @@ class AnalyzeScreen(BaseComponent):
                                     "textAlign": "center",
                                 },
                             ),
+                            BackgroundJobControls.render(
+                                "analyze-progress-2", "analyze-cancel-btn-2"
+                            ),
                         ],
                     ),
                     None,
                 )
 
             elif active_tab == "tab-3":
-
                 # CV dropdown
-                cv_response = BACKEND_API_CLIENT.get_cv_data_by_username(
-                    session_store["username"]
+                cv_response = BACKEND_API_CLIENT.list_cvs(
+                    session_store["username"],
+                    token=session_store.get("token"),
+                    fields=["file_name", "file_hash"],
+                    limit=BACKEND_DROPDOWN_PAGE_SIZE,
                 )
 
                 cv_data = (
                     cv_response.get("data", {})
                     if cv_response and cv_response.get("success")
                     else {}
-                )
+                ).get("items", [])
 
                 cv_dropdown_options = [
                     {
@@ -624,6 +650,14 @@ class AnalyzeScreen(BaseComponent):
                                 id="upload-tab-3-status-3",
                                 className="mb-3",
                             ),
+                            # Results of an identical analysis are reused
+                            # unless the user asks to regenerate them
+                            dbc.Checkbox(
+                                id="analyze-force-refresh-3",
+                                label="Regenerate instead of reusing earlier results",
+                                value=False,
+                                className="mb-3",
+                            ),
                             html.Div(
                                 dbc.Button(
                                     "Analyze",
@@ -640,6 +674,9 @@ class AnalyzeScreen(BaseComponent):
                                     "textAlign": "center",
                                 },
                             ),
+                            BackgroundJobControls.render(
+                                "analyze-progress-3", "analyze-cancel-btn-3"
+                            ),
                         ],
                     ),
                     None,
@@ -864,16 +901,29 @@ class AnalyzeScreen(BaseComponent):
                 State("analyze-cv-dropdown-2", "options"),
                 State("analyze-company-dropdown", "value"),
                 State("analyze-job-title-dropdown", "value"),
+                State("analyze-force-refresh-2", "value"),
                 State("session-store", "data"),
             ],
+            background=True,
+            running=[
+                (Output("analyze-btn-2", "disabled"), True, False),
+                (Output("analyze-cancel-btn-2", "disabled"), False, True),
+            ],
+            cancel=[Input("analyze-cancel-btn-2", "n_clicks")],
+            progress=[
+                Output("analyze-progress-2", "value"),
+                Output("analyze-progress-2", "label"),
+            ],
             prevent_initial_call=True,
         )
         def update_analyze_card_header(
+            set_progress,
             n_clicks,
             file_hash,
             options,
             company_name,
             job_title,
+            force_refresh,
             session_store,
         ):
             if not n_clicks:
@@ -894,11 +944,15 @@ class AnalyzeScreen(BaseComponent):
                 object_key = f"{file_hash}/{file_name}"
 
                 # Analyze the CV based on the company name and job title
+                set_progress((10, "Analyzing CV..."))
+
                 analyze_response = BACKEND_API_CLIENT.analyze_cv(
                     session_store["username"],
                     object_key,
                     company_name,
                     job_title,
+                    token=session_store.get("token"),
+                    force_refresh=bool(force_refresh),
                 )
 
                 analyze_data = (
@@ -914,8 +968,11 @@ class AnalyzeScreen(BaseComponent):
                         )
                     )
                 except Exception as e:
+                    set_progress((0, "Analysis failed"))
                     return [dash.no_update] * 4
 
+                set_progress((90, "Loading results..."))
+
                 job_data = (
                     job_response.get("data", {})
                     if job_response and job_response.get("success")
@@ -926,6 +983,8 @@ class AnalyzeScreen(BaseComponent):
                     job_data.get("raw_analysis_result", {})
                 )
 
+                set_progress((100, "Done"))
+
                 return (
                     analyze_table,
                     dash.no_update,
@@ -965,16 +1024,29 @@ class AnalyzeScreen(BaseComponent):
                 State("analyze-cv-dropdown-3", "options"),
                 State("analyze-company-urls-input-3", "value"),
                 State("analyze-job-description-urls-input-3", "value"),
+                State("analyze-force-refresh-3", "value"),
                 State("session-store", "data"),
             ],
+            background=True,
+            running=[
+                (Output("analyze-btn-3", "disabled"), True, False),
+                (Output("analyze-cancel-btn-3", "disabled"), False, True),
+            ],
+            cancel=[Input("analyze-cancel-btn-3", "n_clicks")],
+            progress=[
+                Output("analyze-progress-3", "value"),
+                Output("analyze-progress-3", "label"),
+            ],
             prevent_initial_call=True,
         )
         def update_tab_3_analyze_card_table(
+            set_progress,
             n_clicks,
             file_hash,
             options,
             company_urls,
             job_description_urls,
+            force_refresh,
             session_store,
         ):
             if not n_clicks:
@@ -1005,12 +1077,19 @@ class AnalyzeScreen(BaseComponent):
                     url.strip() for url in job_description_urls.split("\n")
                 ]
 
-                company_urls_response = (
-                    BACKEND_API_CLIENT.extract_company_urls(company_urls)
-                )
+                # Company and job description URLs are independent, so
+                # they are extracted concurrently
+                set_progress((10, "Extracting URLs..."))
 
-                job_description_urls_response = (
-                    BACKEND_API_CLIENT.extract_jd_urls(job_description_urls)
+                company_urls_response, job_description_urls_response = (
+                    BACKEND_API_CLIENT.gather(
+                        lambda: BACKEND_API_CLIENT.extract_company_urls(
+                            company_urls
+                        ),
+                        lambda: BACKEND_API_CLIENT.extract_jd_urls(
+                            job_description_urls
+                        ),
+                    )
                 )
 
                 # Check if there are existing Company URLs data
@@ -1081,15 +1160,21 @@ class AnalyzeScreen(BaseComponent):
 
                 # Analyze the CV based on the company URLs and job description URLs
                 if accessible_company_urls and accessible_job_description_urls:
+                    set_progress((50, "Analyzing CV..."))
+
                     analyze_response = BACKEND_API_CLIENT.analyze_cv(
                         session_store["username"],
                         object_key,
                         company_name,
                         job_title,
+                        token=session_store.get("token"),
+                        force_refresh=bool(force_refresh),
                     )
                 else:
                     status_message = f"All the URLs are not accessible!"
 
+                    set_progress((0, "URLs not accessible"))
+
                     status_alert = dbc.Alert(
                         [status_message],
                         color="danger",
@@ -1118,8 +1203,11 @@ class AnalyzeScreen(BaseComponent):
                         )
                     )
                 except Exception as e:
+                    set_progress((0, "Analysis failed"))
                     return [dash.no_update] * 6
 
+                set_progress((90, "Loading results..."))
+
                 job_data = (
                     job_response.get("data", {})
                     if job_response and job_response.get("success")
@@ -1130,6 +1218,8 @@ class AnalyzeScreen(BaseComponent):
                     job_data.get("raw_analysis_result", {})
                 )
 
+                set_progress((100, "Done"))
+
                 # If there are some non-accessible URLs, show a warning
                 if (
                     non_accessible_company_urls
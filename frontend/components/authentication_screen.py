@@ -500,36 +500,6 @@ class SignUpScreen(BaseComponent):
                         dash.no_update,
                     )
 
-                # Check if username already exists
-                if (
-                    BACKEND_API_CLIENT.get_user_by_username(
-                        reg_username_input
-                    ).get("message")
-                    == "User found!"
-                ):
-                    return (
-                        dash.no_update,
-                        "Username already exists. Please try again.",
-                        True,
-                        "danger",
-                        dash.no_update,
-                    )
-
-                # Check if email already exists
-                if (
-                    BACKEND_API_CLIENT.get_user_by_email(reg_email_input).get(
-                        "message"
-                    )
-                    == "User found!"
-                ):
-                    return (
-                        dash.no_update,
-                        "Email already exists. Please try again.",
-                        True,
-                        "danger",
-                        dash.no_update,
-                    )
-
                 # Create user
                 try:
                     user_data = BACKEND_API_CLIENT.create_user(
@@ -548,6 +518,19 @@ class SignUpScreen(BaseComponent):
                         dash.no_update,
                     )
 
+                # Username and email uniqueness are checked by the backend
+                # in the same statement that creates the user
+                if user_data and user_data.get("message") == (
+                    "User already exists!"
+                ):
+                    return (
+                        dash.no_update,
+                        "Username or email already exists. Please try again.",
+                        True,
+                        "danger",
+                        dash.no_update,
+                    )
+
                 if user_data:
                     token = JWT_AUTH_UTILS.generate_jwt_token(
                         user_data["username"], user_data["email"]
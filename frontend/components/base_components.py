@@ -5,6 +5,7 @@ Base frontend component for the Job Research Assistant app.
 from abc import ABC, abstractmethod
 from typing import Any
 
+import dash_bootstrap_components as dbc
 from dash import Input, Output, dash, html
 
 
@@ -65,3 +66,47 @@ class PageTitle(BaseComponent):
             # tagline = "Land more interviews with a CV that fits"
 
             return PageTitle.render(title)
+
+
+class BackgroundJobControls(BaseComponent):
+    """
+    Progress bar and cancel button of a background callback.
+
+    Components/Ids:
+        - progress bar: progress_id
+        - cancel button: cancel_button_id
+    """
+
+    @staticmethod
+    def render(progress_id: str, cancel_button_id: str):
+        """
+        Render the progress bar and cancel button of a background job.
+        """
+        return html.Div(
+            [
+                dbc.Progress(
+                    id=progress_id,
+                    value=0,
+                    label="",
+                    striped=True,
+                    animated=True,
+                    className="mb-2",
+                    style={"height": "20px", "borderRadius": "8px"},
+                ),
+                dbc.Button(
+                    "Cancel",
+                    id=cancel_button_id,
+                    color="secondary",
+                    outline=True,
+                    size="sm",
+                    disabled=True,
+                    style={"borderRadius": "8px"},
+                ),
+            ],
+            style={"textAlign": "center", "marginTop": "10px"},
+        )
+
+    @staticmethod
+    def register_callbacks(app: dash.Dash):
+        """Progress and cancel are wired by the owning background callback."""
+        pass
@@ -27,6 +27,8 @@ class DashboardScreen(BaseComponent):
         - dashboard-overview-card-2-chart: dashboard-overview-card-2-chart
         - dashboard-overview-card-3-header: dashboard-overview-card-3-header
         - dashboard-overview-card-3-table: dashboard-overview-card-3-table
+        - dashboard-cv-load-more-btn: dashboard-cv-load-more-btn
+        - dashboard-cv-page-store: dashboard-cv-page-store
         - dashboard-overview-card-4-header: dashboard-overview-card-4-header
         - dashboard-overview-card-4-table: dashboard-overview-card-4-table
         - dashboard-overview-card-5-header: dashboard-overview-card-5-header
@@ -42,6 +44,8 @@ class DashboardScreen(BaseComponent):
                     id="active-card-store",
                     data="dashboard-total-cvs-uploaded-card",
                 ),
+                # Loaded CVs and the cursor of their next page
+                dcc.Store(id="dashboard-cv-page-store"),
                 # Statistics Cards
                 html.Div(id="dashboard-user-stats-cards", className="mb-4"),
                 # Charts Section
@@ -121,7 +125,14 @@ class DashboardScreen(BaseComponent):
                                             [
                                                 html.Div(
                                                     id="dashboard-overview-card-3-table"
-                                                )
+                                                ),
+                                                dbc.Button(
+                                                    "Load more",
+                                                    id="dashboard-cv-load-more-btn",
+                                                    color="link",
+                                                    className="w-100",
+                                                    disabled=True,
+                                                ),
                                             ]
                                         ),
                                     ],
@@ -191,15 +202,13 @@ class DashboardScreen(BaseComponent):
         )
 
     @staticmethod
-    def create_stats_cards(
-        cv_data, company_names, job_titles, ai_analysis_jobs
-    ):
+    def create_stats_cards(dashboard_summary):
         """Create statistics cards for the dashboard."""
-        total_cvs_uploaded = len(cv_data) if cv_data else 0
-        total_companies = len(company_names) if company_names else 0
-        total_job_titles = len(job_titles) if job_titles else 0
-        total_ai_analysis_jobs = (
-            len(ai_analysis_jobs) if ai_analysis_jobs else 0
+        total_cvs_uploaded = dashboard_summary.get("total_cvs_uploaded", 0)
+        total_companies = dashboard_summary.get("total_companies", 0)
+        total_job_titles = dashboard_summary.get("total_job_titles", 0)
+        total_ai_analysis_jobs = dashboard_summary.get(
+            "total_ai_analysis_jobs", 0
         )
 
         return dbc.Row(
@@ -385,14 +394,14 @@ class DashboardScreen(BaseComponent):
 
     @staticmethod
     def create_cv_data_table(cv_data):
-        """Create a table of recent 5 cv data."""
+        """Create a table of the loaded cv data, most recent first."""
         if not cv_data:
             return html.P(
                 "No cv data found", className="text-muted text-center"
             )
 
-        # Sort by ID (most recent first) and take top 10
-        sorted_cv = sorted(cv_data, key=lambda x: x.get("id", 0))[:5]
+        # Sort by ID (most recent first)
+        sorted_cv = sorted(cv_data, key=lambda x: x.get("id", 0), reverse=True)
 
         table_rows = []
         for cv in sorted_cv:
@@ -456,56 +465,24 @@ class DashboardScreen(BaseComponent):
         )
         def populate_user_stats_cards(pathname, session_store):
             if pathname == "/dashboard":
-                # Fetch cv data
-                cv_response = BACKEND_API_CLIENT.get_cv_data_by_username(
-                    session_store["username"]
-                )
-
-                cv_data = (
-                    cv_response.get("data", [])
-                    if cv_response and cv_response.get("success")
-                    else []
-                )
-
-                # Fetch company names
-                company_names_response = BACKEND_API_CLIENT.get_company_names(
-                    session_store["username"]
-                )
-
-                company_names = (
-                    company_names_response.get("data", {})
-                    if company_names_response
-                    and company_names_response.get("success")
-                    else {}
-                ).get("company_names", [])
-
-                # Fetch job titles from company names
-                job_titles_response = BACKEND_API_CLIENT.get_job_titles()
-
-                job_titles = (
-                    job_titles_response.get("data", {})
-                    if job_titles_response
-                    and job_titles_response.get("success")
-                    else {}
-                ).get("job_titles", [])
-
-                # Fetch ai analysis jobs
-                ai_analysis_jobs_response = (
-                    BACKEND_API_CLIENT.get_cv_analysis_jobs(
-                        session_store["username"]
+                # Fetch all counts in a single request
+                dashboard_summary_response = (
+                    BACKEND_API_CLIENT.get_dashboard_summary(
+                        session_store["username"],
+                        token=session_store.get("token"),
                     )
                 )
 
-                ai_analysis_jobs = (
-                    ai_analysis_jobs_response.get("data", {})
-                    if ai_analysis_jobs_response
-                    and ai_analysis_jobs_response.get("success")
+                dashboard_summary = (
+                    dashboard_summary_response.get("data", {})
+                    if dashboard_summary_response
+                    and dashboard_summary_response.get("success")
                     else {}
                 )
 
                 # Create stats cards
                 stats_cards = DashboardScreen.create_stats_cards(
-                    cv_data, company_names, job_titles, ai_analysis_jobs
+                    dashboard_summary
                 )
 
                 return stats_cards
@@ -672,23 +649,60 @@ class DashboardScreen(BaseComponent):
                     "dashboard-overview-card-5-table",
                     "children",
                 ),
+                Output("dashboard-cv-page-store", "data"),
+                Output("dashboard-cv-load-more-btn", "disabled"),
+            ],
+            [
+                Input("url", "pathname"),
+                Input("dashboard-cv-load-more-btn", "n_clicks"),
+            ],
+            [
+                State("dashboard-cv-page-store", "data"),
+                State("session-store", "data"),
             ],
-            [Input("url", "pathname")],
-            [State("session-store", "data")],
             prevent_initial_call=False,
         )
-        def update_dashboard(pathname, session_store):
-            # Fetch cv data
-            cv_response = BACKEND_API_CLIENT.get_cv_data_by_username(
-                session_store["username"]
+        def update_dashboard(pathname, n_clicks, cv_page_store, session_store):
+            # Load more appends the next page of CVs, navigating to the
+            # dashboard starts again from the newest page
+            cv_page_store = cv_page_store or {}
+            load_more = ctx.triggered_id == "dashboard-cv-load-more-btn"
+
+            loaded_cvs = cv_page_store.get("items", []) if load_more else []
+            before_id = (
+                cv_page_store.get("next_before_id") if load_more else None
             )
 
-            cv_data = (
-                cv_response.get("data", [])
+            # Fetch cv data, company names and job titles concurrently
+            cv_response, company_names_response, job_titles_response = (
+                BACKEND_API_CLIENT.gather(
+                    lambda: BACKEND_API_CLIENT.list_cvs(
+                        session_store["username"],
+                        token=session_store.get("token"),
+                        fields=[
+                            "id",
+                            "file_name",
+                            "summary",
+                            "inserted_at",
+                            "updated_at",
+                        ],
+                        before_id=before_id,
+                    ),
+                    lambda: BACKEND_API_CLIENT.get_company_names(),
+                    lambda: BACKEND_API_CLIENT.get_job_titles(),
+                )
+            )
+
+            # A failed page keeps its cursor, so it can be loaded again
+            cv_page = (
+                cv_response.get("data", {})
                 if cv_response and cv_response.get("success")
-                else []
+                else {"items": [], "next_before_id": before_id}
             )
 
+            cv_data = loaded_cvs + cv_page.get("items", [])
+            next_before_id = cv_page.get("next_before_id")
+
             if cv_data:
                 df_users = pd.DataFrame(cv_data)
                 df_users["inserted_at"] = pd.to_datetime(
@@ -759,10 +773,8 @@ class DashboardScreen(BaseComponent):
                 cv_table = DashboardScreen.create_cv_data_table(cv_data)
 
                 # Create company names table
-                company_names = (
-                    BACKEND_API_CLIENT.get_company_names()
-                    .get("data", [])
-                    .get("company_names", [])
+                company_names = company_names_response.get("data", {}).get(
+                    "company_names", []
                 )
 
                 company_names_table = dbc.Table(
@@ -793,10 +805,8 @@ class DashboardScreen(BaseComponent):
                 )
 
                 # Create job titles table
-                job_titles = (
-                    BACKEND_API_CLIENT.get_job_titles()
-                    .get("data", [])
-                    .get("job_titles", [])
+                job_titles = job_titles_response.get("data", {}).get(
+                    "job_titles", []
                 )
 
                 job_titles_table = dbc.Table(
@@ -852,4 +862,6 @@ class DashboardScreen(BaseComponent):
                 company_names_table,
                 "Job titles table",
                 job_titles_table,
+                {"items": cv_data, "next_before_id": next_before_id},
+                next_before_id is None,
             )
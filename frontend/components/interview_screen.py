@@ -1,7 +1,10 @@
 """Interview screen component."""
 
 import dash_bootstrap_components as dbc
-from components.base_components import BaseComponent
+from components.base_components import (
+    BackgroundJobControls,
+    BaseComponent,
+)
 from dash import Input, Output, State, dash, dcc, html
 from utils.backend_api_client import BackendApiClient
 
@@ -108,6 +111,10 @@ class InterviewScreen(BaseComponent):
                                                 "textAlign": "center",
                                             },
                                         ),
+                                        BackgroundJobControls.render(
+                                            "interview-progress",
+                                            "interview-cancel-btn",
+                                        ),
                                     ],
                                 )
                             ],
@@ -422,15 +429,30 @@ class InterviewScreen(BaseComponent):
             [
                 State("interview-company-dropdown", "value"),
                 State("interview-job-title-dropdown", "value"),
+                State("session-store", "data"),
+            ],
+            background=True,
+            running=[
+                (Output("interview-btn", "disabled"), True, False),
+                (Output("interview-cancel-btn", "disabled"), False, True),
+            ],
+            cancel=[Input("interview-cancel-btn", "n_clicks")],
+            progress=[
+                Output("interview-progress", "value"),
+                Output("interview-progress", "label"),
             ],
             prevent_initial_call=True,
         )
-        def update_interview_card_table(n_clicks, company_name, job_title):
+        def update_interview_card_table(
+            set_progress, n_clicks, company_name, job_title, session_store
+        ):
             if company_name and job_title:
+                set_progress((10, "Generating interview prep..."))
 
                 interview_response = BACKEND_API_CLIENT.interview_prep(
                     company_name,
                     job_title,
+                    token=(session_store or {}).get("token"),
                 )
 
                 interview_data = (
@@ -449,6 +471,8 @@ class InterviewScreen(BaseComponent):
 
                 status_message = interview_data.get("message", "N/A")
 
+                set_progress((100, "Done"))
+
                 return (
                     interview_card_table_questions_and_answers,
                     interview_card_table_additional_resources,
@@ -483,11 +507,19 @@ class InterviewScreen(BaseComponent):
             if pathname != "/interview" or not session_store:
                 return [], []
 
-            # Company dropdown
-            company_names_response = BACKEND_API_CLIENT.get_company_names(
-                session_store["username"]
+            # Fetch both dropdown options concurrently
+            company_names_response, job_titles_response = (
+                BACKEND_API_CLIENT.gather(
+                    lambda: BACKEND_API_CLIENT.get_company_names(
+                        session_store["username"]
+                    ),
+                    lambda: BACKEND_API_CLIENT.get_job_titles(
+                        session_store["username"]
+                    ),
+                )
             )
 
+            # Company dropdown
             company_names = (
                 company_names_response.get("data", {})
                 if company_names_response
@@ -504,10 +536,6 @@ class InterviewScreen(BaseComponent):
             ]
 
             # Job title dropdown
-            job_titles_response = BACKEND_API_CLIENT.get_job_titles(
-                session_store["username"]
-            )
-
             job_titles = (
                 job_titles_response.get("data", {})
                 if job_titles_response and job_titles_response.get("success")
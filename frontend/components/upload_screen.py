@@ -2,6 +2,7 @@
 
 import dash_bootstrap_components as dbc
 from components.base_components import BaseComponent
+from config import BACKEND_DROPDOWN_PAGE_SIZE
 from dash import Input, Output, State, dash, dcc, html
 from utils.backend_api_client import BackendApiClient
 
@@ -286,7 +287,10 @@ class UploadScreen(BaseComponent):
             else:
                 try:
                     response = BACKEND_API_CLIENT.upload_file(
-                        session_store["username"], contents, filename
+                        session_store["username"],
+                        contents,
+                        filename,
+                        token=session_store.get("token"),
                     )
 
                     file_hash = (
@@ -316,7 +320,7 @@ class UploadScreen(BaseComponent):
                 )
 
                 cv_response = BACKEND_API_CLIENT.get_cv_data_by_file_hash(
-                    file_hash
+                    file_hash, token=session_store.get("token")
                 )
 
                 cv_data = (
@@ -350,15 +354,18 @@ class UploadScreen(BaseComponent):
         )
         def update_cv_preview_table_from_dropdown(value, session_store):
             """Update the CV preview table from dropdown."""
-            cv_response = BACKEND_API_CLIENT.get_cv_data_by_username(
-                session_store["username"]
+            cv_response = BACKEND_API_CLIENT.list_cvs(
+                session_store["username"],
+                token=session_store.get("token"),
+                fields=["file_name", "file_hash"],
+                limit=BACKEND_DROPDOWN_PAGE_SIZE,
             )
 
             cv_data = (
                 cv_response.get("data", {})
                 if cv_response and cv_response.get("success")
                 else {}
-            )
+            ).get("items", [])
 
             cv_dropdown_options = [
                 {
@@ -368,7 +375,9 @@ class UploadScreen(BaseComponent):
                 for cv in cv_data
             ]
 
-            cv_response = BACKEND_API_CLIENT.get_cv_data_by_file_hash(value)
+            cv_response = BACKEND_API_CLIENT.get_cv_data_by_file_hash(
+                value, token=session_store.get("token")
+            )
 
             cv_data = (
                 cv_response.get("data", {})
@@ -9,6 +9,42 @@ load_dotenv(env_path, override=True)
 # Backend URL
 BACKEND_URL = os.getenv("BACKEND_URL")
 
+# Backend connection pool and timeouts (seconds)
+BACKEND_POOL_MAXSIZE = int(os.getenv("BACKEND_POOL_MAXSIZE", "20"))
+BACKEND_MAX_RETRIES = int(os.getenv("BACKEND_MAX_RETRIES", "3"))
+BACKEND_CONNECT_TIMEOUT = float(os.getenv("BACKEND_CONNECT_TIMEOUT", "3.05"))
+BACKEND_READ_TIMEOUT = float(os.getenv("BACKEND_READ_TIMEOUT", "30"))
+BACKEND_LLM_READ_TIMEOUT = float(os.getenv("BACKEND_LLM_READ_TIMEOUT", "300"))
+
+# Threads for independent backend calls issued concurrently
+BACKEND_FANOUT_WORKERS = int(os.getenv("BACKEND_FANOUT_WORKERS", "8"))
+
+# Short-lived cache of catalog and per-user list responses, shared by
+# gunicorn workers through a local directory
+BACKEND_CACHE_DIR = os.getenv("BACKEND_CACHE_DIR", "cache/backend_api")
+BACKEND_CACHE_TTL_SECONDS = int(os.getenv("BACKEND_CACHE_TTL_SECONDS", "60"))
+
+# Items fetched per page of the CV and analysis job lists
+BACKEND_PAGE_SIZE = int(os.getenv("BACKEND_PAGE_SIZE", "20"))
+
+# Newest CVs and analysis jobs offered in dropdowns, at most 100
+BACKEND_DROPDOWN_PAGE_SIZE = int(
+    os.getenv("BACKEND_DROPDOWN_PAGE_SIZE", "100")
+)
+
+# Background callback results store, shared by gunicorn workers
+BACKGROUND_CALLBACK_CACHE_DIR = os.getenv(
+    "BACKGROUND_CALLBACK_CACHE_DIR", "cache/background_callbacks"
+)
+BACKGROUND_CALLBACK_EXPIRE_SECONDS = int(
+    os.getenv("BACKGROUND_CALLBACK_EXPIRE_SECONDS", "3600")
+)
+
+# Backend calls slower than this are logged as warnings
+BACKEND_SLOW_REQUEST_SECONDS = float(
+    os.getenv("BACKEND_SLOW_REQUEST_SECONDS", "2")
+)
+
 # Secret Key for JWT authentication
 SECRET_KEY = os.getenv("SECRET_KEY")
 
@@ -6,7 +6,6 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import bcrypt
 import jwt
 from config import ALGORITHM, EXPIRATION_MINUTES, SECRET_KEY
 from utils.backend_api_client import BackendApiClient
@@ -77,36 +76,21 @@ class JWTTokenAuthUtils:
 
         return None
 
-    def verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify a password against a hashed password."""
-        return bcrypt.checkpw(
-            password.encode("utf-8"), hashed_password.encode("utf-8")
-        )
-
     def authenticate_user(
         self, login_input: str, password: str
     ) -> Optional[Dict[str, Any]]:
-        """Authenticate user against PostgreSQL database."""
-        user_response = BACKEND_API_CLIENT.get_user_by_username(login_input)
+        """
+        Authenticate user against PostgreSQL database.
 
-        user_data = (
-            user_response.get("data", {})
-            if user_response and user_response.get("success")
-            else {}
+        The password is verified by the backend on its password hashing
+        pool, in one request instead of a lookup by username then email.
+        """
+        user_response = BACKEND_API_CLIENT.authenticate_user(
+            login_input, password
         )
 
-        if not user_data:
-            user_response = BACKEND_API_CLIENT.get_user_by_email(login_input)
-            user_data = (
-                user_response.get("data", {})
-                if user_response and user_response.get("success")
-                else {}
-            )
-
-        if user_data and self.verify_password(
-            password, user_data.get("hashed_password", "")
-        ):
-            return user_data
+        if user_response and user_response.get("success"):
+            return user_response.get("data")
 
         return None
 
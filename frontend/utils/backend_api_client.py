@@ -3,12 +3,34 @@ Utility module to interact with the backend API.
 """
 
 import base64
+import hashlib
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
 
+import diskcache
 import requests
-from config import BACKEND_URL
+from config import (
+    BACKEND_CACHE_DIR,
+    BACKEND_CACHE_TTL_SECONDS,
+    BACKEND_CONNECT_TIMEOUT,
+    BACKEND_FANOUT_WORKERS,
+    BACKEND_LLM_READ_TIMEOUT,
+    BACKEND_MAX_RETRIES,
+    BACKEND_PAGE_SIZE,
+    BACKEND_POOL_MAXSIZE,
+    BACKEND_READ_TIMEOUT,
+    BACKEND_SLOW_REQUEST_SECONDS,
+    BACKEND_URL,
+)
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, RequestException, Timeout
+from urllib3.util.retry import Retry
+from utils.latency_metrics import LatencyMetrics
 from utils.logging import get_logger
 
 file_logger = get_logger(
@@ -22,38 +44,203 @@ stream_logger = get_logger(
 )
 
 
+# Endpoints running LLM chains get a longer read timeout
+LLM_ENDPOINTS = {
+    "/analyze/analyze_cv",
+    "/analyze/extract_jd_urls",
+    "/analyze/extract_company_urls",
+    "/interview_prep",
+    "/upload_file/",
+}
+
+# One keep-alive connection pool per process, shared by all clients
+_SESSION = None
+_SESSION_PID = None
+_SESSION_LOCK = threading.Lock()
+
+LATENCY_METRICS = LatencyMetrics()
+
+# Response cache shared by workers on this host, opened lazily per process
+_RESPONSE_CACHE = None
+_RESPONSE_CACHE_PID = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Cache tag of responses derived from job description and company
+# embeddings, shared by all users
+CATALOG_CACHE_TAG = "catalog"
+
+# Dashboard summary counts derived from the catalog rather than the user
+CATALOG_SUMMARY_KEYS = ("total_companies", "total_job_titles")
+
+# Threads for BackendApiClient.gather, created lazily per process
+_FANOUT_EXECUTOR = None
+_FANOUT_EXECUTOR_PID = None
+_FANOUT_EXECUTOR_LOCK = threading.Lock()
+
+
+def _create_session() -> requests.Session:
+    # Only idempotent requests are retried on 502/503/504. Connection
+    # errors are retried for every method, as nothing reached the backend.
+    retries = Retry(
+        total=BACKEND_MAX_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=BACKEND_POOL_MAXSIZE,
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """Get this process's pooled session, recreated after a fork."""
+    global _SESSION, _SESSION_PID
+
+    with _SESSION_LOCK:
+        if _SESSION is None or _SESSION_PID != os.getpid():
+            _SESSION = _create_session()
+            _SESSION_PID = os.getpid()
+
+        return _SESSION
+
+
+def get_fanout_executor() -> ThreadPoolExecutor:
+    """Get this process's fan-out thread pool, recreated after a fork."""
+    global _FANOUT_EXECUTOR, _FANOUT_EXECUTOR_PID
+
+    with _FANOUT_EXECUTOR_LOCK:
+        if _FANOUT_EXECUTOR is None or _FANOUT_EXECUTOR_PID != os.getpid():
+            _FANOUT_EXECUTOR = ThreadPoolExecutor(
+                max_workers=BACKEND_FANOUT_WORKERS,
+                thread_name_prefix="backend_fanout",
+            )
+            _FANOUT_EXECUTOR_PID = os.getpid()
+
+        return _FANOUT_EXECUTOR
+
+
+def get_response_cache() -> diskcache.Cache:
+    """Get this process's handle on the shared response cache."""
+    global _RESPONSE_CACHE, _RESPONSE_CACHE_PID
+
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is None or _RESPONSE_CACHE_PID != os.getpid():
+            _RESPONSE_CACHE = diskcache.Cache(
+                BACKEND_CACHE_DIR, tag_index=True
+            )
+            _RESPONSE_CACHE_PID = os.getpid()
+
+        return _RESPONSE_CACHE
+
+
+def _user_cache_tag(username: str) -> str:
+    return f"user:{username}"
+
+
+def _new_traceparent() -> tuple[str, str]:
+    """Start a trace as a W3C traceparent header, returns (trace_id, header)."""
+    trace_id = secrets.token_hex(16)
+    return trace_id, f"00-{trace_id}-{secrets.token_hex(8)}-01"
+
+
 class BackendApiClient:
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: float = BACKEND_READ_TIMEOUT):
         self.backend_base_url = BACKEND_URL
         self.timeout = timeout
 
     def _get_session(self):
-        return requests.Session()
+        return get_shared_session()
+
+    def _get_timeout(self, endpoint: str) -> tuple[float, float]:
+        read_timeout = (
+            BACKEND_LLM_READ_TIMEOUT
+            if endpoint in LLM_ENDPOINTS
+            else self.timeout
+        )
+        return (BACKEND_CONNECT_TIMEOUT, read_timeout)
+
+    @staticmethod
+    def get_latency_metrics() -> Dict[str, dict]:
+        """Get per-endpoint latency stats of this process."""
+        return LATENCY_METRICS.snapshot()
+
+    @staticmethod
+    def _auth_headers(token: str | None) -> Dict[str, str]:
+        """Bearer header letting the backend resolve the user from a JWT."""
+        return {"Authorization": f"Bearer {token}"} if token else {}
 
     def _make_request(
-        self, method: str, endpoint: str, **kwargs
+        self,
+        method: str,
+        endpoint: str,
+        metrics_key: str | None = None,
+        **kwargs,
     ) -> Dict[str, Any]:
-        """Make HTTP request to backend API."""
+        """
+        Make HTTP request to backend API.
+
+        metrics_key names the route for timeouts and latency metrics when
+        the endpoint contains path parameters. Each request starts a trace
+        the backend continues, and its trace id is logged for slow or
+        failed requests.
+        """
         url = f"{self.backend_base_url}{endpoint}"
+        metrics_key = metrics_key or endpoint
+        kwargs.setdefault("timeout", self._get_timeout(metrics_key))
 
-        try:
-            with self._get_session() as session:
-                response = session.request(
-                    method=method, url=url, timeout=self.timeout, **kwargs
-                )
+        trace_id, traceparent = _new_traceparent()
+        kwargs["headers"] = {
+            **(kwargs.get("headers") or {}),
+            "traceparent": traceparent,
+        }
+
+        start_time = time.perf_counter()
+        result = self._send_request(method, url, **kwargs)
+        elapsed_seconds = time.perf_counter() - start_time
+
+        LATENCY_METRICS.record(
+            f"{method} {metrics_key}", elapsed_seconds, result["success"]
+        )
 
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "data": response.json(),
-                        "status_code": response.status_code,
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"HTTP {response.status_code}: {response.text}",
-                        "status_code": response.status_code,
-                    }
+        if elapsed_seconds > BACKEND_SLOW_REQUEST_SECONDS:
+            stream_logger.warning(
+                f"Slow backend request {method} {metrics_key}: {elapsed_seconds:.2f}s (trace {trace_id})"
+            )
+
+        if not result["success"]:
+            stream_logger.warning(
+                f"Backend request {method} {metrics_key} failed: {result['error']} (trace {trace_id})"
+            )
+
+        return result
+
+    def _send_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        try:
+            response = self._get_session().request(
+                method=method, url=url, **kwargs
+            )
+
+            if response.status_code == 200:
+                return {
+                    "success": True,
+                    "data": response.json(),
+                    "status_code": response.status_code,
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"HTTP {response.status_code}: {response.text}",
+                    "status_code": response.status_code,
+                }
 
         except ConnectionError:
             return {
@@ -74,7 +261,79 @@ class BackendApiClient:
                 "status_code": 0,
             }
 
-    def upload_file(self, username: str, file_content: str, filename: str):
+    @staticmethod
+    def _cached(
+        cache_key: tuple, tag: str, call: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Serve a successful response from the shared cache, or fetch it."""
+        cache = get_response_cache()
+
+        response = cache.get(cache_key)
+        if response is not None:
+            return response
+
+        response = call()
+
+        if response.get("success"):
+            cache.set(
+                cache_key,
+                response,
+                expire=BACKEND_CACHE_TTL_SECONDS,
+                tag=tag,
+            )
+
+        return response
+
+    @staticmethod
+    def invalidate_user_cache(username: str) -> None:
+        """Drop cached CV and analysis job lists of a user."""
+        get_response_cache().evict(_user_cache_tag(username))
+
+    @staticmethod
+    def invalidate_catalog_cache() -> None:
+        """Drop cached company names and job titles."""
+        get_response_cache().evict(CATALOG_CACHE_TAG)
+
+    @staticmethod
+    def _call_safely(call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            return call()
+
+        except Exception as e:
+            file_logger.error(f"Concurrent backend call failed: {str(e)}")
+            stream_logger.error(f"Concurrent backend call failed: {str(e)}")
+            return {
+                "success": False,
+                "error": f"Request failed: {str(e)}",
+                "status_code": 0,
+            }
+
+    def gather(
+        self, *calls: Callable[[], Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run independent client calls concurrently.
+
+        Each call is a zero-argument callable, e.g.
+        `lambda: client.get_job_titles()`. Responses are returned in call
+        order, so total latency is that of the slowest call. Do not call
+        gather from inside a gathered call.
+        """
+        if len(calls) <= 1:
+            return [self._call_safely(call) for call in calls]
+
+        executor = get_fanout_executor()
+        futures = [executor.submit(self._call_safely, call) for call in calls]
+
+        return [future.result() for future in futures]
+
+    def upload_file(
+        self,
+        username: str,
+        file_content: str,
+        filename: str,
+        token: str | None = None,
+    ):
         try:
             # Parse the base64 content
             if "," in file_content:
@@ -84,6 +343,27 @@ class BackendApiClient:
 
             file_bytes = base64.b64decode(base64_content)
 
+            # Skip sending the bytes if the backend already has this content
+            file_hash = hashlib.sha256(file_bytes).hexdigest()
+            hash_check_response = self.check_file_hash(
+                file_hash, username, token=token
+            )
+
+            hash_check_data = (
+                hash_check_response.get("data", {})
+                if hash_check_response.get("success")
+                else {}
+            )
+
+            if hash_check_data.get("exists"):
+                by_hash_response = self.upload_file_by_hash(
+                    username, file_hash, token=token
+                )
+
+                if by_hash_response.get("success"):
+                    self.invalidate_user_cache(username)
+                    return by_hash_response
+
             # Prepare multipart data
             files = {
                 "file": (
@@ -94,25 +374,18 @@ class BackendApiClient:
             }
             params = {"username": username}
 
-            url = f"{self.backend_base_url}/upload_file/"
+            response = self._make_request(
+                "POST",
+                "/upload_file/",
+                files=files,
+                params=params,
+                headers=self._auth_headers(token),
+            )
 
-            with self._get_session() as session:
-                response = session.post(
-                    url=url, files=files, params=params, timeout=self.timeout
-                )
+            if response.get("success"):
+                self.invalidate_user_cache(username)
 
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "data": response.json(),
-                        "status_code": response.status_code,
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"HTTP {response.status_code}: {response.text}",
-                        "status_code": response.status_code,
-                    }
+            return response
 
         except Exception as e:
             file_logger.error(f"Upload failed: {str(e)}")
@@ -123,24 +396,62 @@ class BackendApiClient:
                 "status_code": 0,
             }
 
-    def extract_jd_urls(self, jd_urls: list):
+    def check_file_hash(
+        self, file_hash: str, username: str, token: str | None = None
+    ):
         return self._make_request(
+            "GET",
+            f"/upload_file/check_file_hash/{file_hash}",
+            metrics_key="/upload_file/check_file_hash/{file_hash}",
+            params={"username": username},
+            headers=self._auth_headers(token),
+        )
+
+    def upload_file_by_hash(
+        self,
+        username: str,
+        file_hash: str,
+        token: str | None = None,
+    ):
+        return self._make_request(
+            "POST",
+            "/upload_file/by_hash",
+            params={"username": username, "file_hash": file_hash},
+            headers=self._auth_headers(token),
+        )
+
+    def extract_jd_urls(self, jd_urls: list):
+        response = self._make_request(
             "POST", "/analyze/extract_jd_urls", json=jd_urls
         )
 
+        if response.get("success"):
+            self.invalidate_catalog_cache()
+
+        return response
+
     def extract_company_urls(self, company_urls: list):
-        return self._make_request(
+        response = self._make_request(
             "POST", "/analyze/extract_company_urls", json=company_urls
         )
 
+        if response.get("success"):
+            self.invalidate_catalog_cache()
+
+        return response
+
     def analyze_cv(
         self,
         username: str,
         cv_object_key: str,
         company_name: str,
         job_title: str,
+        token: str | None = None,
+        force_refresh: bool = False,
     ):
-        return self._make_request(
+        # The backend reuses stored step outputs of an identical analysis,
+        # force_refresh runs every step again
+        response = self._make_request(
             "POST",
             "/analyze/analyze_cv",
             params={
@@ -148,14 +459,58 @@ class BackendApiClient:
                 "cv_object_key": cv_object_key,
                 "company_name": company_name,
                 "job_title": job_title,
+                "force_refresh": force_refresh,
             },
+            headers=self._auth_headers(token),
         )
 
-    def get_cv_analysis_jobs(self, username: str):
+        if response.get("success"):
+            self.invalidate_user_cache(username)
+
+        return response
+
+    def get_cv_analysis_jobs(self, username: str, token: str | None = None):
         return self._make_request(
             "GET",
             f"/analyze/get_cv_analysis_jobs",
             params={"username": username},
+            headers=self._auth_headers(token),
+        )
+
+    def list_cv_analysis_jobs(
+        self,
+        username: str,
+        token: str | None = None,
+        fields: list | None = None,
+        before_id: int | None = None,
+        limit: int = BACKEND_PAGE_SIZE,
+    ):
+        """
+        Get one page of a user's analysis jobs, newest first.
+
+        The response data holds the page's items and the next_before_id
+        cursor of the following page, None on the last page.
+        """
+        return self._cached(
+            (
+                "list_cv_analysis_jobs",
+                username,
+                tuple(fields or ()),
+                before_id,
+                limit,
+            ),
+            _user_cache_tag(username),
+            lambda: self._make_request(
+                "GET",
+                "/analyze/cv_analysis_jobs",
+                params={
+                    "username": username,
+                    "fields": fields,
+                    "limit": limit,
+                    "before_id": before_id,
+                },
+                headers=self._auth_headers(token),
+            ),
         )
 
     def get_cv_analysis_job_by_id(self, job_id: int):
@@ -165,11 +520,14 @@ class BackendApiClient:
             params={"job_id": job_id},
         )
 
-    def interview_prep(self, company_name: str, job_title: str):
+    def interview_prep(
+        self, company_name: str, job_title: str, token: str | None = None
+    ):
         return self._make_request(
             "POST",
             "/interview_prep",
             params={"company_name": company_name, "job_title": job_title},
+            headers=self._auth_headers(token),
         )
 
     def get_users(self):
@@ -186,36 +544,151 @@ class BackendApiClient:
             },
         )
 
+    def authenticate_user(self, login: str, password: str):
+        return self._make_request(
+            "POST",
+            "/users/authenticate",
+            json={"login": login, "password": password},
+        )
+
+    def get_current_user(self, token: str):
+        return self._make_request(
+            "GET", "/users/me", headers=self._auth_headers(token)
+        )
+
     def get_user_by_username(self, username: str):
-        return self._make_request("GET", f"/users/get_user/{username}")
+        return self._make_request(
+            "GET",
+            f"/users/get_user/{username}",
+            metrics_key="/users/get_user/{username}",
+        )
 
     def get_user_by_email(self, email: str):
-        return self._make_request("GET", f"/users/get_user/{email}")
+        return self._make_request(
+            "GET",
+            f"/users/get_user/{email}",
+            metrics_key="/users/get_user/{email}",
+        )
 
     def get_cv_data_by_username(self, username: str):
         return self._make_request(
-            "GET", f"/cv_data/get_cv_data_by_username/{username}"
+            "GET",
+            f"/cv_data/get_cv_data_by_username/{username}",
+            metrics_key="/cv_data/get_cv_data_by_username/{username}",
         )
 
-    def get_cv_data_by_file_hash(self, file_hash: str):
-        return self._make_request(
-            "GET", f"/cv_data/get_cv_data_by_file_hash/{file_hash}"
+    def list_cvs(
+        self,
+        username: str,
+        token: str | None = None,
+        fields: list | None = None,
+        before_id: int | None = None,
+        limit: int = BACKEND_PAGE_SIZE,
+    ):
+        """Get one page of a user's CVs, like list_cv_analysis_jobs."""
+        return self._cached(
+            ("list_cvs", username, tuple(fields or ()), before_id, limit),
+            _user_cache_tag(username),
+            lambda: self._make_request(
+                "GET",
+                "/cv_data/cvs",
+                params={
+                    "username": username,
+                    "fields": fields,
+                    "limit": limit,
+                    "before_id": before_id,
+                },
+                headers=self._auth_headers(token),
+            ),
         )
 
-    def get_company_names(self, company_name: str | None = None):
+    def get_cv_data_by_file_hash(
+        self, file_hash: str, token: str | None = None
+    ):
         return self._make_request(
             "GET",
-            f"/embeddings_data/get_company_names",
-            json={"company_name": company_name},
+            f"/cv_data/get_cv_data_by_file_hash/{file_hash}",
+            headers=self._auth_headers(token),
+            metrics_key="/cv_data/get_cv_data_by_file_hash/{file_hash}",
+        )
+
+    def get_company_names(self, company_name: str | None = None):
+        return self._cached(
+            ("get_company_names", company_name),
+            CATALOG_CACHE_TAG,
+            lambda: self._make_request(
+                "GET",
+                f"/embeddings_data/get_company_names",
+                json={"company_name": company_name},
+            ),
         )
 
     def get_job_titles(self, company_name: str | None = None):
-        return self._make_request(
+        return self._cached(
+            ("get_job_titles", company_name),
+            CATALOG_CACHE_TAG,
+            lambda: self._make_request(
+                "GET",
+                f"/embeddings_data/get_job_titles",
+                json={"company_name": company_name},
+            ),
+        )
+
+    def get_dashboard_summary(self, username: str, token: str | None = None):
+        """
+        Get a user's dashboard counts and recent items.
+
+        The user's part and the catalog counts are cached apart, under the
+        user's tag and the catalog tag, so each is dropped by its own
+        invalidation. The backend does not cache summaries.
+        """
+        cache = get_response_cache()
+        user_summary_key = ("get_dashboard_summary", username)
+        catalog_summary_key = ("get_dashboard_catalog_summary",)
+
+        user_summary = cache.get(user_summary_key)
+        catalog_summary = cache.get(catalog_summary_key)
+
+        if user_summary is not None and catalog_summary is not None:
+            return {
+                "success": True,
+                "data": {**user_summary, **catalog_summary},
+                "status_code": 200,
+            }
+
+        response = self._make_request(
             "GET",
-            f"/embeddings_data/get_job_titles",
-            json={"company_name": company_name},
+            "/dashboard/summary",
+            params={"username": username},
+            headers=self._auth_headers(token),
         )
 
+        if response.get("success"):
+            summary = response["data"]
+
+            cache.set(
+                user_summary_key,
+                {
+                    key: value
+                    for key, value in summary.items()
+                    if key not in CATALOG_SUMMARY_KEYS
+                },
+                expire=BACKEND_CACHE_TTL_SECONDS,
+                tag=_user_cache_tag(username),
+            )
+            cache.set(
+                catalog_summary_key,
+                {
+                    key: summary[key]
+                    for key in CATALOG_SUMMARY_KEYS
+                    if key in summary
+                },
+                expire=BACKEND_CACHE_TTL_SECONDS,
+                tag=CATALOG_CACHE_TAG,
+            )
+
+        return response
+
     def health_check(self):
         return self._make_request("GET", "/health")
 
@@ -0,0 +1,17 @@
+"""
+Utility module to run long Dash callbacks in background processes.
+"""
+
+import diskcache
+from config import (
+    BACKGROUND_CALLBACK_CACHE_DIR,
+    BACKGROUND_CALLBACK_EXPIRE_SECONDS,
+)
+from dash import DiskcacheManager
+
+# Long callbacks run in job processes and the browser polls for their
+# result, so gunicorn workers are not held for the whole LLM pipeline
+BACKGROUND_CALLBACK_MANAGER = DiskcacheManager(
+    diskcache.Cache(BACKGROUND_CALLBACK_CACHE_DIR),
+    expire=BACKGROUND_CALLBACK_EXPIRE_SECONDS,
+)
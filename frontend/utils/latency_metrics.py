@@ -0,0 +1,70 @@
+"""
+Utility module to record per-endpoint latency of backend API calls.
+"""
+
+import threading
+from collections import deque
+from typing import Dict
+
+
+class LatencyMetrics:
+    """
+    Thread-safe per-endpoint latency recorder.
+
+    Keeps running counts and totals plus a bounded window of recent samples
+    for percentiles. Metrics are per process, so each gunicorn worker
+    reports its own.
+    """
+
+    def __init__(self, window_size: int = 500):
+        self.window_size = window_size
+        self._metrics: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, elapsed_seconds: float, success: bool) -> None:
+        with self._lock:
+            metric = self._metrics.setdefault(
+                key,
+                {
+                    "count": 0,
+                    "errors": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "samples": deque(maxlen=self.window_size),
+                },
+            )
+
+            metric["count"] += 1
+            metric["errors"] += 0 if success else 1
+            metric["total_seconds"] += elapsed_seconds
+            metric["max_seconds"] = max(metric["max_seconds"], elapsed_seconds)
+            metric["samples"].append(elapsed_seconds)
+
+    @staticmethod
+    def _percentile(sorted_samples: list[float], percentile: float) -> float:
+        index = round(percentile / 100 * (len(sorted_samples) - 1))
+        return sorted_samples[index]
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Get count, error count and latency stats in ms per endpoint."""
+        with self._lock:
+            metrics = {
+                key: {**metric, "samples": sorted(metric["samples"])}
+                for key, metric in self._metrics.items()
+            }
+
+        return {
+            key: {
+                "count": metric["count"],
+                "errors": metric["errors"],
+                "mean_ms": metric["total_seconds"] / metric["count"] * 1000,
+                "p50_ms": self._percentile(metric["samples"], 50) * 1000,
+                "p95_ms": self._percentile(metric["samples"], 95) * 1000,
+                "max_ms": metric["max_seconds"] * 1000,
+            }
+            for key, metric in metrics.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()